@@ -11,14 +11,25 @@ try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
     from collections import Iterable  # python >= 3.8
+from collections import Counter
 from string import ascii_lowercase
+from array import array
+from itertools import compress
+from heapq import nsmallest, nlargest
+from bisect import bisect_right
 import math
+import ast
 
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
 
+try:
+    import numpy
+except ImportError:  # numpy is not installed (eg. IronPython)
+    numpy = None
+
 
 class BaseCollection(object):
     """Base class for all Data Collections.
@@ -30,10 +41,13 @@ class BaseCollection(object):
             the list of values.
     """
 
-    __slots__ = ('_header', '_values', '_datetimes', '_validated_a_period')
+    __slots__ = ('_header', '_values', '_datetimes', '_validated_a_period',
+                 '_values_shared')
     _collection_type = None
     _mutable = True
     _enumeration = None
+    BACKENDS = ('list', 'array', 'numpy')
+    _default_backend = 'list'
 
     def __init__(self, header, values, datetimes):
         """Initialize base collection.
@@ -87,12 +101,67 @@ class BaseCollection(object):
     @property
     def values(self):
         """Get a tuple of numerical values for this collection."""
+        if self._is_vectorized:
+            return tuple(self._values.tolist())
         return tuple(self._values)
 
+    @property
+    def values_view(self):
+        """Get a read-only memoryview over the values of this collection.
+
+        For collections using the array or numpy backend, the view reads directly
+        from the stored float64 values without copying them. For collections using
+        the list backend, the view reads from a packed copy of the values.
+        Values that a mutable collection shares with its duplicates are copied
+        first such that the view follows later changes to this collection.
+        Note that the view is only read-only in Python 3.8 and above and it is a
+        tuple of values in Python 2, which has no memoryview casting.
+        """
+        if not hasattr(memoryview, 'cast'):  # python 2
+            return self.values
+        if self._mutable:
+            self._own_values()
+        values = self._values if isinstance(self._values, array) or \
+            self._is_vectorized else array('d', self._values)
+        view = memoryview(values)
+        try:
+            return view.toreadonly()
+        except AttributeError:  # python < 3.8
+            return view
+
     @values.setter
     def values(self, values):
         self._check_values(values)
-        self._values = list(values)
+        self._values = self._backend_values(values)
+        self._values_shared = False
+
+    @property
+    def backend(self):
+        """Get or set text for the type of object that stores the collection values.
+
+        Choose from the following options.
+
+        * list - A Python list (or a tuple for immutable collections).
+        * array - A compact array.array of float64 values, which uses a fraction
+            of the memory of a list and can be viewed without copying through
+            the values_view property.
+        * numpy - A contiguous float64 NumPy array, with which arithmetic,
+            statistics and unit conversions are vectorized.
+
+        Collections that are created from an array.array or a NumPy array use
+        the array or numpy backend respectively and all other collections use
+        the default backend, which can be set with the set_default_backend method.
+        When NumPy is not installed (eg. in IronPython), the numpy backend will
+        store values in a list. Values that are not numbers are always stored
+        in a list.
+        """
+        if self._is_vectorized:
+            return 'numpy'
+        return 'array' if isinstance(self._values, array) else 'list'
+
+    @backend.setter
+    def backend(self, backend):
+        self._values = self._backend_values(self._values, backend)
 
     @property
     def validated_a_period(self):
@@ -105,21 +174,27 @@ class BaseCollection(object):
     @property
     def bounds(self):
         """Get a tuple of two value as (min, max) of the data."""
-        return (min(self._values), max(self._values))
+        return (self.min, self.max)
 
     @property
     def min(self):
         """Get the min of the Data Collection values."""
+        if self._is_vectorized:
+            return self._values.min().item()
         return min(self._values)
 
     @property
     def max(self):
         """Get the max of the Data Collection values."""
+        if self._is_vectorized:
+            return self._values.max().item()
         return max(self._values)
 
     @property
     def average(self):
         """Get the average of the Data Collection values."""
+        if self._is_vectorized:
+            return self._values.mean().item()
         return sum(self._values) / len(self._values)
 
     @property
@@ -130,6 +205,8 @@ class BaseCollection(object):
     @property
     def total(self):
         """Get the total of the Data Collection values."""
+        if self._is_vectorized:
+            return self._values.sum().item()
         return sum(self._values)
 
     def convert_to_unit(self, unit):
@@ -139,8 +216,8 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_unit to
         get a new instance of a collection without mutating this one.
         """
-        self._values = self._header.data_type.to_unit(
-            self._values, unit, self._header.unit)
+        values = self._header.data_type.to_unit(self._values, unit, self._header.unit)
+        self._values = self._backend_values(values, self.backend)
         self._header._unit = unit
 
     def convert_to_ip(self):
@@ -150,8 +227,9 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_ip to
         get a new instance of a collection without mutating this one.
         """
-        self._values, self._header._unit = self._header.data_type.to_ip(
+        values, self._header._unit = self._header.data_type.to_ip(
             self._values, self._header.unit)
+        self._values = self._backend_values(values, self.backend)
 
     def convert_to_si(self):
         """Convert the Data Collection to SI units.
@@ -160,8 +238,9 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_si to
         get a new instance of a collection without mutating this one.
         """
-        self._values, self._header._unit = self._header.data_type.to_si(
+        values, self._header._unit = self._header.data_type.to_si(
             self._values, self._header.unit)
+        self._values = self._backend_values(values, self.backend)
 
     def to_unit(self, unit):
         """Get a Data Collection in the input unit.
@@ -209,9 +288,7 @@ class BaseCollection(object):
         if self._enumeration is None:
             self._get_mutable_enumeration()
         col_obj = self._enumeration['immutable'][self._collection_type]
-        new_obj = col_obj(self.header, self.values, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(col_obj, self.header.duplicate())
 
     def normalize_by_area(self, area, area_unit):
         """Get a Data Collection that is normalized by an area value.
@@ -235,7 +312,7 @@ class BaseCollection(object):
 
         # create the new data collection and assign normalized values
         new_data_c = self.duplicate()
-        new_data_c._values = [val / area for val in self.values]
+        new_data_c._values = self._div_values(area)
 
         # normalize the data type and unit in the header
         new_data_c._header._unit = '{}/{}'.format(head.unit, area_unit)
@@ -257,9 +334,12 @@ class BaseCollection(object):
 
         Args:
             count: Integer representing the number of highest values to account for.
+                This can also be a list of integers to get the highest values for
+                several counts at once.
 
         Returns:
-            A tuple with two elements.
+            A tuple with two elements (or a list of such tuples with one for each
+            count when a list of counts is input).
 
             -   highest_values:
                 The n highest values in data list, ordered from
@@ -269,17 +349,7 @@ class BaseCollection(object):
                 Indices of the n highest values in data
                 list, ordered from highest to lowest.
         """
-        count = int(count)
-        assert count <= len(self._values), \
-            'count must be smaller than or equal to values length. {} > {}.'.format(
-                count, len(self._values))
-        assert count > 0, \
-            'count must be greater than 0. Got {}.'.format(count)
-        highest_values = sorted(self._values, reverse=True)[0:count]
-        highest_values_index = sorted(list(xrange(len(self._values))),
-                                      key=lambda k: self._values[k],
-                                      reverse=True)[0:count]
-        return highest_values, highest_values_index
+        return self._extreme_values(count, True)
 
     def lowest_values(self, count):
         """Get a list of the the x lowest values of the Data Collection and their indices.
@@ -289,9 +359,12 @@ class BaseCollection(object):
 
         Args:
             count: Integer representing the number of lowest values to account for.
+                This can also be a list of integers to get the lowest values for
+                several counts at once.
 
         Returns:
-            A tuple with two elements.
+            A tuple with two elements (or a list of such tuples with one for each
+            count when a list of counts is input).
 
             -   highest_values:
                 The n lowest values in data list, ordered from
@@ -300,16 +373,7 @@ class BaseCollection(object):
                 Indices of the n lowest values in data
                 list, ordered from lowest to lowest.
         """
-        count = int(count)
-        assert count <= len(self._values), \
-            'count must be <= to Data Collection len. {} > {}.'.format(
-                count, len(self._values))
-        assert count > 0, \
-            'count must be greater than 0. Got {}.'.format(count)
-        lowest_values = sorted(self._values)[0:count]
-        lowest_values_index = sorted(list(xrange(len(self._values))),
-                                     key=lambda k: self._values[k])[0:count]
-        return lowest_values, lowest_values_index
+        return self._extreme_values(count, False)
 
     def percentile(self, percentile):
         """Get a value representing a the input percentile of the Data Collection.
@@ -323,7 +387,25 @@ class BaseCollection(object):
         """
         assert 0 <= percentile <= 100, \
             'percentile must be between 0 and 100. Got {}'.format(percentile)
-        return self._percentile(self._values, percentile)
+        return self._percentiles(self._values, (percentile,))[0]
+
+    def percentiles(self, percentiles):
+        """Get values representing several percentiles of the Data Collection at once.
+
+        The values are only sorted (or selected) once for all of the percentiles,
+        which is much faster than calling the percentile method for each of them.
+
+        Args:
+            percentiles: A list of float values from 0 to 100 representing the
+                requested percentiles.
+
+        Returns:
+            A list of the Data Collection values at each of the input percentiles.
+        """
+        for percentile in percentiles:
+            assert 0 <= percentile <= 100, \
+                'percentile must be between 0 and 100. Got {}'.format(percentile)
+        return self._percentiles(self._values, percentiles)
 
     def filter_by_conditional_statement(self, statement):
         """Filter the Data Collection based on a conditional statement.
@@ -416,7 +498,7 @@ class BaseCollection(object):
 
         # get the correct base class for the aligned collection (mutable or immutable)
         if mutable is None:
-            collection = self.__class__(header, values, self.datetimes)
+            collection = self._new_collection(self.__class__, header, values)
         else:
             if self._enumeration is None:
                 self._get_mutable_enumeration()
@@ -424,27 +506,65 @@ class BaseCollection(object):
                 col_obj = self._enumeration['immutable'][self._collection_type]
             else:
                 col_obj = self._enumeration['mutable'][self._collection_type]
-            collection = col_obj(header, values, self.datetimes)
+            collection = self._new_collection(col_obj, header, values)
         collection._validated_a_period = self._validated_a_period
         return collection
 
     def duplicate(self):
-        """Get a copy of this Data Collection."""
-        collection = self.__class__(
-            self.header.duplicate(), list(self._values), self.datetimes)
-        collection._validated_a_period = self._validated_a_period
-        return collection
+        """Get a copy of this Data Collection.
+
+        The copy shares the values of this collection until either of the two
+        collections sets one of its values, at which point that collection gets
+        its own copy of the values.
+        """
+        return self._shared_collection(self.__class__, self.header.duplicate())
+
+    def lazy(self):
+        """Get a lazy expression of this Data Collection for fused arithmetic.
+
+        Arithmetic operators on the returned CollectionExpression build an
+        expression tree instead of new collections. The whole expression is then
+        computed in a single pass over the values (or with NumPy when any of the
+        collections uses the numpy backend) once it is evaluated. This avoids the
+        intermediate collections of expressions like the following.
+
+        .. code-block:: python
+
+            expr = (a.lazy() * 0.6 + b.lazy() * 0.4 - c) / d
+            result = expr.evaluate()  # a collection like a with the result values
+        """
+        return CollectionExpression(self)
 
     def to_dict(self):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._values_list(),
             'datetimes': self.datetimes,
             'validated_a_period': self._validated_a_period,
             'type': self.__class__.__name__
         }
 
+    @staticmethod
+    def set_default_backend(backend):
+        """Set the type of object that stores the values of new data collections.
+
+        Args:
+            backend: Text for the backend used by data collections that are not
+                created from an array.array or a NumPy array. Choose from: list,
+                array, numpy. When NumPy is not installed (eg. in IronPython), the
+                numpy backend will store values in a list. (Default: list).
+        """
+        assert backend in BaseCollection.BACKENDS, 'Data collection backend "{}" ' \
+            'is not recognized. Choose from: {}'.format(backend, BaseCollection.BACKENDS)
+        BaseCollection._default_backend = backend
+
+    @staticmethod
+    def get_default_backend():
+        """Get text for the type of object that stores the values of new collections.
+        """
+        return BaseCollection._default_backend
+
     @staticmethod
     def filter_collections_by_statement(data_collections, statement):
         """Generate a filtered data collections according to a conditional statement.
@@ -484,24 +604,9 @@ class BaseCollection(object):
             and False does not.
         """
         BaseCollection.are_collections_aligned(data_collections)
-        correct_var = BaseCollection._check_conditional_statement(
-            statement, len(data_collections))
-
-        # replace the operators of the statement with non-alphanumeric characters
-        # necessary to avoid replacing the characters of the operators
-        num_statement_clean = BaseCollection._replace_operators(statement)
-
-        pattern = []
-        for i in xrange(len(data_collections[0])):
-            num_statement = num_statement_clean
-            # replace the variable names with their numerical values
-            for j, coll in enumerate(data_collections):
-                var = correct_var[j]
-                num_statement = num_statement.replace(var, str(coll[i]))
-            # put back the operators
-            num_statement = BaseCollection._restore_operators(num_statement)
-            pattern.append(eval(num_statement, {}))
-        return pattern
+        pattern = BaseCollection._evaluate_statement(
+            data_collections, statement.lower())
+        return pattern if isinstance(pattern, list) else pattern.tolist()
 
     @staticmethod
     def are_collections_aligned(data_collections, raise_exception=True):
@@ -529,6 +634,115 @@ class BaseCollection(object):
                     return False
         return True
 
+    @staticmethod
+    def highest_values_collections(data_collections, count):
+        """Get the x highest values and their indices for several Data Collections.
+
+        Args:
+            data_collections: A list of Data Collections.
+            count: Integer representing the number of highest values to account for.
+                This can also be a list of integers to get the highest values for
+                several counts at once.
+
+        Returns:
+            A list with the result of highest_values for each Data Collection.
+        """
+        return [coll._extreme_values(count, True) for coll in data_collections]
+
+    @staticmethod
+    def lowest_values_collections(data_collections, count):
+        """Get the x lowest values and their indices for several Data Collections.
+
+        Args:
+            data_collections: A list of Data Collections.
+            count: Integer representing the number of lowest values to account for.
+                This can also be a list of integers to get the lowest values for
+                several counts at once.
+
+        Returns:
+            A list with the result of lowest_values for each Data Collection.
+        """
+        return [coll._extreme_values(count, False) for coll in data_collections]
+
+    @staticmethod
+    def ensemble(data_collections, stats=('average',)):
+        """Get collections for several statistics across aligned Data Collections.
+
+        The statistics are computed for each datetime across the values of all of
+        the data_collections (eg. the average of several years of data or of
+        several sensors at each hour). The alignment of the collections is checked
+        only once and their values are transposed only once no matter how many
+        statistics are requested. When the first collection uses the numpy
+        backend, the statistics are computed with vectorized NumPy operations.
+
+        Args:
+            data_collections: A list of aligned Data Collections.
+            stats: A list of text for the statistics to be computed. Choose from:
+                average, total, min, max, median or a percentile written as the
+                letter p followed by a number between 0 and 100 (eg. p10, p97.5).
+                (Default: ('average',)).
+
+        Returns:
+            A list of Data Collections aligned with the input data_collections
+            with one collection for each of the input stats in the same order.
+
+        Usage:
+
+        .. code-block:: python
+
+            low, mid, high = BaseCollection.ensemble(
+                collections, ['p10', 'median', 'p90'])
+        """
+        assert len(data_collections) > 0, \
+            'At least one Data Collection is needed to compute an ensemble.'
+        BaseCollection.are_collections_aligned(data_collections)
+        first_coll = data_collections[0]
+        is_sorted = any(st not in ('average', 'total', 'min', 'max') for st in stats)
+        functs, operations = [], []
+        for stat in stats:
+            funct, operation = first_coll._stat_function(stat, is_sorted)
+            functs.append(funct)
+            operations.append(operation)
+
+        if first_coll._is_vectorized:
+            matrix = numpy.array([coll._values for coll in data_collections],
+                                 dtype=numpy.float64)
+            percents = [50 if stat == 'median' else float(stat[1:])
+                        for stat in stats if stat not in
+                        ('average', 'total', 'min', 'max')]
+            if percents:
+                percentiles = iter(numpy.percentile(matrix, percents, axis=0))
+            new_data = []
+            for stat in stats:
+                if stat == 'average':
+                    new_data.append(matrix.mean(axis=0))
+                elif stat == 'total':
+                    new_data.append(matrix.sum(axis=0))
+                elif stat == 'min':
+                    new_data.append(matrix.min(axis=0))
+                elif stat == 'max':
+                    new_data.append(matrix.max(axis=0))
+                else:
+                    new_data.append(next(percentiles))
+        else:
+            rows = list(zip(*[coll._values_list() for coll in data_collections]))
+            sorted_rows = [sorted(row) for row in rows] if is_sorted else rows
+            # sums use the values in the order of the collections
+            new_data = [[funct(row) for row in rows]
+                        if stat in ('average', 'total') else
+                        [funct(row) for row in sorted_rows]
+                        for stat, funct in zip(stats, functs)]
+
+        collections = []
+        for operation, values in zip(operations, new_data):
+            new_header = first_coll.header.duplicate()
+            new_header.metadata['operation'] = operation
+            collection = first_coll._new_collection(
+                first_coll.__class__, new_header, values)
+            collection._validated_a_period = first_coll._validated_a_period
+            collections.append(collection)
+        return collections
+
     @staticmethod
     def compute_function_aligned(funct, data_collections, data_type, unit):
         """Compute a function with a list of aligned data collections or individual values.
@@ -603,7 +817,7 @@ class BaseCollection(object):
         # create the new data collection and assign normalized values
         new_data_c = self.to_unit(head.data_type.units[0])
         factor = head.data_type.time_aggregated_factor / timestep
-        new_data_c._values = [val * factor for val in new_data_c._values]
+        new_data_c._values = new_data_c._mul_values(factor)
         new_data_c._header._data_type = time_class()
         new_data_c._header._unit = new_data_c._header._data_type.units[0]
         return new_data_c
@@ -637,7 +851,7 @@ class BaseCollection(object):
         # create the new data collection and assign normalized values
         new_data_c = self.to_unit(head.data_type.units[0])
         factor = typ_clss._time_aggregated_factor / timestep
-        new_data_c._values = [val / factor for val in new_data_c._values]
+        new_data_c._values = new_data_c._div_values(factor)
         new_data_c._header._data_type = time_class()
         new_data_c._header._unit = new_data_c._header._data_type.units[0]
         return new_data_c
@@ -681,16 +895,43 @@ class BaseCollection(object):
             .replace("not", "").replace("in", "").replace("is", "")
 
     @staticmethod
-    def _replace_operators(statement):
-        """Replace logical operators of a statement with non-alphanumeric characters."""
-        return statement.lower().replace("and", "&&").replace("or", "||") \
-            .replace("not", "~").replace("in", "<<").replace("is", "$")
+    def _evaluate_statement(data_collections, statement):
+        """Evaluate a conditional statement over the values of aligned collections.
 
-    @staticmethod
-    def _restore_operators(statement):
-        """Restore python logical operators from previously replaced ones."""
-        return statement.replace("&&", "and").replace("||", "or") \
-            .replace("~", "not").replace("<<", "in").replace("$", "is")
+        The statement is checked and compiled once. It is then evaluated over
+        whole NumPy arrays when all collections use the numpy backend or in a
+        single pass over the values otherwise.
+
+        Args:
+            data_collections: A list of aligned Data Collections to be evaluated
+                against the statement.
+            statement: A conditional statement as a string (e.g. a>25 and b<60).
+
+        Returns:
+            A list with the result of the statement for each value (or a NumPy
+            array of booleans if the statement was evaluated over arrays).
+        """
+        correct_var = BaseCollection._check_conditional_statement(
+            statement, len(data_collections))
+        if numpy is not None and \
+                all(coll._is_vectorized for coll in data_collections):
+            try:
+                tree = _VectorizedStatement().visit(
+                    ast.parse(statement.strip(), mode='eval'))
+                code = compile(ast.fix_missing_locations(tree), '<statement>', 'eval')
+                namespace = {'numpy': numpy}
+                for var, coll in zip(correct_var, data_collections):
+                    namespace[var] = coll._values
+                with numpy.errstate(divide='raise', invalid='raise'):
+                    mask = numpy.asarray(eval(code, namespace), dtype=bool)
+                if mask.shape == ():  # statement that does not use the values
+                    mask = numpy.full(len(data_collections[0]), mask.item())
+                if mask.shape == (len(data_collections[0]),):
+                    return mask
+            except Exception:  # the statement cannot be evaluated over arrays
+                pass
+        funct = eval('lambda {}: ({})'.format(', '.join(correct_var), statement), {})
+        return list(map(funct, *[coll._values_list() for coll in data_collections]))
 
     @staticmethod
     def linspace(start, stop, num):
@@ -759,7 +1000,7 @@ class BaseCollection(object):
             val += step
 
     @staticmethod
-    def histogram(values, bins, key=None):
+    def histogram(values, bins, key=None, output='values'):
         """Compute the frequency histogram from a list of values.
 
         The data is binned inclusive of the lower bound but exclusive of the upper bound
@@ -768,13 +1009,22 @@ class BaseCollection(object):
 
         Args:
             values: Set of numerical data as a list.
-            bins: A monotonically increasing array of uniform-width bin edges, excluding
+            bins: A monotonically increasing array of bin edges, including
                 the rightmost edge.
             key: Optional parameter to define key to bin values by, as a function. If not
                 provided, the histogram will be binned by the value.
+            output: Text for what is returned for each bin of the histogram.
+                Choose from the following. (Default: values).
+
+                * values - A list of the values in the bin, sorted by key.
+                * indices - A list of the indices of the values in the bin, which
+                    are in the same order as the values.
+                * counts - An integer for the number of values in the bin, which
+                    does not require the values to be sorted.
 
         Returns:
-            A list of lists representing the ordered values binned by frequency.
+            A list of lists representing the ordered values binned by frequency
+            (or a list of integers when the output is counts).
 
         Usage:
 
@@ -792,37 +1042,23 @@ class BaseCollection(object):
                     ['a', 'b', 'c', 'd', 'e', 'f']),
                     (0, 1, 2), key=lambda k: k[0])
             # >> [[(0, 'a'), (0, 'b'), (0.9, 'c')], [(1, 'd'), (1.5, 'e'), (1.99, 'f')]]
-        """
-        if key is None:
-            def key(v):
-                return v
 
-        vals = sorted(values, key=key)
-        min_bound, max_bound = min(bins), max(bins)
-        bin_bound_num = len(bins)
-
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num - 1)]
-        bin_index = 0
-
-        for val in vals:
-            k = key(val)
-            # Ignore values out of range
-            if k < min_bound or k > max_bound:
-                continue
-
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the lower bound
-            # of the bin_index is updated, and the loop is broken
-            for i in range(bin_index, bin_bound_num - 1):
-                if k < bins[i + 1]:
-                    hist[i].append(val)
-                    bin_index = i
-                    break
-        return hist
+            # Counting the values in each bin
+            histogram([0, 0, 0.9, 1, 1.5, 1.99, 2, 3], (0, 1, 2, 3), output='counts')
+            # >> [3, 3, 1]
+        """
+        values, keys = BaseCollection._histogram_keys(values, key)
+        # the bin of each key is found by bisecting the edges
+        if numpy is not None and isinstance(keys, numpy.ndarray):
+            indices = numpy.searchsorted(
+                numpy.asarray(bins, dtype=float), keys, side='right') - 1
+        else:
+            indices = [bisect_right(bins, k) - 1 for k in keys]
+        return BaseCollection._histogram_output(
+            values, keys, indices, len(bins) - 1, output, key)
 
     @staticmethod
-    def histogram_circular(values, bins, hist_range=None, key=None):
+    def histogram_circular(values, bins, hist_range=None, key=None, output='values'):
         """Compute the frequency histogram from a list of circular values.
 
         Circular values refers to a set of values where there is no distinction between
@@ -832,16 +1068,25 @@ class BaseCollection(object):
 
         Args:
             values: Set of numerical data as a list.
-            bins: An array of uniform-width bin edges, excluding the rightmost edge.
+            bins: An array of bin edges, including the rightmost edge.
                 These values do not have to be monotonically increasing.
             hist_range: Optional parameter to define the lower and upper range of the
                 histogram as a tuple of numbers. If not provided the range is
                 ``(min(key(values)), max(key(values))+1)``.
             key: Optional parameter to define key to bin values by, as a function. If not
                 provided, the histogram will be binned by the value.
+            output: Text for what is returned for each bin of the histogram.
+                Choose from the following. (Default: values).
+
+                * values - A list of the values in the bin, sorted by key.
+                * indices - A list of the indices of the values in the bin, which
+                    are in the same order as the values.
+                * counts - An integer for the number of values in the bin, which
+                    does not require the values to be sorted.
 
         Returns:
-            A list of lists representing the ordered values binned by frequency.
+            A list of lists representing the ordered values binned by frequency
+            (or a list of integers when the output is counts).
 
         Usage:
 
@@ -852,69 +1097,227 @@ class BaseCollection(object):
             histogram_circular([358, 359, 0, 1, 2, 3], (358, 0, 3))
             # >> [[358, 359], [0, 1, 2]]
         """
-        if key is None:
-            def key(v):
-                return v
-
-        vals = sorted(values, key=key)
-
+        values, keys = BaseCollection._histogram_keys(values, key)
         if hist_range is None:
-            hist_range = (key(vals[0]), key(vals[-1]) + 1)
+            hist_range = (min(keys), max(keys) + 1)
+        lower, upper = hist_range
+
+        # all bins are constant between the sorted edges and so each value can be
+        # binned by bisecting the edges and looking up the bin of the interval
+        edges = sorted(set(bins).union(hist_range))
+        edge_bins = [BaseCollection._circular_bin(e, bins, hist_range) for e in edges]
+        if numpy is not None and isinstance(keys, numpy.ndarray):
+            intervals = numpy.searchsorted(edges, keys, side='right') - 1
+            indices = numpy.where((keys >= lower) & (keys < upper),
+                                  numpy.asarray(edge_bins)[intervals], -1)
+        else:
+            indices = [edge_bins[bisect_right(edges, k) - 1]
+                       if lower <= k < upper else -1 for k in keys]
+        return BaseCollection._histogram_output(
+            values, keys, indices, len(bins) - 1, output, key)
 
-        bin_bound_num = len(bins) - 1
+    @staticmethod
+    def _circular_bin(k, bins, hist_range):
+        """Get the index of the circular histogram bin of a key (or -1 if it has none).
+        """
+        # Ignore values out of range
+        if k < hist_range[0] or k >= hist_range[1]:
+            return -1
+
+        # This loop will iterate through the bin upper bounds.
+        # If the value is within the bounds, the loop is broken.
+        for i in range(len(bins) - 1):
+            if bins[i] < bins[i + 1]:
+                if k >= bins[i] and k < bins[i + 1]:
+                    return i
+            else:
+                # If the interval starts data from the end of the list,
+                # split the conditional checks into two to check two
+                # intervals.
+                interval1 = (k <= hist_range[1] and k >= bins[i])
+                interval2 = (k < bins[i + 1] and k >= hist_range[0])
+                if interval1 or interval2:
+                    return i
+        return -1
 
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num)]
-        for val in vals:
-            k = key(val)
+    @staticmethod
+    def _histogram_keys(values, key):
+        """Get the values to be binned in a histogram and the keys to bin them by."""
+        if key is not None:
+            values = list(values)
+            return values, [key(v) for v in values]
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return values, values
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        return values, values
 
-            # Ignore values out of range
-            if k < hist_range[0] or k >= hist_range[1]:
-                continue
+    @staticmethod
+    def _histogram_output(values, keys, indices, bin_count, output, key):
+        """Get the histogram for a given output from the bin index of each value.
 
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the loop is broken.
-            # Since values at the end of the list can still be binned
-            # into the earlier histogram bars for circular
-            # data, we don't update the bin_index.
-            for i in range(bin_bound_num):
-                if bins[i] < bins[i + 1]:
-                    if k >= bins[i] and k < bins[i + 1]:
-                        hist[i].append(val)
-                        break
-                else:
-                    # If the interval starts data from the end of the list,
-                    # split the conditional checks into two to check two
-                    # intervals.
-                    interval1 = (k <= hist_range[1] and k >= bins[i])
-                    interval2 = (k < bins[i + 1] and k >= hist_range[0])
-                    if interval1 or interval2:
-                        hist[i].append(val)
-                        break
-
-        return hist
-
-    def _filter_by_statement(self, statement):
+        Args:
+            values: The list of values that were binned.
+            keys: The list of keys by which the values were binned.
+            indices: The index of the bin of each value, which is outside the range
+                of bins for values that are not in the histogram.
+            bin_count: Integer for the number of bins.
+            output: Text for what is returned for each bin.
+            key: The function that gets the keys from the values or None.
+        """
+        assert output in ('values', 'indices', 'counts'), 'Histogram output "{}" ' \
+            'is not recognized. Choose from: values, indices, counts.'.format(output)
+        if numpy is not None and isinstance(indices, numpy.ndarray):
+            in_bins = (indices >= 0) & (indices < bin_count)
+            if output == 'counts':
+                return numpy.bincount(indices[in_bins], minlength=bin_count).tolist()
+            indices = numpy.where(in_bins, indices, -1).tolist()
+            if isinstance(keys, numpy.ndarray):
+                values = keys = keys.tolist()
+        if output == 'counts':
+            counts = Counter(indices)
+            return [counts[i] for i in range(bin_count)]
+
+        hist = [[] for i in range(bin_count)]
+        if output == 'values' and key is None:
+            for val, b in zip(values, indices):
+                if 0 <= b < bin_count:
+                    hist[b].append(val)
+            for vals in hist:
+                vals.sort()
+            return hist
+        for i, b in enumerate(indices):
+            if 0 <= b < bin_count:
+                hist[b].append(i)
+        for inds in hist:  # stable sort keeps values with equal keys in order
+            inds.sort(key=keys.__getitem__)
+        if output == 'indices':
+            return hist
+        return [[values[i] for i in inds] for inds in hist]
+
+    def _filter_by_statement(self, statement, times=None):
         """Filter the data collection based on a conditional statement."""
-        self.__class__._check_conditional_statement(statement, 1)
-        _filt_values, _filt_datetimes = [], []
-        for i, a in enumerate(self._values):
-            if eval(statement, {'a': a}):
-                _filt_values.append(a)
-                _filt_datetimes.append(self.datetimes[i])
-        return _filt_values, _filt_datetimes
+        pattern = self._evaluate_statement([self], statement)
+        return self._filter_by_pattern(pattern, times)
+
+    def _filter_by_pattern(self, pattern, times=None):
+        """Filter the Filter the Data Collection based on a list of booleans.
 
-    def _filter_by_pattern(self, pattern):
-        """Filter the Filter the Data Collection based on a list of booleans."""
+        Args:
+            pattern: A list of booleans.
+            times: An optional list that aligns with the values and should be
+                filtered along with them (eg. minutes of the year). If None,
+                the datetimes of this collection will be used.
+        """
+        times = self.datetimes if times is None else times
         try:
             _len = len(pattern)
         except TypeError:
             raise TypeError("pattern is not a list of Booleans. Got {}".format(
                 type(pattern)))
+        if _len == len(self._values):  # filter in a single pass
+            if self._is_vectorized:
+                mask = numpy.asarray(pattern, dtype=bool)
+                return self._values[mask], list(compress(times, mask.tolist()))
+            _filt_values = list(compress(self._values, pattern))
+            _filt_datetimes = list(compress(times, pattern))
+            return _filt_values, _filt_datetimes
         _filt_values = [d for i, d in enumerate(self._values) if pattern[i % _len]]
-        _filt_datetimes = [d for i, d in enumerate(self.datetimes) if pattern[i % _len]]
+        _filt_datetimes = [d for i, d in enumerate(times) if pattern[i % _len]]
         return _filt_values, _filt_datetimes
 
+    def _new_collection(self, col_obj, header, values):
+        """Get a new collection of a given class with the same datetimes as this one."""
+        return col_obj(header, values, self.datetimes)
+
+    def _shared_collection(self, col_obj, header):
+        """Get a new collection of a given class that shares the values of this one.
+
+        The values are copied by either collection right before it changes one of
+        them (copy-on-write). Values in a list are still copied between mutable
+        and immutable collections since immutable collections store them in a tuple.
+        """
+        values = self._values
+        if col_obj._mutable != self._mutable:
+            if isinstance(values, (list, tuple)):
+                collection = self._new_collection(col_obj, header, values)
+                collection._validated_a_period = self._validated_a_period
+                return collection
+            if self._is_vectorized and not col_obj._mutable:
+                values = values.view()
+                values.flags.writeable = False
+        collection = col_obj.__new__(col_obj)
+        if hasattr(self, '__dict__'):
+            collection.__dict__.update(self.__dict__)
+        collection._header = header
+        collection._values = values
+        collection._datetimes = self._datetimes
+        collection._validated_a_period = self._validated_a_period
+        if self._mutable or col_obj._mutable:
+            self._values_shared = collection._values_shared = True
+        return collection
+
+    def _own_values(self):
+        """Copy the values of this collection if they are shared with another one."""
+        if getattr(self, '_values_shared', False):
+            self._values = self._backend_values(self._values, self.backend)
+            self._values_shared = False
+
+    @property
+    def _is_vectorized(self):
+        """Boolean for whether the values are stored in a NumPy array."""
+        return numpy is not None and isinstance(self._values, numpy.ndarray)
+
+    def _backend_values(self, values, backend=None):
+        """Get a copy of values in the object used to store them for a backend.
+
+        Args:
+            values: An iterable of values.
+            backend: Text for the backend. If None, the backend will be that of
+                the values if they are an array.array or a NumPy array. Otherwise,
+                it will be the backend that the collection already uses or the
+                default backend for new collections.
+        """
+        is_ndarray = numpy is not None and isinstance(values, numpy.ndarray)
+        if backend is None:
+            if is_ndarray:
+                backend = 'numpy'
+            elif isinstance(values, array):
+                backend = 'array'
+            elif hasattr(self, '_values'):
+                backend = self.backend
+            else:
+                backend = BaseCollection._default_backend
+        else:
+            assert backend in self.BACKENDS, 'Data collection backend "{}" is not ' \
+                'recognized. Choose from: {}'.format(backend, self.BACKENDS)
+        if backend != 'list' and (is_ndarray or isinstance(values, array) or
+                                  isinstance(values[0], (float, int))):
+            if backend == 'array':
+                return array('d', values)
+            if numpy is not None:
+                values = numpy.array(values, dtype=float)
+                if not self._mutable:
+                    values.flags.writeable = False
+                return values
+        if is_ndarray or isinstance(values, array):
+            values = values.tolist()
+        return list(values) if self._mutable else tuple(values)
+
+    def _values_list(self):
+        """Get the values in a list (or a tuple for immutable collections).
+
+        This is the stored values for the list backend and a new list otherwise.
+        """
+        if isinstance(self._values, (list, tuple)):
+            return self._values
+        return self._values.tolist()
+
+    def _match_backend(self, values):
+        """Get new values in an array.array if this collection uses the array backend.
+        """
+        return array('d', values) if isinstance(self._values, array) else values
+
     def _check_values(self, values):
         """Check values whenever they come through the values setter."""
         assert isinstance(values, Iterable) and not \
@@ -949,7 +1352,39 @@ class BaseCollection(object):
             values = [value] * len(self._values)
         return values
 
-    def _percentile(self, values, percent, key=lambda x: x):
+    def _extreme_values(self, count, highest):
+        """Get the highest or lowest values and their indices for one or more counts.
+
+        The values for all counts are selected at once for the largest count. When
+        this count is small relative to the number of values, they are selected with
+        a heap of the count instead of sorting all of the values. Values that are
+        equal are ordered by their index in both cases.
+        """
+        counts = [int(c) for c in count] if isinstance(count, (list, tuple)) \
+            else [int(count)]
+        length = len(self._values)
+        for c in counts:
+            assert c <= length, 'count must be smaller than or equal to values ' \
+                'length. {} > {}.'.format(c, length)
+            assert c > 0, 'count must be greater than 0. Got {}.'.format(c)
+        top = max(counts)
+        if self._is_vectorized:
+            order = numpy.argsort(-self._values if highest else self._values,
+                                  kind='stable')[:top]
+            values, indices = self._values[order].tolist(), order.tolist()
+        else:
+            values = self._values
+            if top * 16 <= length:  # a heap is faster than a sort for few values
+                select = nlargest if highest else nsmallest
+                indices = select(top, xrange(length), key=values.__getitem__)
+            else:
+                indices = sorted(xrange(length), key=values.__getitem__,
+                                 reverse=highest)[:top]
+            values = [values[i] for i in indices]
+        results = [(values[:c], indices[:c]) for c in counts]
+        return results if isinstance(count, (list, tuple)) else results[0]
+
+    def _percentile(self, values, percent, key=None):
         """Find the percentile of a list of values.
 
         Args:
@@ -960,16 +1395,121 @@ class BaseCollection(object):
         Returns:
             The percentile of the values
         """
-        vals = sorted(values)
+        if key is None and numpy is not None and isinstance(values, numpy.ndarray):
+            # numpy uses the same linear interpolation between the closest ranks
+            return numpy.percentile(values, percent).item()
+        return self._percentile_sorted(sorted(values), percent, key)
+
+    @staticmethod
+    def _percentiles(values, percents):
+        """Find several percentiles of a list of values with a single sort or selection.
+
+        Percentiles are interpolated between the closest ranks in the same way
+        as _percentile. When all of the ranks that are needed lie within the
+        lowest and highest few values (eg. 0.4% and 99.6%), only these values
+        are selected from the list with a heap instead of sorting the whole list.
+
+        Args:
+            values: A list of values for which percentiles are desired.
+            percents: A list of float values from 0 to 100 for the requested
+                percentiles.
+
+        Returns:
+            A list with the value at each of the percents.
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            # numpy selects the ranks with introselect and uses the same interpolation
+            return numpy.percentile(values, percents).tolist()
+
+        # get the ranks of the values that are needed for each percentile
+        count = len(values)
+        ranks = []
+        for percent in percents:
+            k = (count - 1) * (percent / 100)
+            ranks.append((k, math.floor(k), math.ceil(k)))
+        mid = count // 2
+        all_ranks = [int(r) for _, f, c in ranks for r in (f, c)]
+        low_count = max([r + 1 for r in all_ranks if r < mid] or [0])
+        high_count = max([count - r for r in all_ranks if r >= mid] or [0])
+
+        # select or sort the values
+        if low_count + high_count <= count // 64:
+            lows, highs = nsmallest(low_count, values), nlargest(high_count, values)
+
+            def value_at(r):
+                return lows[r] if r < mid else highs[count - 1 - r]
+        else:
+            value_at = sorted(values).__getitem__
+
+        # interpolate the percentiles between the ranks
+        results = []
+        for k, f, c in ranks:
+            if f == c:
+                results.append(value_at(int(k)))
+            else:
+                results.append(value_at(int(f)) * (c - k) + value_at(int(c)) * (k - f))
+        return results
+
+    @staticmethod
+    def _percentile_sorted(vals, percent, key=None):
+        """Find the percentile of a list of values that is already sorted.
+
+        Args:
+            vals: A sorted list of values for which percentiles are desired.
+            percent: A float value from 0 to 100 representing the requested percentile.
+            key: optional key function to compute value from each element of N.
+
+        Returns:
+            The percentile of the values using a linear interpolation between
+            the closest ranks.
+        """
         k = (len(vals) - 1) * (percent / 100)
         f = math.floor(k)
         c = math.ceil(k)
+        if key is None:
+            if f == c:
+                return vals[int(k)]
+            return vals[int(f)] * (c - k) + vals[int(c)] * (k - f)
         if f == c:
             return key(vals[int(k)])
         d0 = key(vals[int(f)]) * (c - k)
         d1 = key(vals[int(c)]) * (k - f)
         return d0 + d1
 
+    def _stat_function(self, stat, is_sorted):
+        """Get a function and operation text for a statistic of aggregate or ensemble.
+
+        Args:
+            stat: Text for the statistic (eg. average, total, min, max, median, p10).
+            is_sorted: Boolean to note whether the function will be passed
+                sorted values, in which case min, max and percentiles are
+                computed without sorting.
+        """
+        if stat == 'average':
+            return self._average, stat
+        elif stat == 'total':
+            return self._total, stat
+        elif stat == 'min':
+            return (lambda vals: vals[0]) if is_sorted else min, 'minimum'
+        elif stat == 'max':
+            return (lambda vals: vals[-1]) if is_sorted else max, 'maximum'
+        elif stat == 'median':
+            return (lambda vals: self._percentile_sorted(vals, 50)), '50 percentile'
+        try:
+            assert stat[0] == 'p'
+            percentile = float(stat[1:])
+        except (AssertionError, IndexError, ValueError):
+            raise ValueError(
+                'Invalid statistic "{}". Choose from average, total, min, max, median '
+                'or a percentile such as p10.'.format(stat))
+        assert 0 <= percentile <= 100, \
+            'percentile must be between 0 and 100. Got {}'.format(percentile)
+        percentile = int(percentile) if percentile.is_integer() else percentile
+
+        def percentile_function(vals):
+            return self._percentile_sorted(vals, percentile)
+        return percentile_function, '{} percentile'.format(percentile)
+
     def _average(self, vals):
         return sum(vals) / len(vals)
 
@@ -997,9 +1537,13 @@ class BaseCollection(object):
         return len(self._values)
 
     def __getitem__(self, key):
+        if self._is_vectorized or \
+                (isinstance(key, slice) and isinstance(self._values, array)):
+            return self._values[key].tolist()
         return self._values[key]
 
     def __setitem__(self, key, value):
+        self._own_values()
         self._values[key] = value
 
     def __iter__(self):
@@ -1009,84 +1553,105 @@ class BaseCollection(object):
         return item in self._values
 
     def __add__(self, other):
-        new_vals = self._add_values(other)
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        if isinstance(other, CollectionExpression):
+            return self.lazy() + other
+        return self._operation_collection(self._add_values(other))
 
     def __sub__(self, other):
-        new_vals = self._sub_values(other)
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        if isinstance(other, CollectionExpression):
+            return self.lazy() - other
+        return self._operation_collection(self._sub_values(other))
 
     def __mul__(self, other):
-        new_vals = self._mul_values(other)
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        if isinstance(other, CollectionExpression):
+            return self.lazy() * other
+        return self._operation_collection(self._mul_values(other))
 
     def __div__(self, other):
-        new_vals = self._div_values(other)
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        if isinstance(other, CollectionExpression):
+            return self.lazy() / other
+        return self._operation_collection(self._div_values(other))
 
     def __truediv__(self, other):
-        new_vals = self._div_values(other)
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        if isinstance(other, CollectionExpression):
+            return self.lazy() / other
+        return self._operation_collection(self._div_values(other))
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
-        new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
+        new_vals = -self._values if self._is_vectorized else \
+            self._match_backend([-v_1 for v_1 in self._values])
+        return self._operation_collection(new_vals)
+
+    def _operation_collection(self, values):
+        """Get a new collection like this one from the values of an operation."""
+        new_obj = self._new_collection(self.__class__, self.header.duplicate(), values)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
 
     def _add_values(self, other):
         if isinstance(other, (int, float)):
+            if self._is_vectorized:
+                return self._values + other
             new_vals = [v_1 + other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be added to {}'.format(self.__class__, other.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match in ' \
                 'order to add them together. {} != {}'.format(len(self), len(other))
+            if self._is_vectorized or other._is_vectorized:
+                return numpy.add(self._values, other._values)
             new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+        return self._match_backend(new_vals)
 
     def _sub_values(self, other):
         if isinstance(other, (int, float)):
+            if self._is_vectorized:
+                return self._values - other
             new_vals = [v_1 - other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be subtracted from {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to subtract one from the other. {} != {}'.format(len(self), len(other))
+            if self._is_vectorized or other._is_vectorized:
+                return numpy.subtract(self._values, other._values)
             new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+        return self._match_backend(new_vals)
 
     def _mul_values(self, other):
         if isinstance(other, (int, float)):
+            if self._is_vectorized:
+                return self._values * other
             new_vals = [v_1 * other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be multiplied by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to multiply them together. {} != {}'.format(len(self), len(other))
+            if self._is_vectorized or other._is_vectorized:
+                return numpy.multiply(self._values, other._values)
             new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+        return self._match_backend(new_vals)
 
     def _div_values(self, other):
         if isinstance(other, (int, float)):
+            if self._is_vectorized:
+                if other == 0:  # match the error of dividing Python numbers
+                    raise ZeroDivisionError('float division by zero')
+                return self._values / other
             new_vals = [v_1 / other for v_1 in self._values]
         else:
             assert self._collection_type == other._collection_type, \
                 '{} cannot be divided by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to divide them. {} != {}'.format(len(self), len(other))
+            if self._is_vectorized or other._is_vectorized:
+                divisor = numpy.asarray(other._values, dtype=float)
+                if not divisor.all():  # match the error of dividing Python numbers
+                    raise ZeroDivisionError('float division by zero')
+                return numpy.divide(self._values, divisor)
             new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+        return self._match_backend(new_vals)
 
     @property
     def is_continuous(self):
@@ -1115,3 +1680,262 @@ class BaseCollection(object):
         """Discontinuous Collection representation."""
         return "Discontinuous Data Collection\n{} ({})\n...{} values...".format(
             self.header.data_type, self.header.unit, len(self._values))
+
+
+class CollectionExpression(object):
+    """A lazy arithmetic expression over aligned Data Collections.
+
+    Expressions are usually obtained from the lazy() method of a Data Collection.
+    They support the +, -, *, / and unary - operators with Data Collections,
+    other expressions and numbers. Each collection added to the expression is
+    checked for alignment with the first one as the expression is built and all
+    values are read from the collections when the expression is evaluated.
+
+    Args:
+        collection: The Data Collection that starts the expression. The result of
+            evaluating the expression will be a collection like this one.
+
+    Properties:
+        * collection
+        * header
+        * values
+    """
+
+    __slots__ = ('_collection', '_node', '_result')
+    _CODE_CACHE = {}
+    _CODE_CACHE_SIZE = 256
+    _SYMBOLS = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/'}
+
+    def __init__(self, collection, _node=None):
+        """Initialize collection expression."""
+        assert isinstance(collection, BaseCollection), 'Expected Data ' \
+            'Collection for CollectionExpression. Got {}.'.format(type(collection))
+        self._collection = collection
+        self._node = ('col', collection) if _node is None else _node
+        self._result = None
+
+    @property
+    def collection(self):
+        """Get the Data Collection that starts the expression."""
+        return self._collection
+
+    @property
+    def header(self):
+        """Get the header of the collection that starts the expression."""
+        return self._collection.header
+
+    @property
+    def values(self):
+        """Get a tuple of the values that result from evaluating the expression."""
+        return self.evaluate().values
+
+    def evaluate(self):
+        """Compute the expression and get the resulting Data Collection.
+
+        The result is computed the first time that this method is called and the
+        same collection is returned each time after that.
+        """
+        if self._result is None:
+            collections, constants = [], []
+            code = self._code(self._node, collections, constants, {})
+            if numpy is not None and any(c._is_vectorized for c in collections):
+                values = self._evaluate_numpy(self._node)[0]
+            else:
+                values = self._evaluate_loop(code, collections, constants)
+                values = self._collection._match_backend(values)
+            self._result = self._collection._operation_collection(values)
+        return self._result
+
+    def _combine(self, operator, other, reflected=False):
+        """Get a new expression that combines this one with an operand."""
+        if isinstance(other, CollectionExpression):
+            self._check_aligned(other._collection)
+            other = other._node
+        elif isinstance(other, BaseCollection):
+            self._check_aligned(other)
+            other = ('col', other)
+        elif isinstance(other, (int, float)):
+            other = ('num', other)
+        else:
+            return NotImplemented
+        node = (operator, other, self._node) if reflected else \
+            (operator, self._node, other)
+        return CollectionExpression(self._collection, node)
+
+    def _check_aligned(self, collection):
+        """Check that a collection can be used in an operation with this expression.
+        """
+        coll = self._collection
+        assert coll._collection_type == collection._collection_type, \
+            '{} cannot be used in an expression with {}'.format(
+                collection.__class__, coll.__class__)
+        assert len(coll) == len(collection), 'Length of DataCollections must ' \
+            'match to use them in an expression. {} != {}'.format(
+                len(coll), len(collection))
+
+    def _code(self, node, collections, constants, indices):
+        """Get Python code for a node while gathering its collections and numbers.
+        """
+        if node[0] == 'col':
+            coll = node[1]
+            if id(coll) not in indices:
+                indices[id(coll)] = len(collections)
+                collections.append(coll)
+            return 'v{}'.format(indices[id(coll)])
+        if node[0] == 'num':
+            constants.append(node[1])
+            return 'k{}'.format(len(constants) - 1)
+        if node[0] == 'neg':
+            return '(-{})'.format(self._code(node[1], collections, constants, indices))
+        return '({} {} {})'.format(
+            self._code(node[1], collections, constants, indices),
+            self._SYMBOLS[node[0]],
+            self._code(node[2], collections, constants, indices))
+
+    def _evaluate_loop(self, code, collections, constants):
+        """Compute the values of the expression in one loop over all collections.
+
+        The compiled loops are cached by their code such that expressions with the
+        same structure and different numbers or collections share the loop.
+        """
+        var = ', '.join('v{}'.format(i) for i in range(len(collections)))
+        compiled = self._CODE_CACHE.get((code, var))
+        if compiled is None:
+            if len(self._CODE_CACHE) >= self._CODE_CACHE_SIZE:
+                self._CODE_CACHE.clear()
+            if len(collections) == 1:
+                loop = '[{} for v0 in c0]'.format(code)
+            else:
+                loop = '[{} for {} in zip({})]'.format(code, var, ', '.join(
+                    'c{}'.format(i) for i in range(len(collections))))
+            compiled = compile(loop, '<collection expression>', 'eval')
+            self._CODE_CACHE[(code, var)] = compiled
+        namespace = {'zip': zip}
+        for i, coll in enumerate(collections):
+            namespace['c{}'.format(i)] = coll._values
+        for i, const in enumerate(constants):
+            namespace['k{}'.format(i)] = const
+        return eval(compiled, namespace)
+
+    def _evaluate_numpy(self, node):
+        """Compute the values of a node with NumPy.
+
+        The result of each operation is written over the array of an operand
+        whenever that array is an intermediate result that was created for this
+        expression, such that no array is allocated beyond the first one.
+
+        Returns:
+            A tuple with a NumPy array or number for the node and a boolean for
+            whether the array is an intermediate result that can be overwritten.
+        """
+        if node[0] == 'col':
+            values = node[1]._values
+            if isinstance(values, numpy.ndarray):
+                return values, False
+            return numpy.array(values, dtype=float), True
+        if node[0] == 'num':
+            return node[1], False
+        if node[0] == 'neg':
+            vals, temp = self._evaluate_numpy(node[1])
+            return numpy.negative(vals, out=vals if temp else None), True
+        left, l_temp = self._evaluate_numpy(node[1])
+        right, r_temp = self._evaluate_numpy(node[2])
+        out = left if l_temp else right if r_temp else None
+        if node[0] == 'add':
+            return numpy.add(left, right, out=out), True
+        if node[0] == 'sub':
+            return numpy.subtract(left, right, out=out), True
+        if node[0] == 'mul':
+            return numpy.multiply(left, right, out=out), True
+        if not numpy.all(right):  # match the error of dividing Python numbers
+            raise ZeroDivisionError('float division by zero')
+        return numpy.true_divide(left, right, out=out), True
+
+    def __add__(self, other):
+        return self._combine('add', other)
+
+    def __radd__(self, other):
+        return self._combine('add', other, True)
+
+    def __sub__(self, other):
+        return self._combine('sub', other)
+
+    def __rsub__(self, other):
+        return self._combine('sub', other, True)
+
+    def __mul__(self, other):
+        return self._combine('mul', other)
+
+    def __rmul__(self, other):
+        return self._combine('mul', other, True)
+
+    def __div__(self, other):
+        return self._combine('div', other)
+
+    def __rdiv__(self, other):
+        return self._combine('div', other, True)
+
+    def __truediv__(self, other):
+        return self._combine('div', other)
+
+    def __rtruediv__(self, other):
+        return self._combine('div', other, True)
+
+    def __neg__(self):
+        return CollectionExpression(self._collection, ('neg', self._node))
+
+    def __len__(self):
+        return len(self._collection)
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Collection Expression representation."""
+        code = self._code(self._node, [], [], {})
+        return 'Collection Expression\n{} ({})\n{}'.format(
+            self.header.data_type, self.header.unit, code)
+
+
+class _VectorizedStatement(ast.NodeTransformer):
+    """Rewrite a conditional statement so that it can be evaluated over NumPy arrays.
+
+    Boolean operators and chained comparisons, which cannot be applied to arrays,
+    are replaced with NumPy's logical functions. Membership and identity tests
+    raise a ValueError since they have no element-wise equivalent.
+    """
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        funct = 'logical_and' if isinstance(node.op, ast.And) else 'logical_or'
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = self._numpy_call(funct, [result, value])
+        return result
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._numpy_call('logical_not', [node.operand])
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        for op in node.ops:
+            if isinstance(op, (ast.In, ast.NotIn, ast.Is, ast.IsNot)):
+                raise ValueError('Statement cannot be evaluated over arrays.')
+        result, left = None, node.left
+        for op, right in zip(node.ops, node.comparators):
+            comp = ast.Compare(left=left, ops=[op], comparators=[right])
+            result = comp if result is None else \
+                self._numpy_call('logical_and', [result, comp])
+            left = right
+        return result
+
+    @staticmethod
+    def _numpy_call(funct, args):
+        """Get an AST node that calls a NumPy function with a list of arguments."""
+        numpy_funct = ast.Attribute(
+            value=ast.Name(id='numpy', ctx=ast.Load()), attr=funct, ctx=ast.Load())
+        return ast.Call(func=numpy_funct, args=args, keywords=[])
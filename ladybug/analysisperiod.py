@@ -4,11 +4,16 @@ from __future__ import division
 
 from .dt import DateTime
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import timedelta
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
 
+# process-wide cache of the timestamps of analysis periods, keyed on the period
+_TIMESTAMPS_CACHE = OrderedDict()
+_TIMESTAMPS_CACHE_SIZE = 32
+
 
 class AnalysisPeriod(object):
     """An analysis period between two dates of the year and between certain hours.
@@ -61,7 +66,7 @@ class AnalysisPeriod(object):
     __slots__ = (
         '_is_leap_year', '_st_time', '_num_of_days_each_month', '_is_overnight',
         '_is_reversed', '_timestep', '_minute_intervals', '_end_time',
-        '_timestamps_data', '_datetimes'
+        '_timestamps_data'
     )
 
     # TODO: handle timestep between 1-60
@@ -112,10 +117,8 @@ class AnalysisPeriod(object):
         self._timestep = timestep
         self._minute_intervals = timedelta(1 / (24.0 * self.timestep))
 
-        # _timestamps_data is a dictionary for datetimes.
-        # key values will be minute of year
+        # _timestamps_data holds the shared timestamps of the analysis period
         self._timestamps_data = None  # set to None for now and calculate upon request
-        self._datetimes = None
 
     @classmethod
     def from_dict(cls, data):
@@ -242,31 +245,23 @@ class AnalysisPeriod(object):
     @property
     def datetimes(self):
         """A sorted list of hourly datetimes in this analysis period."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(self._datetimes)
+        return self._timestamps().datetimes
 
     @property
     def moys(self):
         """A sorted list of hourly minutes of year in this analysis period as integers.
         """
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(self._timestamps_data)
+        return self._timestamps().moys
 
     @property
     def hoys(self):
         """A sorted list of hours of year in this analysis period."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(moy / 60.0 for moy in self._timestamps_data)
+        return self._timestamps().hoys
 
     @property
     def hoys_int(self):
         """A sorted list of hours of year in this analysis period as integers."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(int(moy / 60.0) for moy in self._timestamps_data)
+        return tuple(moy // 60 for moy in self._timestamps().moys)
 
     @property
     def doys_int(self):
@@ -355,9 +350,7 @@ class AnalysisPeriod(object):
         Returns:
             A boolean. True if time is included in analysis period
         """
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return time.moy in self._timestamps_data
+        return time.moy in self._timestamps().moy_set
 
     def duplicate(self):
         """Return a copy of the analysis period."""
@@ -379,68 +372,72 @@ class AnalysisPeriod(object):
             'type': 'AnalysisPeriod'
         }
 
-    def _calc_timestamps(self, st_time, end_time):
-        """Calculate timesteps between start time and end time.
+    def _timestamps(self):
+        """Get the timestamps of this analysis period.
+
+        Timestamps are shared between all equal analysis periods through a
+        bounded cache such that they are only computed once per process.
+        """
+        if self._timestamps_data is None:
+            key = self.__key()
+            try:
+                timestamps = _TIMESTAMPS_CACHE.pop(key)
+            except KeyError:
+                timestamps = _Timestamps(self._calculate_timestamps(), self.is_leap_year)
+                if len(_TIMESTAMPS_CACHE) >= _TIMESTAMPS_CACHE_SIZE:
+                    _TIMESTAMPS_CACHE.popitem(last=False)
+            _TIMESTAMPS_CACHE[key] = timestamps  # most recently used goes last
+            self._timestamps_data = timestamps
+        return self._timestamps_data
+
+    def _calc_timestamps(self, st_moy, end_moy):
+        """Calculate minutes of the year between a start and an end minute of the year.
 
         Use this method only when start time month is before end time month.
         """
-        # calculate based on minutes
-        # I have to convert the object to DateTime because of how Dynamo
-        # works: https://github.com/DynamoDS/Dynamo/issues/6683
-        # Do not modify this line to datetime
-        curr = datetime(st_time.year, st_time.month, st_time.day, st_time.hour,
-                        st_time.minute, self.is_leap_year)
-        end_time = datetime(end_time.year, end_time.month, end_time.day,
-                            end_time.hour, end_time.minute, self.is_leap_year)
-
-        while curr <= end_time:
-            if self.is_possible_hour(curr.hour + (curr.minute / 60.0)):
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
-            curr += self.minute_intervals
-
-        if self.timestep != 1 and curr.hour == 23 and self.is_possible_hour(0):
+        # get the minutes of each day that fall within the hours of the period
+        step = self.VALIDTIMESTEPS[self.timestep]
+        day_mins = [m for m in xrange(0, 1440, step) if self.is_possible_hour(m / 60)]
+
+        moys = []
+        first_day, last_day = st_moy - st_moy % 1440, end_moy - end_moy % 1440
+        for day in xrange(first_day, last_day + 1, 1440):
+            if day == first_day or day == last_day:
+                moys.extend(day + m for m in day_mins if st_moy <= day + m <= end_moy)
+            else:
+                moys.extend(day + m for m in day_mins)
+
+        if self.timestep != 1 and (end_moy // 60) % 24 == 23 and \
+                self.is_possible_hour(0):
             # This is for cases that timestep is more than one
             # and last hour of the day is part of the calculation
-            curr = end_time
-            for _ in list(xrange(self.timestep))[1:]:
-                curr += self.minute_intervals
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
+            moys.extend(xrange(end_moy + step, end_moy + 60, step))
+        return moys
 
     def _calculate_timestamps(self):
-        """Return a list of Ladybug DateTimes in this analysis period."""
-        self._timestamps_data = []
-        self._datetimes = []
+        """Return a tuple of the minutes of the year in this analysis period."""
         if not self._is_reversed:
-            self._calc_timestamps(self.st_time, self.end_time)
+            moys = self._calc_timestamps(self.st_time.moy, self.end_time.moy)
         else:
-            self._calc_timestamps(
-                self.st_time, DateTime.from_last_hour(self.is_leap_year))
-            self._calc_timestamps(
-                DateTime.from_first_hour(self.is_leap_year), self.end_time)
+            moys = self._calc_timestamps(
+                self.st_time.moy, DateTime.from_last_hour(self.is_leap_year).moy)
+            moys.extend(self._calc_timestamps(
+                DateTime.from_first_hour(self.is_leap_year).moy, self.end_time.moy))
+        return tuple(moys)
 
     def _calc_daystamps(self, st_time, end_time):
         """Calculate days of the year between start time and end time.
 
         Use this method only when start time month is before end time month.
         """
-        start_doy = sum(self._num_of_days_each_month[:st_time.month - 1]) + \
-            st_time.day
-        end_doy = sum(self._num_of_days_each_month[:end_time.month - 1]) + \
-            end_time.day + 1
-        return list(range(start_doy, end_doy))
+        return list(range(st_time.doy, end_time.doy + 1))
 
     def __len__(self):
         """Number of steps in the analysis period.
 
         The length will be number of hours * timestep.
         """
-        if self.st_hour == 1 and self.end_hour == 23:  # use fast method
+        if self.st_hour == 0 and self.end_hour == 23:  # use fast method
             if not self._is_reversed:
                 return (self.end_time.int_hoy + 1 - self.st_time.int_hoy) * self.timestep
             else:
@@ -450,9 +447,7 @@ class AnalysisPeriod(object):
                     DateTime.from_first_hour(self.is_leap_year).int_hoy
                 return ((first + second + 2) * self.timestep)
         else:
-            if self._timestamps_data is None:
-                self._calculate_timestamps()
-            return len(self._timestamps_data)
+            return len(self._timestamps().moys)
 
     def __str__(self):
         """Return analysis period as a string."""
@@ -474,6 +469,15 @@ class AnalysisPeriod(object):
              self.st_time.hour, self.end_time.hour,
              self.timestep)
 
+    def __reduce_ex__(self, protocol):
+        """Call the __init__() constructor when the class instance is unpickled.
+
+        This way, the cached datetimes and timestamps are not pickled.
+        """
+        return (type(self), (self.st_month, self.st_day, self.st_hour,
+                             self.end_month, self.end_day, self.end_hour,
+                             self.timestep, self.is_leap_year))
+
     def __key(self):
         return(self.st_time, self.end_time, self.timestep, self.is_leap_year)
 
@@ -485,3 +489,42 @@ class AnalysisPeriod(object):
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+
+class _Timestamps(object):
+    """Immutable timestamps of an analysis period that are shared between periods.
+
+    Args:
+        moys: A tuple of integers for the minutes of the year of the period.
+        leap_year: Boolean to note whether the timestamps are a part of a leap year.
+    """
+    __slots__ = ('moys', 'leap_year', '_datetimes', '_hoys', '_moy_set')
+
+    def __init__(self, moys, leap_year):
+        self.moys = moys
+        self.leap_year = leap_year
+        self._datetimes = None
+        self._hoys = None
+        self._moy_set = None
+
+    @property
+    def datetimes(self):
+        """A tuple of DateTimes, which are built the first time they are requested."""
+        if self._datetimes is None:
+            self._datetimes = tuple(
+                DateTime.from_moy(moy, self.leap_year) for moy in self.moys)
+        return self._datetimes
+
+    @property
+    def hoys(self):
+        """A tuple of float hours of the year."""
+        if self._hoys is None:
+            self._hoys = tuple(moy / 60.0 for moy in self.moys)
+        return self._hoys
+
+    @property
+    def moy_set(self):
+        """A frozenset of the minutes of the year for fast membership tests."""
+        if self._moy_set is None:
+            self._moy_set = frozenset(self.moys)
+        return self._moy_set
@@ -0,0 +1,67 @@
+# coding=utf-8
+"""Functions for reading the weather files of a .zip bundle without extracting them."""
+from __future__ import division
+
+import os
+
+from .epw import EPW
+from .stat import STAT
+from .ddy import DDY
+from .futil import zip_file_members
+
+
+def iter_bundle(zip_file, extensions=('epw', 'stat', 'ddy')):
+    """Iterate over the weather datasets inside a .zip bundle without extracting it.
+
+    Each weather dataset is the set of .epw, .stat and .ddy files that share the
+    same name within the .zip file. The datasets are yielded one at a time and
+    each file is only read once the dataset is yielded such that large bundles
+    can be processed without loading all of their files into memory. Note that
+    .zip files nested inside the bundle are not read.
+
+    Args:
+        zip_file: Full path to a .zip file containing weather files.
+        extensions: A list of text for the file extensions to be read from the
+            bundle. (Default: ('epw', 'stat', 'ddy')).
+
+    Returns:
+        An iterator of dictionaries with a 'name' key for the name of the
+        weather dataset and a key for each extension with the object that was
+        loaded from the file (or None if the dataset has no file with the
+        extension).
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.bundle import iter_bundle
+
+        for dataset in iter_bundle('./USA_CO_Golden.NREL.724666_TMY3.zip'):
+            if dataset['epw'] is not None:
+                print(dataset['epw'].dry_bulb_temperature.average)
+    """
+    readers = {'epw': EPW.from_zip, 'stat': STAT.from_zip, 'ddy': DDY.from_zip}
+    for ext in extensions:
+        assert ext in readers, 'Unrecognized weather file extension "{}". ' \
+            'Choose from: {}'.format(ext, tuple(readers.keys()))
+
+    # group the files of the bundle by their name without extension
+    datasets, names = {}, []
+    for member in zip_file_members(zip_file):
+        name, ext = os.path.splitext(member)
+        ext = ext[1:].lower()
+        if ext not in extensions:
+            continue
+        if name not in datasets:
+            datasets[name] = {}
+            names.append(name)
+        datasets[name][ext] = member
+
+    # load the files of each dataset as it is yielded
+    for name in names:
+        dataset = {'name': os.path.basename(name)}
+        for ext in extensions:
+            member = datasets[name].get(ext)
+            dataset[ext] = readers[ext](zip_file, member) \
+                if member is not None else None
+        yield dataset
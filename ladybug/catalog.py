@@ -0,0 +1,422 @@
+# coding=utf-8
+"""Catalog of weather stations indexed from the headers of EPW, STAT and DDY files."""
+from __future__ import division
+
+import os
+import json
+import sqlite3
+
+from .epw import EPW
+from .stat import STAT
+from .ddy import DDY
+from .location import Location
+
+try:
+    basestring  # python 2
+except NameError:
+    basestring = str  # python 3
+
+
+class StationCatalog(object):
+    """A persistent catalog of weather stations stored in an SQLite database.
+
+    Each station in the catalog is a weather dataset, which is the set of .epw,
+    .stat and .ddy files that share the same name within the same folder (eg. the
+    files that come in the zip bundle of a weather file). The catalog is filled
+    by scanning only the headers of these files. Once it is filled, stations can
+    be queried using the indexed columns of the catalog without reading any file.
+
+    Args:
+        file_path: Path to the SQLite file of the catalog. The file and its tables
+            will be created if they do not exist.
+
+    Properties:
+        * file_path
+        * columns
+
+    Usage:
+
+    .. code-block:: python
+
+        catalog = StationCatalog('C:/weather/catalog.db')
+        catalog.refresh('C:/weather')  # only rescans files that have changed
+        stations = catalog.search(climate_zone='4A', heating_996_below=-10)
+    """
+    COLUMNS = (
+        'dataset', 'epw_file', 'stat_file', 'ddy_file', 'city', 'state', 'country',
+        'source', 'station_id', 'latitude', 'longitude', 'time_zone', 'elevation',
+        'climate_zone', 'koppen_climate_zone', 'heating_996', 'heating_990',
+        'cooling_004', 'cooling_010', 'design_conditions', 'weeks'
+    )
+    _real_columns = ('latitude', 'longitude', 'time_zone', 'elevation',
+                     'heating_996', 'heating_990', 'cooling_004', 'cooling_010')
+    _json_columns = ('design_conditions', 'weeks')
+    _indexed_columns = ('station_id', 'country', 'climate_zone', 'latitude',
+                        'heating_996', 'cooling_004')
+    _extensions = ('.epw', '.stat', '.ddy')
+
+    def __init__(self, file_path):
+        """Initialize StationCatalog."""
+        self._file_path = os.path.abspath(file_path)
+        self._create_tables()
+
+    @property
+    def file_path(self):
+        """Get the path to the SQLite file of the catalog."""
+        return self._file_path
+
+    @property
+    def columns(self):
+        """Get a tuple of text for the columns that can be used in catalog queries.
+
+        The columns are the following.
+
+        * dataset - path to the weather files without the file extension
+        * epw_file - path to the .epw file of the station or None
+        * stat_file - path to the .stat file of the station or None
+        * ddy_file - path to the .ddy file of the station or None
+        * city
+        * state
+        * country
+        * source
+        * station_id
+        * latitude
+        * longitude
+        * time_zone
+        * elevation
+        * climate_zone - the ASHRAE climate zone (eg. 4A) from the .stat file
+        * koppen_climate_zone - the Koppen climate zone from the .stat file
+        * heating_996 - the 99.6% annual heating design dry bulb temperature (C)
+        * heating_990 - the 99.0% annual heating design dry bulb temperature (C)
+        * cooling_004 - the 0.4% annual cooling design dry bulb temperature (C)
+        * cooling_010 - the 1.0% annual cooling design dry bulb temperature (C)
+        * design_conditions - a dictionary with heating, cooling and extremes
+            dictionaries of ASHRAE design conditions
+        * weeks - a dictionary with the names of the typical and extreme weeks as
+            keys and AnalysisPeriod dictionaries as values
+        """
+        return self.COLUMNS
+
+    def refresh(self, paths, recursive=True):
+        """Update the catalog with the weather files in folders or a list of files.
+
+        Only the files that are new or whose modification time or size has changed
+        since the last refresh are scanned. Files that were in the catalog but no
+        longer exist within the paths are removed from the catalog.
+
+        Args:
+            paths: A path to a folder or a weather file (.epw, .stat or .ddy).
+                This can also be a list of such paths.
+            recursive: Boolean to note whether the sub-folders of any folders
+                should also be scanned. (Default: True).
+
+        Returns:
+            A sorted list of paths to the files that were added, updated or removed.
+        """
+        # gather all of the weather files within the paths
+        paths = [paths] if isinstance(paths, basestring) else paths
+        folders, files, current = [], [], {}
+        for path in paths:
+            path = os.path.abspath(path)
+            if os.path.isdir(path):
+                folders.append(path)
+                file_paths = _weather_files(path, self._extensions, recursive)
+            else:
+                files.append(path)
+                file_paths = [path] if os.path.isfile(path) else []
+            for file_path in file_paths:
+                f_stat = os.stat(file_path)
+                current[file_path] = (f_stat.st_mtime, f_stat.st_size)
+
+        conn = sqlite3.connect(self._file_path)
+        try:
+            c = conn.cursor()
+            # find the files that are new, changed or removed since the last refresh
+            c.execute('SELECT file_path, modified, size FROM files')
+            stored = {row[0]: (row[1], row[2]) for row in c.fetchall()}
+            changed = [fp for fp, key in current.items() if stored.get(fp) != key]
+            removed = [fp for fp in stored if fp not in current and
+                       (fp in files or _is_in_folders(fp, folders, recursive))]
+            c.executemany('DELETE FROM files WHERE file_path=?',
+                          [(fp,) for fp in removed])
+            c.executemany(
+                'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+                [(fp, _dataset(fp)) + current[fp] for fp in changed])
+
+            # rescan the datasets of any files that are new, changed or removed
+            for dataset in set(_dataset(fp) for fp in changed + removed):
+                c.execute('SELECT file_path FROM files WHERE dataset=?', (dataset,))
+                file_paths = [row[0] for row in c.fetchall()]
+                if len(file_paths) == 0:
+                    c.execute('DELETE FROM stations WHERE dataset=?', (dataset,))
+                    continue
+                row = _scan_dataset(dataset, file_paths)
+                c.execute('INSERT OR REPLACE INTO stations VALUES ({})'.format(
+                    ', '.join('?' * len(self.COLUMNS))),
+                    tuple(row[col] for col in self.COLUMNS))
+            conn.commit()
+        finally:
+            conn.close()  # ensure connection is always closed
+        return sorted(changed + removed)
+
+    def query(self, where=None, parameters=(), order_by=None):
+        """Get the stations in the catalog that meet an SQL condition.
+
+        Args:
+            where: Optional text for an SQL WHERE clause (without the "WHERE"),
+                which uses the columns of the catalog (eg. "country = ? AND
+                elevation > ?"). If None, all stations will be returned.
+            parameters: A tuple of values to be substituted for each "?" in
+                the where clause. (Default: ()).
+            order_by: Optional text for the columns by which the stations should
+                be sorted (eg. "heating_996 DESC"). If None, the stations will
+                be sorted by their dataset.
+
+        Returns:
+            A list of dictionaries for the stations that meet the condition. Each
+            dictionary has the columns of the catalog as keys along with a
+            "location" key that has a Ladybug Location object for the station.
+        """
+        sql = 'SELECT {} FROM stations'.format(', '.join(self.COLUMNS))
+        if where:
+            sql += ' WHERE {}'.format(where)
+        sql += ' ORDER BY {}'.format(order_by or 'dataset')
+        conn = sqlite3.connect(self._file_path)
+        try:
+            c = conn.cursor()
+            c.execute(sql, tuple(parameters))
+            rows = c.fetchall()
+        finally:
+            conn.close()  # ensure connection is always closed
+        return [self._row_to_dict(row) for row in rows]
+
+    def search(self, climate_zone=None, country=None, station_id=None,
+               heating_996_below=None, cooling_004_above=None):
+        """Get the stations in the catalog that meet several criteria.
+
+        Args:
+            climate_zone: Optional text for the ASHRAE climate zone of the stations.
+                This can be only the number of the zone (eg. "4") to get all
+                zones with that number or the full zone (eg. "4A").
+            country: Optional text for the country of the stations (eg. "USA").
+            station_id: Optional text for the WMO station ID of the stations.
+            heating_996_below: Optional number for a temperature in Celsius below
+                which the 99.6% annual heating design dry bulb temperature of the
+                stations should be.
+            cooling_004_above: Optional number for a temperature in Celsius above
+                which the 0.4% annual cooling design dry bulb temperature of the
+                stations should be.
+
+        Returns:
+            A list of dictionaries for the stations that meet all of the criteria.
+            See the query method for the keys of these dictionaries.
+        """
+        conditions, parameters = [], []
+        if climate_zone is not None:
+            conditions.append('climate_zone LIKE ?')
+            parameters.append('{}%'.format(climate_zone))
+        if country is not None:
+            conditions.append('country = ?')
+            parameters.append(country)
+        if station_id is not None:
+            conditions.append('station_id = ?')
+            parameters.append(str(station_id))
+        if heating_996_below is not None:
+            conditions.append('heating_996 < ?')
+            parameters.append(heating_996_below)
+        if cooling_004_above is not None:
+            conditions.append('cooling_004 > ?')
+            parameters.append(cooling_004_above)
+        where = ' AND '.join(conditions) if len(conditions) != 0 else None
+        return self.query(where, parameters)
+
+    def _create_tables(self):
+        """Create the tables and indices of the catalog if they do not exist."""
+        col_defs = []
+        for col in self.COLUMNS:
+            col_type = 'REAL' if col in self._real_columns else 'TEXT'
+            col_defs.append('{} {}'.format(col, col_type))
+        col_defs[0] += ' PRIMARY KEY'
+        conn = sqlite3.connect(self._file_path)
+        try:
+            c = conn.cursor()
+            c.execute('CREATE TABLE IF NOT EXISTS files (file_path TEXT PRIMARY KEY, '
+                      'dataset TEXT, modified REAL, size INTEGER)')
+            c.execute('CREATE INDEX IF NOT EXISTS files_dataset ON files (dataset)')
+            c.execute('CREATE TABLE IF NOT EXISTS stations ({})'.format(
+                ', '.join(col_defs)))
+            for col in self._indexed_columns:
+                c.execute('CREATE INDEX IF NOT EXISTS stations_{0} '
+                          'ON stations ({0})'.format(col))
+            conn.commit()
+        finally:
+            conn.close()  # ensure connection is always closed
+
+    def _row_to_dict(self, row):
+        """Convert a row of the stations table into a dictionary."""
+        station = dict(zip(self.COLUMNS, row))
+        for col in self._json_columns:
+            station[col] = json.loads(station[col])
+        station['location'] = Location(
+            station['city'], station['state'], station['country'],
+            station['latitude'] or 0, station['longitude'] or 0,
+            station['time_zone'], station['elevation'] or 0,
+            station['station_id'], station['source'])
+        return station
+
+    def __len__(self):
+        """Get the number of stations in the catalog."""
+        conn = sqlite3.connect(self._file_path)
+        try:
+            c = conn.cursor()
+            c.execute('SELECT COUNT(*) FROM stations')
+            count = c.fetchone()[0]
+        finally:
+            conn.close()  # ensure connection is always closed
+        return count
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Station catalog representation."""
+        return 'Station Catalog: {}'.format(self.file_path)
+
+
+def _weather_files(folder, extensions, recursive=True):
+    """Get a list of paths to all weather files within a folder."""
+    file_paths = []
+    for root, dirs, files in os.walk(folder):
+        for f_name in files:
+            if os.path.splitext(f_name)[1].lower() in extensions:
+                file_paths.append(os.path.join(root, f_name))
+        if not recursive:
+            break
+    return file_paths
+
+
+def _is_in_folders(file_path, folders, recursive=True):
+    """Check whether a file path is within any of a list of folders."""
+    for folder in folders:
+        if recursive:
+            if file_path.startswith(os.path.join(folder, '')):
+                return True
+        elif os.path.dirname(file_path) == folder:
+            return True
+    return False
+
+
+def _dataset(file_path):
+    """Get the dataset of a weather file, which is its path without an extension."""
+    return os.path.splitext(file_path)[0]
+
+
+def _scan_dataset(dataset, file_paths):
+    """Get a row for the stations table by scanning the files of a dataset.
+
+    The files are scanned from the lowest to the highest priority (.ddy, .stat,
+    .epw) such that the information of the higher priority files overwrites
+    that of the lower priority ones.
+    """
+    row = {col: None for col in StationCatalog.COLUMNS}
+    row['dataset'] = dataset
+    design_conditions, weeks = {}, {}
+    files = {os.path.splitext(fp)[1].lower(): fp for fp in file_paths}
+
+    if '.ddy' in files:
+        row['ddy_file'] = files['.ddy']
+        try:
+            ddy = DDY.from_ddy_file(files['.ddy'])
+        except Exception:  # not a valid .ddy file; ignore it
+            pass
+        else:
+            _set_location(row, ddy.location)
+            design_keys = (('Htg 99.6%', 'heating_996'), ('Htg 99%', 'heating_990'),
+                           ('Clg .4% Condns DB', 'cooling_004'),
+                           ('Clg 1% Condns DB', 'cooling_010'))
+            for des_day in ddy.design_days:
+                for name_key, col in design_keys:
+                    if name_key in des_day.name:
+                        row[col] = des_day.dry_bulb_condition.dry_bulb_max
+
+    if '.stat' in files:
+        row['stat_file'] = files['.stat']
+        try:
+            stat = STAT(files['.stat'])
+            stat_dict = stat.to_dict()
+        except Exception:  # not a valid .stat file; ignore it
+            pass
+        else:
+            _set_location(row, stat.location)
+            row['climate_zone'] = stat.ashrae_climate_zone
+            row['koppen_climate_zone'] = stat.koppen_climate_zone
+            _set_design_conditions(row, design_conditions, stat_dict['heating_dict'],
+                                   stat_dict['cooling_dict'])
+            if stat.extreme_cold_week is not None:
+                weeks['Extreme Cold Week'] = stat.extreme_cold_week.to_dict()
+            if stat.extreme_hot_week is not None:
+                weeks['Extreme Hot Week'] = stat.extreme_hot_week.to_dict()
+            for season, week in stat_dict['typical_weeks'].items():
+                if season != 'other':
+                    weeks['Typical {} Week'.format(season.title())] = week
+
+    if '.epw' in files:
+        row['epw_file'] = files['.epw']
+        try:
+            epw = EPW(files['.epw'])
+            epw._import_data(import_header_only=True)
+        except Exception:  # not a valid .epw file; ignore it
+            pass
+        else:
+            _set_location(row, epw.location)
+            _set_design_conditions(
+                row, design_conditions, epw.heating_design_condition_dictionary,
+                epw.cooling_design_condition_dictionary,
+                epw.extreme_design_condition_dictionary)
+            for week_dict in (epw.extreme_hot_weeks, epw.extreme_cold_weeks,
+                              epw.typical_weeks):
+                for name, week in week_dict.items():
+                    weeks[name] = week.to_dict()
+
+    row['design_conditions'] = json.dumps(design_conditions)
+    row['weeks'] = json.dumps(weeks)
+    return row
+
+
+def _set_location(row, location):
+    """Set the location columns of a row from a Ladybug Location."""
+    row['city'] = location.city
+    row['state'] = location.state
+    row['country'] = location.country
+    row['source'] = location.source
+    row['station_id'] = location.station_id
+    row['latitude'] = location.latitude
+    row['longitude'] = location.longitude
+    row['time_zone'] = location.time_zone
+    row['elevation'] = location.elevation
+
+
+def _set_design_conditions(row, design_conditions, heating_dict, cooling_dict,
+                           extremes_dict=None):
+    """Set the design condition columns of a row from ASHRAE design dictionaries."""
+    des_dicts = (('heating', heating_dict), ('cooling', cooling_dict),
+                 ('extremes', extremes_dict))
+    for key, des_dict in des_dicts:
+        if des_dict:
+            design_conditions[key] = {k: _to_float(v) for k, v in des_dict.items()}
+    col_keys = (('heating', 'DB996', 'heating_996'), ('heating', 'DB990', 'heating_990'),
+                ('cooling', 'DB004', 'cooling_004'), ('cooling', 'DB010', 'cooling_010'))
+    for key, des_key, col in col_keys:
+        if des_key in design_conditions.get(key, {}):
+            value = design_conditions[key][des_key]
+            if isinstance(value, float):
+                row[col] = value
+
+
+def _to_float(value):
+    """Convert a value of an ASHRAE design dictionary to a float if possible."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
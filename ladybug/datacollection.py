@@ -34,9 +34,12 @@ from __future__ import division
 from ._datacollectionbase import BaseCollection
 from .header import Header
 from .analysisperiod import AnalysisPeriod
-from .dt import DateTime
+from .dt import DateTime, moys_to_month_day_hour, moys_to_doys, doys_to_months, \
+    _MINUTES_UNTIL_MONTH, _MINUTES_UNTIL_MONTH_LEAP, _moy_to_array, _array_to_moy
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from math import fsum
+from array import array
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -46,6 +49,11 @@ try:
 except ImportError:
     xrange = range  # python 3
 
+try:
+    import numpy
+except ImportError:  # numpy is not installed (eg. IronPython)
+    numpy = None
+
 
 class HourlyDiscontinuousCollection(BaseCollection):
     """Discontinuous Data Collection at hourly or sub-hourly intervals.
@@ -88,8 +96,11 @@ class HourlyDiscontinuousCollection(BaseCollection):
 
         self._header = header
         self._datetimes = tuple(datetimes)
+        self._moys = None
+        self._leap_year = None
         self.values = values
         self._validated_a_period = False
+        self._moy_index = None
 
     @classmethod
     def from_dict(cls, data):
@@ -111,12 +122,54 @@ class HourlyDiscontinuousCollection(BaseCollection):
         assert 'header' in data, 'Required keyword "header" is missing!'
         assert 'values' in data, 'Required keyword "values" is missing!'
         assert 'datetimes' in data, 'Required keyword "datetimes" is missing!'
-        collection = cls(Header.from_dict(data['header']), data['values'],
-                         [DateTime.from_array(dat) for dat in data['datetimes']])
+        dt_arrays = data['datetimes']
+        leap_year = len(dt_arrays) > 0 and len(dt_arrays[0]) > 4 and \
+            bool(dt_arrays[0][4])
+        collection = cls._from_moys(
+            Header.from_dict(data['header']), data['values'],
+            array('i', (_array_to_moy(dat) for dat in dt_arrays)), leap_year)
         if 'validated_a_period' in data:
             collection._validated_a_period = data['validated_a_period']
         return collection
 
+    @classmethod
+    def _from_moys(cls, header, values, moys, leap_year=False):
+        """Create a Data Collection from minutes of the year instead of datetimes.
+
+        Args:
+            header: A Ladybug Header object.
+            values: A list of values.
+            moys: An array of integers for the minutes of the year of each value.
+                This array is stored on the collection without being copied.
+            leap_year: Boolean to note whether the moys are a part of a leap year.
+        """
+        assert len(values) == len(moys), \
+            'Length of values list must match length of datetimes list. ' \
+            '{} != {}'.format(len(values), len(moys))
+        assert len(values) > 0, 'Data Collection must include at least one value'
+        collection = cls.__new__(cls)
+        collection._header = header
+        collection._datetimes = None
+        collection._moys = moys
+        collection._leap_year = leap_year
+        collection._values = collection._backend_values(values)
+        collection._validated_a_period = False
+        collection._moy_index = None
+        return collection
+
+    @property
+    def datetimes(self):
+        """Get a tuple of datetimes for this collection, which align with the values.
+
+        Collections that are derived from other collections (eg. by filtering)
+        store only the minutes of the year of their values and the datetimes
+        are built the first time that they are requested.
+        """
+        if self._datetimes is None:
+            self._datetimes = tuple(
+                DateTime.from_moy(moy, self._leap_year) for moy in self._moys)
+        return self._datetimes
+
     @property
     def timestep_text(self):
         """Return a text string representing the timestep of the collection."""
@@ -132,10 +185,49 @@ class HourlyDiscontinuousCollection(BaseCollection):
         This is useful for aligning the values with another list of datetimes.
         """
         moy_dict = {}
-        for val, dt in zip(self.values, self.datetimes):
-            moy_dict[dt.moy] = val
+        for val, moy in zip(self._values_list(), self._get_moys()):
+            moy_dict[moy] = val
         return moy_dict
 
+    def filter_by_conditional_statement(self, statement):
+        """Filter the Data Collection based on a conditional statement.
+
+        Args:
+            statement: A conditional statement as a string (e.g. a > 25 and a%5 == 0).
+                The variable should always be named as 'a' (without quotations).
+
+        Returns:
+            A new Data Collection containing only the filtered data
+        """
+        _filt_values, _filt_moys = self._filter_by_statement(statement, self._get_moys())
+        try:
+            collection = HourlyDiscontinuousCollection._from_moys(
+                self.header.duplicate(), _filt_values, array('i', _filt_moys),
+                self._get_leap_year())
+        except AssertionError as e:
+            raise AssertionError('No value meets the conditional statement.'
+                                 '\n{}'.format(e))
+        collection._validated_a_period = self._validated_a_period
+        return collection
+
+    def filter_by_pattern(self, pattern):
+        """Filter the Data Collection based on a list of booleans.
+
+        Args:
+            pattern: A list of True/False values.  Typically, this is a list
+                with a length matching the length of the Data Collections values
+                but it can also be a pattern to be repeated over the Data Collection.
+
+        Returns:
+            A new Data Collection with filtered data
+        """
+        _filt_values, _filt_moys = self._filter_by_pattern(pattern, self._get_moys())
+        collection = HourlyDiscontinuousCollection._from_moys(
+            self.header.duplicate(), _filt_values, array('i', _filt_moys),
+            self._get_leap_year())
+        collection._validated_a_period = self._validated_a_period
+        return collection
+
     def filter_by_analysis_period(self, analysis_period):
         """Filter a Data Collection based on an analysis period.
 
@@ -171,9 +263,17 @@ class HourlyDiscontinuousCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
-        _filt_values, _filt_datetimes = self._filter_by_moys_slow(moys)
-        collection = HourlyDiscontinuousCollection(
-            self.header.duplicate(), _filt_values, _filt_datetimes)
+        moy_index = self._get_moy_index()
+        if moy_index is None:  # duplicate datetimes; use the method that always works
+            _filt_values, _filt_moys = self._filter_by_moys_slow(moys)
+        else:
+            _filt_indices = sorted(
+                moy_index[moy] for moy in set(moys) if moy in moy_index)
+            _filt_values = [self._values[i] for i in _filt_indices]
+            _moys = self._get_moys()
+            _filt_moys = array('i', (_moys[i] for i in _filt_indices))
+        collection = HourlyDiscontinuousCollection._from_moys(
+            self.header.duplicate(), _filt_values, _filt_moys, self._get_leap_year())
         collection._validated_a_period = self._validated_a_period
         return collection
 
@@ -185,8 +285,8 @@ class HourlyDiscontinuousCollection(BaseCollection):
         data_by_day = OrderedDict()
         for d in xrange(1, 366):
             data_by_day[d] = []
-        for v, dt in zip(self._values, self.datetimes):
-            data_by_day[dt.doy].append(v)
+        for v, doy in zip(self._values, moys_to_doys(self._get_moys())):
+            data_by_day[doy].append(v)
         return data_by_day
 
     def average_daily(self):
@@ -214,8 +314,9 @@ class HourlyDiscontinuousCollection(BaseCollection):
         data_by_month = OrderedDict()
         for d in xrange(1, 13):
             data_by_month[d] = []
-        for v, dt in zip(self._values, self.datetimes):
-            data_by_month[dt.month].append(v)
+        months, _, _ = moys_to_month_day_hour(self._get_moys(), self._get_leap_year())
+        for v, month in zip(self._values, months):
+            data_by_month[month].append(v)
         return data_by_month
 
     def average_monthly(self):
@@ -253,8 +354,10 @@ class HourlyDiscontinuousCollection(BaseCollection):
                 float_hr = h / t_step
                 hr, mi = int(float_hr), int((h % t_step) * (60 / t_step))
                 data_by_month_per_hour[(m, hr, mi)] = []
-        for v, dt in zip(self.values, self.datetimes):
-            data_by_month_per_hour[(dt.month, dt.hour, dt.minute)].append(v)
+        moys = self._get_moys()
+        months, _, hours = moys_to_month_day_hour(moys, self._get_leap_year())
+        for v, month, hour, moy in zip(self.values, months, hours, moys):
+            data_by_month_per_hour[(month, hour, moy % 60)].append(v)
         return data_by_month_per_hour
 
     def average_monthly_per_hour(self):
@@ -274,6 +377,56 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('monthlyperhour', 'percentile', percentile)
 
+    def aggregate(self, interval='monthly', stats=('average',)):
+        """Get collections for several statistics over a time interval in one pass.
+
+        The values are grouped over the time interval only once and each group
+        is sorted at most once no matter how many statistics are requested.
+        So this method is much faster than calling methods like average_monthly
+        and percentile_monthly one after the other.
+
+        Args:
+            interval: Text for the time interval over which the values are
+                aggregated. Choose from: daily, monthly, monthlyperhour.
+                (Default: monthly).
+            stats: A list of text for the statistics to be computed. Choose from:
+                average, total, min, max, median or a percentile written as the
+                letter p followed by a number between 0 and 100 (eg. p10, p97.5).
+                (Default: ('average',)).
+
+        Returns:
+            A list of DailyCollections, MonthlyCollections or
+            MonthlyPerHourCollections (depending on the interval) with one
+            collection for each of the input stats in the same order.
+
+        Usage:
+
+        .. code-block:: python
+
+            low, mid, high = collection.aggregate(
+                'monthlyperhour', ['p10', 'average', 'p90'])
+        """
+        is_sorted = any(st not in ('average', 'total', 'min', 'max') for st in stats)
+        functs, operations, use_sorted = [], [], []
+        for stat in stats:
+            funct, operation = self._stat_function(stat, is_sorted)
+            functs.append(funct)
+            operations.append(operation)
+            # sums use the values in their order to match the other methods
+            use_sorted.append(is_sorted and stat not in ('average', 'total'))
+
+        data_dict, dates = self._group_by_interval(interval)
+        new_data, d_times = [[] for _ in functs], []
+        for i in dates:
+            vals = data_dict[i]
+            if vals != []:
+                sorted_vals = sorted(vals) if is_sorted else vals
+                for funct, data, srt in zip(functs, new_data, use_sorted):
+                    data.append(funct(sorted_vals if srt else vals))
+                d_times.append(i)
+        return [self._interval_collection(interval, operation, data, d_times)
+                for operation, data in zip(operations, new_data)]
+
     def interpolate_holes(self):
         """Linearly interpolate over holes in this collection to make it continuous.
 
@@ -286,31 +439,31 @@ class HourlyDiscontinuousCollection(BaseCollection):
         assert self.validated_a_period, 'validated_a_period property must be' \
             ' True to use interpolate_holes(). Run validate_analysis_period().'
         mins_per_step = int(60 / self.header.analysis_period.timestep)
-        new_datetimes = self.header.analysis_period.datetimes
+        new_moys = self.header.analysis_period.moys
+        moys = self._get_moys()
         new_values = []
 
         # if the first steps are a hole, duplicate the first value.
         i = 0
-        if new_datetimes[0] != self.datetimes[0]:
-            n_steps = int((self.datetimes[0].moy - new_datetimes[0].moy) / mins_per_step)
+        if new_moys[0] != moys[0]:
+            n_steps = int((moys[0] - new_moys[0]) / mins_per_step)
             new_values.extend([self._values[0]] * n_steps)
             i = n_steps - 1
 
         # go through the values interpolating any holes.
         for j in xrange(len(self._values)):
-            if new_datetimes[i] == self.datetimes[j]:  # there is no hole.
+            if new_moys[i] == moys[j]:  # there is no hole.
                 new_values.append(self._values[j])
                 i += 1
             else:  # there is a hole between this step and the previous step.
-                n_steps = int(
-                    (self.datetimes[j].moy - new_datetimes[i].moy) / mins_per_step)
+                n_steps = int((moys[j] - new_moys[i]) / mins_per_step)
                 intp_vals = self._xxrange(self._values[j - 1], self._values[j], n_steps)
                 new_values.extend(list(intp_vals)[1:] + [self._values[j]])
                 i += n_steps
 
         # if the last steps are a hole duplicate the last value.
-        if len(new_values) != len(new_datetimes):
-            n_steps = len(new_datetimes) - len(new_values)
+        if len(new_values) != len(new_moys):
+            n_steps = len(new_moys) - len(new_values)
             new_values.extend([self._values[-1]] * n_steps)
 
         # build the new continuous data collection.
@@ -322,11 +475,11 @@ class HourlyDiscontinuousCollection(BaseCollection):
         assert timestep in valid_s, \
             'timestep {} is not valid. Choose from: {}'.format(timestep, valid_s)
 
-        new_ap, new_values, new_datetimes = self._timestep_cull(timestep)
+        new_ap, new_values, new_moys = self._timestep_cull(timestep)
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
-        new_coll = HourlyDiscontinuousCollection(
-            new_header, new_values, new_datetimes)
+        new_coll = HourlyDiscontinuousCollection._from_moys(
+            new_header, new_values, new_moys, self._get_leap_year())
         new_coll._validated_a_period = True
         return new_coll
 
@@ -336,10 +489,13 @@ class HourlyDiscontinuousCollection(BaseCollection):
         assert timestep in valid_s, \
             'timestep {} is not valid. Choose from: {}'.format(timestep, valid_s)
 
-        new_ap, new_values, new_datetimes = self._timestep_cull(timestep)
+        new_ap, new_values, new_moys = self._timestep_cull(timestep)
+        self._leap_year = self._get_leap_year()
         self.header._analysis_period = new_ap
-        self._values = new_values
-        self._datetimes = new_datetimes
+        self._values = self._backend_values(new_values, self.backend)
+        self._datetimes = None
+        self._moys = new_moys
+        self._moy_index = None
 
     def to_time_aggregated(self):
         """Get a collection where data has been aggregated over the collection timestep.
@@ -384,77 +540,104 @@ class HourlyDiscontinuousCollection(BaseCollection):
         a_per = self.header.analysis_period
         n_ap = [a_per.st_month, a_per.st_day, a_per.st_hour, a_per.end_month,
                 a_per.end_day, a_per.end_hour, a_per.timestep, a_per.is_leap_year]
+        leap_year = self._get_leap_year()
+        moys = self._get_moys()
 
         # make sure that datetimes are all in chronological order.
-        sort_datetimes, sort_values = zip(*sorted(zip(self.datetimes, self.values)))
+        sort_moys, sort_values = zip(*sorted(zip(moys, self.values)))
         if not a_per.is_reversed and not a_per.is_annual:
-            if sort_datetimes[0].doy < a_per.st_time.doy:
-                n_ap[0] = sort_datetimes[0].month
-                n_ap[1] = sort_datetimes[0].day
-            if sort_datetimes[-1].doy > a_per.end_time.doy:
-                n_ap[3] = sort_datetimes[-1].month
-                n_ap[4] = sort_datetimes[-1].day
+            if sort_moys[0] // 1440 + 1 < a_per.st_time.doy:
+                n_ap[0], n_ap[1] = _moy_to_array(sort_moys[0], leap_year)[:2]
+            if sort_moys[-1] // 1440 + 1 > a_per.end_time.doy:
+                n_ap[3], n_ap[4] = _moy_to_array(sort_moys[-1], leap_year)[:2]
         elif a_per.is_reversed:
             last_ind = None
-            for i, date_t in enumerate(sort_datetimes):
-                last_ind = i if date_t.moy <= a_per.end_time.moy else last_ind
+            end_moy = a_per.end_time.moy
+            for i, moy in enumerate(sort_moys):
+                last_ind = i if moy <= end_moy else last_ind
             if last_ind is not None:
                 last_ind = last_ind + 1
-                sort_datetimes = sort_datetimes[last_ind:] + sort_datetimes[:last_ind]
+                sort_moys = sort_moys[last_ind:] + sort_moys[:last_ind]
                 sort_values = sort_values[last_ind:] + sort_values[:last_ind]
             # If datetimes are outside the a_period range, just make it annual.
             # There's no way to know what side of the analysis_period should be extended.
-            if sort_datetimes[0].doy > a_per.end_time.doy and \
-                    sort_datetimes[0].doy < a_per.st_time.doy:
+            st_doy = sort_moys[0] // 1440 + 1
+            if st_doy > a_per.end_time.doy and st_doy < a_per.st_time.doy:
                 n_ap[0], n_ap[1], n_ap[3], n_ap[4] = 1, 1, 12, 31
-                sort_datetimes, sort_values = zip(*sorted(zip(
-                    self.datetimes, self.values)))
+                sort_moys, sort_values = zip(*sorted(zip(moys, self.values)))
 
         # check that no hours lie outside of the analysis_period
         if not a_per.is_annual:
             if a_per.st_hour != 0:
-                for date_t in sort_datetimes:
-                    n_ap[2] = date_t.hour if date_t.hour < n_ap[2] else n_ap[2]
+                for moy in sort_moys:
+                    hour = (moy // 60) % 24
+                    n_ap[2] = hour if hour < n_ap[2] else n_ap[2]
             if a_per.end_hour != 23:
-                for date_t in sort_datetimes:
-                    n_ap[5] = date_t.hour if date_t.hour > n_ap[5] else n_ap[5]
+                for moy in sort_moys:
+                    hour = (moy // 60) % 24
+                    n_ap[5] = hour if hour > n_ap[5] else n_ap[5]
 
         # check that there are no duplicate datetimes.
-        for i in xrange(len(sort_datetimes)):
-            assert sort_datetimes[i] != sort_datetimes[i - 1], 'Duplicate datetime ' \
-                'was found in the collection: {}'.format(sort_datetimes[i])
+        for i in xrange(len(sort_moys)):
+            assert sort_moys[i] != sort_moys[i - 1], 'Duplicate datetime ' \
+                'was found in the collection: {}'.format(
+                    DateTime.from_moy(sort_moys[i], leap_year))
 
         # check that the analysis_period timestep is correct.
         mins_per_step = int(60 / n_ap[6])
-        for date_t in sort_datetimes:
-            if date_t.moy % mins_per_step != 0:
+        for moy in sort_moys:
+            if moy % mins_per_step != 0:
                 i = 0
                 valid_steps = sorted(a_per.VALIDTIMESTEPS.keys())
-                while date_t.moy % mins_per_step != 0 and i < len(valid_steps):
+                while moy % mins_per_step != 0 and i < len(valid_steps):
                     mins_per_step = int(60 / valid_steps[i])
                     i += 1
                 n_ap[6] = int(60 / mins_per_step)
 
         # check that the analysis_period leap_year is correct.
-        if not a_per.is_leap_year:
-            for date_t in sort_datetimes:
-                if date_t.month == 2 and date_t.day == 29:
+        if not a_per.is_leap_year and leap_year:
+            feb_29 = _MINUTES_UNTIL_MONTH_LEAP[2] - 1440
+            for moy in sort_moys:
+                if feb_29 <= moy < _MINUTES_UNTIL_MONTH_LEAP[2]:
                     n_ap[7] = True
 
         # build a validated collection.
         new_ap = AnalysisPeriod(*n_ap)
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
-        new_coll = HourlyDiscontinuousCollection(new_header, sort_values, sort_datetimes)
+        new_coll = HourlyDiscontinuousCollection._from_moys(
+            new_header, sort_values, array('i', sort_moys), leap_year)
         new_coll._validated_a_period = True
         return new_coll
 
+    def is_collection_aligned(self, data_collection):
+        """Check if this Data Collection is aligned with another.
+
+        Aligned Data Collections are of the same Data Collection class, have the
+        same number of values and have matching datetimes.
+
+        Args:
+            data_collection: The Data Collection which you want to test if this
+                collection is aligned with.
+
+        Returns:
+            True if collections are aligned, False if not aligned
+        """
+        if self._collection_type != data_collection._collection_type:
+            return False
+        elif len(self) != len(data_collection):
+            return False
+        elif self._get_leap_year() != data_collection._get_leap_year():
+            return False
+        return self._get_moys() == data_collection._get_moys()
+
     def to_dict(self):
         """Convert Data Collection to a dictionary."""
+        leap_year = self._get_leap_year()
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
-            'datetimes': [dat.to_array() for dat in self.datetimes],
+            'values': self._values_list(),
+            'datetimes': [_moy_to_array(moy, leap_year) for moy in self._get_moys()],
             'validated_a_period': self._validated_a_period,
             'type': self.__class__.__name__
         }
@@ -464,30 +647,69 @@ class HourlyDiscontinuousCollection(BaseCollection):
         _step = (end - start) / float(step_count)
         return (start + (i * _step) for i in xrange(int(step_count)))
 
+    def _get_moys(self):
+        """Get an array of integers for the minutes of the year of the values."""
+        if self._moys is None:
+            mins_until_month = _MINUTES_UNTIL_MONTH_LEAP if self._get_leap_year() \
+                else _MINUTES_UNTIL_MONTH
+            self._moys = array('i', [
+                mins_until_month[dt.month - 1] + (dt.day - 1) * 1440 +
+                dt.hour * 60 + dt.minute for dt in self._datetimes])
+        return self._moys
+
+    def _get_leap_year(self):
+        """Get a boolean for whether the datetimes are a part of a leap year."""
+        if self._leap_year is None:
+            self._leap_year = any(dt.leap_year for dt in self._datetimes)
+        return self._leap_year
+
+    def _new_collection(self, col_obj, header, values):
+        """Get a new collection of a given class with the same datetimes as this one."""
+        if self._datetimes is not None:
+            return col_obj(header, values, self._datetimes)
+        return col_obj._from_moys(header, values, self._moys, self._leap_year)
+
+    def _get_moy_index(self):
+        """Get a dictionary that maps the moys of the datetimes to their indices.
+
+        The dictionary is built the first time that it is requested and it is
+        then cached on the collection. None will be returned if the collection
+        has duplicate datetimes, which cannot be mapped to a single index.
+        """
+        moy_index = getattr(self, '_moy_index', None)
+        if moy_index is None:
+            moys = self._get_moys()
+            moy_index = {moy: i for i, moy in enumerate(moys)}
+            if len(moy_index) != len(moys):
+                return None
+            self._moy_index = moy_index
+        return moy_index
+
     def _filter_by_moys_slow(self, moys):
         """Filter the Data Collection with a slow method that always works."""
         _filt_values = []
-        _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d.moy in moys:
-                _filt_datetimes.append(d)
+        _filt_moys = array('i')
+        moys = set(moys)
+        for i, moy in enumerate(self._get_moys()):
+            if moy in moys:
+                _filt_moys.append(moy)
                 _filt_values.append(self._values[i])
-        return _filt_values, _filt_datetimes
+        return _filt_values, _filt_moys
 
     def _timestep_cull(self, timestep):
         """Cull out values that do not fit a timestep."""
         new_values = []
-        new_datetimes = []
+        new_moys = array('i')
         mins_per_step = int(60 / timestep)
-        for i, date_t in enumerate(self.datetimes):
-            if date_t.moy % mins_per_step == 0:
-                new_datetimes.append(date_t)
-                new_values.append(self.values[i])
+        for val, moy in zip(self.values, self._get_moys()):
+            if moy % mins_per_step == 0:
+                new_moys.append(moy)
+                new_values.append(val)
         a_per = self.header.analysis_period
         new_ap = AnalysisPeriod(a_per.st_month, a_per.st_day, a_per.st_hour,
                                 a_per.end_month, a_per.end_day, a_per.end_hour,
                                 timestep, a_per.is_leap_year)
-        return new_ap, new_values, new_datetimes
+        return new_ap, new_values, new_moys
 
     def _check_analysis_period(self, analysis_period):
         assert self.header.analysis_period.timestep == analysis_period.timestep,\
@@ -512,17 +734,7 @@ class HourlyDiscontinuousCollection(BaseCollection):
             funct = self._get_percentile_function(percentile)
 
         # retrive the data that correctly describes the time interval
-        if interval == 'monthly':
-            data_dict = self.group_by_month()
-            dates = self.header.analysis_period.months_int
-        elif interval == 'daily':
-            data_dict = self.group_by_day()
-            dates = self.header.analysis_period.doys_int
-        elif interval == 'monthlyperhour':
-            data_dict = self.group_by_month_per_hour()
-            dates = self.header.analysis_period.months_per_hour
-        else:
-            raise ValueError('Invalid input value for interval: {}'.format(interval))
+        data_dict, dates = self._group_by_interval(interval)
         # get the data and header for the new collection
         new_data, d_times = [], []
         for i in dates:
@@ -530,20 +742,32 @@ class HourlyDiscontinuousCollection(BaseCollection):
             if vals != []:
                 new_data.append(funct(vals))
                 d_times.append(i)
-        new_header = self.header.duplicate()
         if operation == 'percentile':
-            new_header.metadata['operation'] = '{} percentile'.format(percentile)
-        else:
-            new_header.metadata['operation'] = operation
+            operation = '{} percentile'.format(percentile)
+        return self._interval_collection(interval, operation, new_data, d_times)
 
-        # build the final data collection
+    def _group_by_interval(self, interval):
+        """Get a dictionary of values grouped by a time interval and the interval keys.
+        """
         if interval == 'monthly':
-            collection = MonthlyCollection(new_header, new_data, d_times)
+            return self.group_by_month(), self.header.analysis_period.months_int
         elif interval == 'daily':
-            collection = DailyCollection(new_header, new_data, d_times)
+            return self.group_by_day(), self.header.analysis_period.doys_int
         elif interval == 'monthlyperhour':
-            collection = MonthlyPerHourCollection(new_header, new_data, d_times)
+            return self.group_by_month_per_hour(), \
+                self.header.analysis_period.months_per_hour
+        raise ValueError('Invalid input value for interval: {}'.format(interval))
 
+    def _interval_collection(self, interval, operation, values, d_times):
+        """Build a collection of a certain time interval from aggregated values."""
+        new_header = self.header.duplicate()
+        new_header.metadata['operation'] = operation
+        if interval == 'monthly':
+            collection = MonthlyCollection(new_header, values, d_times)
+        elif interval == 'daily':
+            collection = DailyCollection(new_header, values, d_times)
+        elif interval == 'monthlyperhour':
+            collection = MonthlyPerHourCollection(new_header, values, d_times)
         collection._validated_a_period = True
         return collection
 
@@ -683,6 +907,84 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         _new_header._analysis_period = _new_a_per
         return HourlyContinuousCollection(_new_header, _new_values)
 
+    def rolling_sum(self, window):
+        """Get a collection with the sum of values over a trailing window of hours.
+
+        Annual collections wrap around the year such that the first values include
+        the last hours of the year. For other collections, the windows of the
+        first values only include the values since the start of the collection.
+
+        Args:
+            window: A number for the hours in the window, which will be multiplied
+                by the analysis_period timestep to get the number of values in
+                each window (eg. a window of 3 at timestep 4 includes 12 values).
+        """
+        values, steps, lead = self._rolling_values(window)
+        sums = self._rolling_sums(values, steps)
+        return self._rolling_collection(sums[lead:])
+
+    def rolling_mean(self, window):
+        """Get a collection with the mean of values over a trailing window of hours.
+
+        Annual collections wrap around the year such that the first values include
+        the last hours of the year. For other collections, the windows of the
+        first values only include the values since the start of the collection.
+
+        Args:
+            window: A number for the hours in the window, which will be multiplied
+                by the analysis_period timestep to get the number of values in
+                each window (eg. a window of 3 at timestep 4 includes 12 values).
+        """
+        values, steps, lead = self._rolling_values(window)
+        sums = self._rolling_sums(values, steps)
+        means = [total / min(i + 1, steps) for i, total in enumerate(sums)]
+        return self._rolling_collection(means[lead:])
+
+    def rolling_min(self, window):
+        """Get a collection with the minimum value over a trailing window of hours.
+
+        Args:
+            window: A number for the hours in the window, which will be multiplied
+                by the analysis_period timestep to get the number of values in
+                each window. Annual collections wrap around the year.
+        """
+        return self._rolling_extreme(window, lambda new, old: new <= old)
+
+    def rolling_max(self, window):
+        """Get a collection with the maximum value over a trailing window of hours.
+
+        Args:
+            window: A number for the hours in the window, which will be multiplied
+                by the analysis_period timestep to get the number of values in
+                each window. Annual collections wrap around the year.
+        """
+        return self._rolling_extreme(window, lambda new, old: new >= old)
+
+    def exponential_moving_average(self, alpha):
+        """Get a collection with an exponentially weighted moving average of values.
+
+        Each value of the result is alpha * value + (1 - alpha) * previous_average.
+        For annual collections, the average at the start of the year is initialized
+        from a pass over the whole year such that the result wraps around the year.
+        Otherwise, the first average is the first value of the collection.
+
+        Args:
+            alpha: A number between 0 and 1 for the weight of the newest value.
+                The weight of each value decays with the number of values since
+                it, so alpha should account for the analysis_period timestep.
+        """
+        assert 0 < alpha <= 1, 'alpha must be between 0 and 1. Got {}'.format(alpha)
+        values = self._values_list()
+        average = values[0]
+        if self.header.analysis_period.is_annual:
+            for val in values:  # warm up with the whole year to wrap around
+                average = alpha * val + (1 - alpha) * average
+        averages = []
+        for val in values:
+            average = alpha * val + (1 - alpha) * average
+            averages.append(average)
+        return self._rolling_collection(averages)
+
     def filter_by_conditional_statement(self, statement):
         """Filter the Data Collection based on a conditional statement.
 
@@ -693,9 +995,10 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         Return:
             A new Data Collection containing only the filtered data
         """
-        _filt_values, _filt_datetimes = self._filter_by_statement(statement)
-        collection = HourlyDiscontinuousCollection(
-            self.header.duplicate(), _filt_values, _filt_datetimes)
+        _filt_values, _filt_moys = self._filter_by_statement(statement, self._get_moys())
+        collection = HourlyDiscontinuousCollection._from_moys(
+            self.header.duplicate(), _filt_values, array('i', _filt_moys),
+            self._get_leap_year())
         collection._validated_a_period = True
         return collection
 
@@ -710,9 +1013,10 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         Return:
             A new Data Collection with filtered data
         """
-        _filt_values, _filt_datetimes = self._filter_by_pattern(pattern)
-        collection = HourlyDiscontinuousCollection(
-            self.header.duplicate(), _filt_values, _filt_datetimes)
+        _filt_values, _filt_moys = self._filter_by_pattern(pattern, self._get_moys())
+        collection = HourlyDiscontinuousCollection._from_moys(
+            self.header.duplicate(), _filt_values, array('i', _filt_moys),
+            self._get_leap_year())
         collection._validated_a_period = True
         return collection
 
@@ -736,13 +1040,9 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             end_ind = int((analysis_period.end_time.moy / t_s) -
                           (analysis_period.st_time.moy / t_s) + st_ind +
                           analysis_period.timestep)
-            if end_ind > st_ind:
-                _filt_values = self._values[st_ind:end_ind]
-            else:
-                _filt_values = self._values[st_ind:] + self._values[:end_ind]
             _filt_header = self.header.duplicate()
             _filt_header._analysis_period = analysis_period
-            return HourlyContinuousCollection(_filt_header, _filt_values)
+            return self._slice_collection(_filt_header, st_ind, end_ind)
         else:
             # Filter using  HOYs and the result cannot be continuous
             _filtered_data = self.filter_by_moys(analysis_period.moys)
@@ -758,7 +1058,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         Return:
             A new Data Collection with filtered data
         """
-        existing_hoys = self.header.analysis_period.hoys
+        existing_hoys = set(self.header.analysis_period.hoys)
         hoys = [h for h in hoys if h in existing_hoys]
         _moys = tuple(int(hour * 60) for hour in hoys)
         return self.filter_by_moys(_moys)
@@ -790,9 +1090,11 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
                     _filt_indices.append(int(ind + eoy_ind))
 
         _filt_values = [self._values[i] for i in _filt_indices]
-        _filt_datetimes = [self.datetimes[i] for i in _filt_indices]
+        _moys = self._get_moys()
+        _filt_moys = array('i', (_moys[i] for i in _filt_indices))
         _filt_header = self.header.duplicate()
-        coll = HourlyDiscontinuousCollection(_filt_header, _filt_values, _filt_datetimes)
+        coll = HourlyDiscontinuousCollection._from_moys(
+            _filt_header, _filt_values, _filt_moys, self._get_leap_year())
         coll._validated_a_period = True
         return coll
 
@@ -804,22 +1106,22 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         hourly_data_by_day = OrderedDict()
         for d in xrange(1, 366):
             hourly_data_by_day[d] = []
+        values = self._values_list()
         a_per = self.header.analysis_period
         indx_per_day = 24 * a_per.timestep
-        start_doy = sum(a_per._num_of_days_each_month[:a_per.st_time.month - 1]) \
-            + a_per.st_time.day
+        start_doy = a_per.st_time.doy
         if not a_per.is_reversed:
-            for i in range(0, len(self._values), indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+            for i in range(0, len(values), indx_per_day):
+                hourly_data_by_day[start_doy] = values[i:i + indx_per_day]
                 start_doy += 1
         else:
             end_ind = 24 * a_per.timestep * (365 - start_doy)
             for i in range(0, end_ind + 1, indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+                hourly_data_by_day[start_doy] = values[i:i + indx_per_day]
                 start_doy += 1
             start_doy = 1
-            for i in range(end_ind, len(self._values), indx_per_day):
-                hourly_data_by_day[start_doy] = self._values[i:i + indx_per_day]
+            for i in range(end_ind, len(values), indx_per_day):
+                hourly_data_by_day[start_doy] = values[i:i + indx_per_day]
                 start_doy += 1
         return hourly_data_by_day
 
@@ -832,19 +1134,20 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         for d in xrange(1, 13):
             hourly_data_by_month[d] = []
 
+        values = self._values_list()
         a_per = self.header.analysis_period
         a_per_months = a_per.months_int
         indx = 24 * a_per.timestep * abs(
             a_per.st_day - 1 - a_per._num_of_days_each_month[a_per_months[0] - 1])
-        hourly_data_by_month[a_per_months[0]] = self._values[0:indx + 1]
+        hourly_data_by_month[a_per_months[0]] = values[0:indx + 1]
 
         if len(a_per_months) > 1:
             for mon in a_per_months[1:]:
                 interval = a_per._num_of_days_each_month[mon - 1] * 24 * a_per.timestep
                 try:
-                    hourly_data_by_month[mon] = self._values[indx:indx + interval + 1]
+                    hourly_data_by_month[mon] = values[indx:indx + interval + 1]
                 except IndexError:
-                    hourly_data_by_month[mon] = self._values[indx:]  # last items
+                    hourly_data_by_month[mon] = values[indx:]  # last items
                 indx += interval
         return hourly_data_by_month
 
@@ -853,11 +1156,16 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         if self._enumeration is None:
             self._get_mutable_enumeration()
         col_obj = self._enumeration['immutable'][self._collection_type]
-        return col_obj(self.header, self.values)
+        return self._shared_collection(col_obj, self.header.duplicate())
 
     def duplicate(self):
-        """Return a copy of the current Data Collection."""
-        return self.__class__(self.header.duplicate(), list(self._values))
+        """Return a copy of the current Data Collection.
+
+        The copy shares the values of this collection until either of the two
+        collections sets one of its values, at which point that collection gets
+        its own copy of the values.
+        """
+        return self._shared_collection(self.__class__, self.header.duplicate())
 
     def get_aligned_collection(self, value=0, data_type=None, unit=None, mutable=None):
         """Return a Collection aligned with this one composed of one repeated value.
@@ -937,10 +1245,118 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._values_list(),
             'type': self.__class__.__name__
         }
 
+    def _rolling_values(self, window):
+        """Get values for rolling window operations.
+
+        Returns:
+            A tuple with three elements
+
+            -   values: A list of the values, which starts with the end of the
+                year if the collection is annual.
+
+            -   steps: An integer for the number of values in each window.
+
+            -   lead: An integer for the number of values from the end of the
+                year at the start of the values.
+        """
+        steps = int(round(window * self.header.analysis_period.timestep))
+        assert steps >= 1, 'Rolling window must include at least one value. ' \
+            'Got {} hours at timestep {}.'.format(
+                window, self.header.analysis_period.timestep)
+        values = list(self._values_list())
+        steps = min(steps, len(values))
+        if not self.header.analysis_period.is_annual or steps == 1:
+            return values, steps, 0
+        lead = steps - 1
+        return values[-lead:] + values, steps, lead
+
+    @staticmethod
+    def _rolling_sums(values, steps):
+        """Get the sums of values over trailing windows of a number of steps.
+
+        The running sum is stored as a list of non-overlapping partials (as in
+        math.fsum) such that adding and removing values from the window is exact
+        and each window sum is correctly rounded. So the sums do not drift over
+        the values and windows of zeros always sum to exactly zero.
+        """
+        partials, sums = [], []
+        for i, val in enumerate(values):
+            for x in ((val, -values[i - steps]) if i >= steps else (val,)):
+                j = 0
+                for y in partials:
+                    if abs(x) < abs(y):
+                        x, y = y, x
+                    hi = x + y
+                    lo = y - (hi - x)
+                    if lo:
+                        partials[j] = lo
+                        j += 1
+                    x = hi
+                partials[j:] = [x]
+            sums.append(fsum(partials))
+        return sums
+
+    def _rolling_extreme(self, window, replaces):
+        """Get a collection of rolling extremes using a monotonic deque of indices.
+
+        Args:
+            window: A number for the hours in the window.
+            replaces: A function that takes a new value and an older value and
+                returns True if the new value makes the older one irrelevant.
+        """
+        values, steps, lead = self._rolling_values(window)
+        extremes, indices = [], deque()
+        for i, val in enumerate(values):
+            while indices and replaces(val, values[indices[-1]]):
+                indices.pop()
+            indices.append(i)
+            if indices[0] <= i - steps:
+                indices.popleft()
+            extremes.append(values[indices[0]])
+        return self._rolling_collection(extremes[lead:])
+
+    def _rolling_collection(self, values):
+        """Get a collection aligned with this one from rolling window values."""
+        return self.__class__(self.header.duplicate(), values)
+
+    def _slice_collection(self, header, st_ind, end_ind):
+        """Get a continuous collection over a slice of the values of this one.
+
+        Slices of NumPy values are views that share memory with this collection
+        until either collection changes them (copy-on-write). Other values are
+        copied once. An end index before the start index wraps around the end
+        of the values, as it does for reversed analysis periods.
+
+        Args:
+            header: The header of the new collection, which has an analysis
+                period that matches the slice.
+            st_ind: Integer for the index of the first value of the slice.
+            end_ind: Integer for the index after the last value of the slice.
+        """
+        values = self._values
+        if end_ind > st_ind:
+            _filt_values = values[st_ind:end_ind]
+        elif self._is_vectorized:
+            _filt_values = numpy.concatenate((values[st_ind:], values[:end_ind]))
+        else:
+            _filt_values = values[st_ind:] + values[:end_ind]
+        if isinstance(_filt_values, tuple):
+            _filt_values = list(_filt_values)
+        collection = HourlyContinuousCollection.__new__(HourlyContinuousCollection)
+        collection._header = header
+        collection._values = _filt_values
+        collection._datetimes = None
+        collection._validated_a_period = True
+        collection._values_shared = self._is_vectorized and \
+            _filt_values.base is not None
+        if collection._values_shared and self._mutable:
+            self._values_shared = True
+        return collection
+
     def _get_analysis_period_subset(self, a_per):
         """Return an analysis_period is always a subset of the Data Collection"""
         if self.header.analysis_period.is_annual:
@@ -968,6 +1384,14 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             return a_per
         return AnalysisPeriod(*n_ap)
 
+    def _get_moys(self):
+        """Get an array of integers for the minutes of the year of the values."""
+        return array('i', self.header.analysis_period.moys)
+
+    def _get_leap_year(self):
+        """Get a boolean for whether the datetimes are a part of a leap year."""
+        return self.header.analysis_period.is_leap_year
+
     def _check_values(self, values):
         """Check values whenever they come through the values setter."""
         assert isinstance(values, Iterable) and not isinstance(
@@ -982,33 +1406,26 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Boolean denoting whether the data collection is continuous."""
         return True
 
-    def __add__(self, other):
-        new_vals = self._add_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __sub__(self, other):
-        new_vals = self._sub_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __mul__(self, other):
-        new_vals = self._mul_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __div__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals)
+    def _new_collection(self, col_obj, header, values):
+        """Get a new collection of a given class with the same analysis period."""
+        return col_obj(header, values)
 
-    def __truediv__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
-        return self.__class__(self.header, new_vals)
+    def _operation_collection(self, values):
+        """Get a new collection like this one from the values of an operation."""
+        return self.__class__(self.header, values)
 
     def __key(self):
         return (self.header, self.values)
 
+    def __getstate__(self):
+        """Get the state to be pickled without the datetimes, which are recomputed."""
+        return (self._header, self._values, self._validated_a_period)
+
+    def __setstate__(self, state):
+        """Set the state of the collection when it is unpickled."""
+        self._header, self._values, self._validated_a_period = state
+        self._datetimes = None
+
     def __repr__(self):
         """Hourly Discontinuous Collection representation."""
         return "{} Continuous Data Collection\n{}\n{} ({})\n...{} values...".format(
@@ -1097,9 +1514,8 @@ class DailyCollection(BaseCollection):
         data_by_month = OrderedDict()
         for d in xrange(1, 13):
             data_by_month[d] = []
-        for v, doy in zip(self._values, self.datetimes):
-            dt = DateTime.from_hoy(((doy - 1) * 24) + 1)
-            data_by_month[dt.month].append(v)
+        for v, month in zip(self._values, doys_to_months(self.datetimes)):
+            data_by_month[month].append(v)
         return data_by_month
 
     def average_monthly(self):
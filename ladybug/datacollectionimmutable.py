@@ -30,14 +30,16 @@ class _ImmutableCollectionBase(object):
     @property
     def values(self):
         """The Data Collection's list of numerical values."""
-        return self._values
+        if isinstance(self._values, tuple):
+            return self._values
+        return tuple(self._values_list())
 
     @values.setter
     def values(self, values):
         if hasattr(self, '_values'):
             raise AttributeError(self._mutable_message)
         self._check_values(values)
-        self._values = tuple(values)
+        self._values = self._backend_values(values)
 
     @property
     def _mutable_message(self):
@@ -49,11 +51,8 @@ class _ImmutableCollectionBase(object):
         return self.duplicate()
 
     def duplicate(self):
-        """Get a copy of this Data Collection."""
-        collection = self.__class__(
-            self.header.duplicate(), self._values, self.datetimes)
-        collection._validated_a_period = self._validated_a_period
-        return collection
+        """Get a copy of this Data Collection, which shares its values."""
+        return self._shared_collection(self.__class__, self.header.duplicate())
 
     def __setitem__(self, key, value):
         raise AttributeError(self._mutable_message)
@@ -69,9 +68,8 @@ class HourlyDiscontinuousCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = HourlyDiscontinuousCollection(self.header, self.values, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(
+            HourlyDiscontinuousCollection, self.header.duplicate())
 
 
 class HourlyContinuousCollectionImmutable(
@@ -84,13 +82,12 @@ class HourlyContinuousCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = HourlyContinuousCollection(self.header, self.values)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(
+            HourlyContinuousCollection, self.header.duplicate())
 
     def duplicate(self):
-        """Return a copy of the current Data Collection."""
-        return self.__class__(self.header.duplicate(), self._values)
+        """Return a copy of the current Data Collection, which shares its values."""
+        return self._shared_collection(self.__class__, self.header.duplicate())
 
 
 class DailyCollectionImmutable(
@@ -99,9 +96,7 @@ class DailyCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = DailyCollection(self.header, self.values, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(DailyCollection, self.header.duplicate())
 
 
 class MonthlyCollectionImmutable(
@@ -110,9 +105,7 @@ class MonthlyCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = MonthlyCollection(self.header, self.values, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(MonthlyCollection, self.header.duplicate())
 
 
 class MonthlyPerHourCollectionImmutable(
@@ -121,6 +114,4 @@ class MonthlyPerHourCollectionImmutable(
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
-        new_obj = MonthlyPerHourCollection(self.header, self.values, self.datetimes)
-        new_obj._validated_a_period = self._validated_a_period
-        return new_obj
+        return self._shared_collection(MonthlyPerHourCollection, self.header.duplicate())
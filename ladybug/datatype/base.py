@@ -6,6 +6,11 @@ import os
 import importlib
 import re
 
+try:
+    import numpy
+except ImportError:  # numpy is not installed (eg. IronPython)
+    numpy = None
+
 
 class DataTypeBase(object):
     """Base class for data types.
@@ -43,6 +48,7 @@ class DataTypeBase(object):
     _time_aggregated_factor = None
 
     _type_enumeration = None
+    _CONVERSIONS = {}  # conversions between units shared by all data types
 
     def __init__(self, name=None):
         """Initialize DataType.
@@ -135,14 +141,8 @@ class DataTypeBase(object):
             minimum = self.min
             maximum = self.max
         else:
-            namespace = {'self': self}
-            self.is_unit_acceptable(unit, True)
-            min_statement = "self._{}_to_{}(self.min)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            max_statement = "self._{}_to_{}(self.max)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            minimum = eval(min_statement, namespace)
-            maximum = eval(max_statement, namespace)
+            minimum, maximum = self._to_unit_base(
+                self.units[0], [self.min, self.max], unit, self.units[0])
 
         for value in values:
             if value < minimum or value > maximum:
@@ -180,19 +180,87 @@ class DataTypeBase(object):
     def _to_unit_base(self, base_unit, values, unit, from_unit):
         """Return values in a given unit given the input from_unit."""
         self._is_numeric(values)
-        namespace = {'self': self, 'values': values}
+        if from_unit == base_unit and unit == base_unit:
+            return values
+        steps, functs = self._unit_conversion(base_unit, unit, from_unit)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            # unit conversions are arithmetic and so they apply to whole NumPy arrays
+            if functs is not None:
+                for funct in functs:
+                    values = funct(self, values)
+                return values
+            values = values.astype(float)  # a copy that can be changed in place
+            for operator, number in steps:
+                if operator == '+':
+                    values += number
+                elif operator == '-':
+                    values -= number
+                elif operator == '*':
+                    values *= number
+                elif operator == '/':
+                    values /= number
+                else:  # subtract the values from the number
+                    numpy.subtract(number, values, out=values)
+            return values
+        if functs is not None:
+            for funct in functs:
+                values = [funct(self, val) for val in values]
+            return values
+        if not steps:
+            return list(values)
+        for operator, number in steps:
+            if operator == '+':
+                values = [val + number for val in values]
+            elif operator == '-':
+                values = [val - number for val in values]
+            elif operator == '*':
+                values = [val * number for val in values]
+            elif operator == '/':
+                values = [val / number for val in values]
+            else:  # subtract the values from the number
+                values = [number - val for val in values]
+        return values
+
+    def _unit_conversion(self, base_unit, unit, from_unit):
+        """Get the conversion of values from one unit of this data type to another.
+
+        The conversion is built the first time that it is requested and it is then
+        cached for all data types of the same class. Conversions that are
+        arithmetic with numbers (all of those currently in Ladybug) are recorded
+        as the sequence of operations that the _X_to_Y methods of the data type
+        perform, by passing a _ConversionTerm through them. Applying the same
+        operations in the same order gives the same results as the methods.
+
+        Returns:
+            A tuple with two items. The first is a tuple of (operator, number)
+            steps for an arithmetic conversion (or None). The second is None for
+            an arithmetic conversion and a tuple of unbound _X_to_Y methods to
+            be applied in sequence for other conversions.
+        """
+        key = (self.__class__, from_unit, unit)
+        try:
+            return self._CONVERSIONS[key]
+        except KeyError:  # first conversion between these units
+            pass
+        functs = []
         if not from_unit == base_unit:
             self.is_unit_acceptable(from_unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(from_unit), self._clean(base_unit))
-            values = eval(statement, namespace)
-            namespace['values'] = values
+            functs.append(getattr(self.__class__, '_{}_to_{}'.format(
+                self._clean(from_unit), self._clean(base_unit))))
         if not unit == base_unit:
             self.is_unit_acceptable(unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(base_unit), self._clean(unit))
-            values = eval(statement, namespace)
-        return values
+            functs.append(getattr(self.__class__, '_{}_to_{}'.format(
+                self._clean(base_unit), self._clean(unit))))
+        term = _ConversionTerm(())
+        try:
+            for funct in functs:
+                term = funct(self, term)
+            arithmetic = isinstance(term, _ConversionTerm)
+        except TypeError:  # the conversion is not arithmetic with numbers
+            arithmetic = False
+        conversion = (term.steps, None) if arithmetic else (None, tuple(functs))
+        self._CONVERSIONS[key] = conversion
+        return conversion
 
     def _clean(self, unit):
         """Clean out special characters from unit abbreviations."""
@@ -338,6 +406,52 @@ class DataTypeBase(object):
         return self.name
 
 
+class _ConversionTerm(object):
+    """A record of the arithmetic with numbers that is performed on a value.
+
+    Passing this object through a unit conversion method records the operations
+    that the method performs on values as (operator, number) steps, which can be
+    applied to many values later. Operations with other than numbers raise a
+    TypeError.
+    """
+    __slots__ = ('steps',)
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def _step(self, operator, other):
+        if isinstance(other, (int, float)):
+            return _ConversionTerm(self.steps + ((operator, other),))
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._step('+', other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._step('-', other)
+
+    def __rsub__(self, other):
+        return self._step('r-', other)
+
+    def __mul__(self, other):
+        return self._step('*', other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self._step('/', other)
+
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return self._step('*', -1)
+
+    def __pos__(self):
+        return self
+
+
 class _DataTypeEnumeration(object):
     """Enumerates all data types, base types, and units."""
     _TYPES = {}
@@ -3,7 +3,7 @@ from __future__ import division
 
 from .location import Location
 from .designday import DesignDay
-from .futil import write_to_file
+from .futil import write_to_file, zip_file_members, open_zip_member
 
 import os
 import re
@@ -76,6 +76,35 @@ class DDY(object):
         else:
             ddywin = codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
 
+        cls_ = cls._from_ddy_stream(ddywin)
+        cls_._file_path = os.path.normpath(file_path)
+        return cls_
+
+    @classmethod
+    def from_zip(cls, zip_file, member=None):
+        """Initialize from a .ddy file inside a .zip file without extracting it.
+
+        Args:
+            zip_file: A string representing a complete path to a .zip file
+                containing a .ddy file.
+            member: Optional text for the name of the .ddy file inside the .zip
+                file. If None, the first .ddy file in the .zip file will be used.
+        """
+        members = zip_file_members(zip_file, '.ddy')
+        if member is None:
+            if len(members) == 0:
+                raise ValueError('No .ddy file was found in {}.'.format(zip_file))
+            member = members[0]
+        elif member not in members:
+            raise ValueError('No .ddy file named "{}" was found in {}.'.format(
+                member, zip_file))
+        cls_ = cls._from_ddy_stream(open_zip_member(zip_file, member, 'utf-8', 'ignore'))
+        cls_._file_path = os.path.normpath(zip_file)
+        return cls_
+
+    @classmethod
+    def _from_ddy_stream(cls, ddywin):
+        """Initialize from an open .ddy file, which will be closed once it is read."""
         # extract all location and design day definitions from the file
         loc_p = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
         dday_p = re.compile(r"(SizingPeriod:DesignDay,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
@@ -97,9 +126,7 @@ class DDY(object):
         finally:
             ddywin.close()
 
-        cls_ = cls(location, ddays)
-        cls_._file_path = os.path.normpath(file_path)
-        return cls_
+        return cls(location, ddays)
 
     @classmethod
     def from_design_day(cls, design_day):
@@ -7,6 +7,20 @@ from datetime import datetime, date, time
 MONTHNAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
               'Oct', 'Nov', 'Dec')
 
+# days and minutes of the year at the start of each month and at the end of the year
+_DAYS_UNTIL_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365)
+_DAYS_UNTIL_MONTH_LEAP = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366)
+_MINUTES_UNTIL_MONTH = tuple(d * 1440 for d in _DAYS_UNTIL_MONTH)
+_MINUTES_UNTIL_MONTH_LEAP = tuple(d * 1440 for d in _DAYS_UNTIL_MONTH_LEAP)
+
+# month and day of the month for each day of the year (indexed from zero)
+_MONTH_OF_DAY = tuple(m + 1 for m in range(12)
+                      for _ in range(_DAYS_UNTIL_MONTH[m + 1] - _DAYS_UNTIL_MONTH[m]))
+_MONTH_OF_DAY_LEAP = _MONTH_OF_DAY[:59] + (2,) + _MONTH_OF_DAY[59:]
+_DAY_OF_DAY = tuple(d + 1 for m in range(12)
+                    for d in range(_DAYS_UNTIL_MONTH[m + 1] - _DAYS_UNTIL_MONTH[m]))
+_DAY_OF_DAY_LEAP = _DAY_OF_DAY[:59] + (29,) + _DAY_OF_DAY[59:]
+
 
 class DateTime(datetime):
     """Create Ladybug Date time.
@@ -98,32 +112,18 @@ class DateTime(datetime):
             leap_year: Boolean to note whether the Date Time is a part of a
                 leap year. Default: False.
         """
-        if not leap_year:
-            num_of_minutes_until_month = (0, 44640, 84960, 129600, 172800, 217440,
-                                          260640, 305280, 349920, 393120, 437760,
-                                          480960, 525600)
-        else:
-            num_of_minutes_until_month = (0, 44640, 84960 + 1440, 129600 + 1440,
-                                          172800 + 1440, 217440 + 1440, 260640 + 1440,
-                                          305280 + 1440, 349920 + 1440, 393120 + 1440,
-                                          437760 + 1440, 480960 + 1440, 525600 + 1440)
-        # find month
         moy = int(moy)
-        for month_count in range(12):
-            if moy < num_of_minutes_until_month[month_count + 1]:
-                month = month_count + 1
-                break
-        try:
-            day = int((moy - num_of_minutes_until_month[month - 1]) / (60 * 24)) + 1
-        except UnboundLocalError:
+        if not -1440 < moy < (527040 if leap_year else 525600):
             raise ValueError(
                 "moy must be positive and smaller than 525600. Invalid input %d" % (moy)
             )
+        # negative moys within the first day wrap around to the end of January 1st
+        day_i = moy // 1440 if moy >= 0 else 0
+        if leap_year:
+            month, day = _MONTH_OF_DAY_LEAP[day_i], _DAY_OF_DAY_LEAP[day_i]
         else:
-            hour = int((moy / 60) % 24)
-            minute = int(moy % 60)
-
-            return cls(month, day, hour, minute, leap_year)
+            month, day = _MONTH_OF_DAY[day_i], _DAY_OF_DAY[day_i]
+        return cls(month, day, (moy // 60) % 24, moy % 60, leap_year)
 
     @classmethod
     def from_date_time_string(cls, datetime_string, leap_year=False):
@@ -199,7 +199,9 @@ class DateTime(datetime):
     @property
     def doy(self):
         """Calculate day of the year for this date time."""
-        return self.timetuple().tm_yday
+        if self.year % 4 == 0:
+            return _DAYS_UNTIL_MONTH_LEAP[self.month - 1] + self.day
+        return _DAYS_UNTIL_MONTH[self.month - 1] + self.day
 
     @property
     def hoy(self):
@@ -209,7 +211,7 @@ class DateTime(datetime):
     @property
     def moy(self):
         """Calculate minute of the year for this date time."""
-        return self.int_hoy * 60 + self.minute  # minute of the year
+        return ((self.doy - 1) * 24 + self.hour) * 60 + self.minute
 
     @property
     def float_hour(self):
@@ -421,7 +423,9 @@ class Date(date):
     @property
     def doy(self):
         """Calculate day of the year for this date."""
-        return self.timetuple().tm_yday
+        if self.year % 4 == 0:
+            return _DAYS_UNTIL_MONTH_LEAP[self.month - 1] + self.day
+        return _DAYS_UNTIL_MONTH[self.month - 1] + self.day
 
     def to_array(self):
         """Return date as an array of values."""
@@ -575,3 +579,98 @@ class Time(time):
     def __repr__(self):
         """Return time as a string."""
         return self.__str__()
+
+
+def moys_to_month_day_hour(moys, leap_year=False):
+    """Convert an array of minutes of the year to months, days and hours.
+
+    This is much faster than building a DateTime for each minute of the year.
+    The minute of the hour is not included since it is simply moy % 60.
+
+    Args:
+        moys: A list of integers for minutes of the year between 0 and 525599
+            (or 527039 for a leap year).
+        leap_year: Boolean to note whether the minutes of the year are a part
+            of a leap year. (Default: False).
+
+    Returns:
+        A tuple with three lists of integers:
+
+        -   months: The month of each minute of the year (1-12).
+
+        -   days: The day of the month of each minute of the year (1-31).
+
+        -   hours: The hour of the day of each minute of the year (0-23).
+    """
+    month_of_day = _MONTH_OF_DAY_LEAP if leap_year else _MONTH_OF_DAY
+    day_of_day = _DAY_OF_DAY_LEAP if leap_year else _DAY_OF_DAY
+    day_indices = [moy // 1440 for moy in moys]
+    months = [month_of_day[i] for i in day_indices]
+    days = [day_of_day[i] for i in day_indices]
+    hours = [(moy // 60) % 24 for moy in moys]
+    return months, days, hours
+
+
+def moys_to_doys(moys):
+    """Convert an array of minutes of the year to integer days of the year (1-366).
+
+    Args:
+        moys: A list of integers for minutes of the year.
+    """
+    return [moy // 1440 + 1 for moy in moys]
+
+
+def hoys_to_doys(hoys):
+    """Convert an array of hours of the year to integer days of the year (1-366).
+
+    Args:
+        hoys: A list of numbers for hours of the year.
+    """
+    return [int(hoy // 24) + 1 for hoy in hoys]
+
+
+def doys_to_months(doys, leap_year=False):
+    """Convert an array of integer days of the year to months of the year (1-12).
+
+    Args:
+        doys: A list of integers for days of the year between 1 and 365
+            (or 366 for a leap year).
+        leap_year: Boolean to note whether the days of the year are a part
+            of a leap year. (Default: False).
+    """
+    month_of_day = _MONTH_OF_DAY_LEAP if leap_year else _MONTH_OF_DAY
+    return [month_of_day[doy - 1] for doy in doys]
+
+
+def _moy_to_array(moy, leap_year=False):
+    """Get an array of (month, day, hour, minute) from an integer minute of the year.
+
+    The result matches DateTime.to_array() without the need to build a DateTime.
+
+    Args:
+        moy: An integer for the minute of the year.
+        leap_year: Boolean to note whether the minute is a part of a leap year.
+    """
+    day_i = moy // 1440
+    if not leap_year:
+        return (_MONTH_OF_DAY[day_i], _DAY_OF_DAY[day_i], (moy // 60) % 24, moy % 60)
+    return (_MONTH_OF_DAY_LEAP[day_i], _DAY_OF_DAY_LEAP[day_i],
+            (moy // 60) % 24, moy % 60, 1)
+
+
+def _array_to_moy(dt_array):
+    """Get an integer minute of the year from a DateTime array.
+
+    Args:
+        dt_array: An array of (month, day, hour, minute) with an optional fifth
+            value to note whether the date time is a part of a leap year.
+    """
+    leap_year = len(dt_array) > 4 and bool(dt_array[4])
+    month, day, hour, minute = dt_array[:4]
+    minutes_until_month = _MINUTES_UNTIL_MONTH_LEAP if leap_year \
+        else _MINUTES_UNTIL_MONTH
+    if not 1 <= month <= 12 or not 0 <= hour <= 23 or not 0 <= minute <= 59 or \
+            not 1 <= day <= (minutes_until_month[month] -
+                             minutes_until_month[month - 1]) // 1440:
+        raise ValueError('Invalid DateTime array: {}'.format(dt_array))
+    return minutes_until_month[month - 1] + (day - 1) * 1440 + hour * 60 + minute
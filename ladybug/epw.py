@@ -2,28 +2,44 @@
 from __future__ import division
 
 import os
+import sys
+import glob
+import json
+import struct
+import hashlib
+import mmap
+from array import array
 
 from .dt import Date
 from .analysisperiod import AnalysisPeriod
 from .datacollection import HourlyContinuousCollection
 from .datacollection import MonthlyCollection
+from .datatype.base import DataTypeBase
 from .datatype import angle, distance, energyflux, energyintensity, generic, \
     illuminance, luminance, fraction, pressure, speed, temperature
 from .designday import DesignDay
 from .ddy import DDY
-from .futil import write_to_file
+from .futil import write_to_file, preparedir, zip_file_members, open_zip_member
 from .header import Header
 from .location import Location
 from .climatezone import ashrae_climate_zone
 from .skymodel import calc_sky_temperature
 from .psychrometrics import rel_humid_from_db_dpt, wet_bulb_from_db_rh
 
-readmode = 'rb'
+readmode, writemode = 'rb', 'wb'
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
-    readmode = 'r'
+    readmode, writemode = 'r', 'w'
+try:
+    basestring  # python 2
+except NameError:
+    basestring = str  # python 3
+try:
+    import multiprocessing
+except ImportError:  # IronPython
+    multiprocessing = None
 
 
 class EPW(object):
@@ -31,6 +47,28 @@ class EPW(object):
 
     Args:
         file_path: Local file address to an .epw file.
+        fields: An optional list of integers for the numbers of the EPW fields
+            to be imported when the hourly data is loaded (eg. [6, 8] for dry bulb
+            temperature and relative humidity). Each row of the file is still
+            only tokenized once but only the requested fields are converted to
+            numbers and turned into data collections. Any other field is imported
+            later upon request, which requires another read of the file. If None,
+            all fields are imported at once. See the import_data_by_field
+            method for a list of all field numbers. (Default: None).
+        cache_folder: An optional path to a folder in which a binary version of
+            the parsed EPW will be cached. When the EPW is loaded again with the
+            same cache_folder, the data is read from the binary file, which is
+            much faster than parsing the text of the .epw file. The binary file
+            is rewritten whenever the modification time or the size of the .epw
+            file changes. If None, no cache will be used. (Default: None).
+        memory_map: Boolean to note whether the binary file in the cache_folder
+            should be memory-mapped instead of read. When True, no data collection
+            is built when the hourly data is loaded (except for requested fields)
+            and each field is only turned into a data collection when it is
+            accessed. The numbers of any field can also be read without building
+            a data collection using the field_view method. This keeps the memory
+            of each EPW small, which is useful when many EPWs are open at once.
+            This option requires a cache_folder. (Default: False).
 
     Properties:
         * location
@@ -85,12 +123,22 @@ class EPW(object):
                  '_extreme_hot_weeks', '_extreme_cold_weeks', '_typical_weeks',
                  '_monthly_ground_temps', '_is_leap_year', 'daylight_savings_start',
                  'daylight_savings_end', '_num_of_fields', 'comments_1', 'comments_2',
-                 '_location', '_header')
+                 '_location', '_header', '_field_numbers', '_cache_folder',
+                 '_memory_map', '_binary', '_binary_info', '_zip_member')
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, fields=None, cache_folder=None, memory_map=False):
         """Initialize an EPW object from from a local .epw file.
         """
         self._file_path = os.path.normpath(file_path) if file_path is not None else None
+        self._field_numbers = self._check_field_numbers(fields)
+        self._cache_folder = os.path.normpath(cache_folder) \
+            if cache_folder is not None else None
+        assert not memory_map or self._cache_folder is not None, \
+            'A cache_folder is required in order to use memory_map.'
+        self._memory_map = bool(memory_map)
+        self._binary = None  # memory-mapped binary file
+        self._binary_info = None  # dictionary of info about the memory-mapped file
+        self._zip_member = None  # name of the .epw file if file_path is a .zip file
         self._is_header_loaded = False
         self._is_data_loaded = False
         self._is_ip = False  # track if collections have been converted to IP
@@ -234,28 +282,18 @@ class EPW(object):
         epw_obj._is_header_loaded = True
         epw_obj._is_data_loaded = True
 
-        # Check required and optional keys
+        # Check required keys
         required_keys = ('location', 'data_collections')
-        option_keys_dict = ('metadata', 'heating_dict', 'cooling_dict',
-                            'extremes_dict', 'extreme_hot_weeks', 'extreme_cold_weeks',
-                            'typical_weeks', 'monthly_ground_temps')
         for key in required_keys:
             assert key in data, 'Required key "{}" is missing!'.format(key)
         assert len(data['data_collections']) == epw_obj._num_of_fields, \
             'The number of data_collections must be {}. Got {}.'.format(
                 epw_obj._num_of_fields, len(data['data_collections']))
-        for key in option_keys_dict:
-            if key not in data:
-                data[key] = {}
 
-        # Set the required properties of the EPW object.
-        epw_obj._location = Location.from_dict(data['location'])
+        # Set the properties of the EPW object.
+        epw_obj._header_from_dict(data)
         epw_obj._data = [HourlyContinuousCollection.from_dict(dc)
                          for dc in data['data_collections']]
-        if 'is_leap_year' in data:
-            epw_obj._is_leap_year = data['is_leap_year']
-        if 'is_ip' in data:
-            epw_obj._is_ip = data['is_ip']
 
         # Check that the required properties all make sense.
         for dc in epw_obj._data:
@@ -266,32 +304,65 @@ class EPW(object):
             assert dc.header.analysis_period.is_leap_year == epw_obj._is_leap_year, \
                 'data_collections is_leap_year is not aligned with that of the EPW.'
 
-        # Set all of the header properties if they exist in the dictionary.
-        epw_obj._metadata = data['metadata']
-        epw_obj.heating_design_condition_dictionary = data['heating_dict']
-        epw_obj.cooling_design_condition_dictionary = data['cooling_dict']
-        epw_obj.extreme_design_condition_dictionary = data['extremes_dict']
+        return epw_obj
 
-        def _dedict(parent_dict, obj):
-            new_dict = {}
-            for key, val in parent_dict.items():
-                new_dict[key] = obj.from_dict(val)
-            return new_dict
-        epw_obj.extreme_hot_weeks = _dedict(data['extreme_hot_weeks'], AnalysisPeriod)
-        epw_obj.extreme_cold_weeks = _dedict(data['extreme_cold_weeks'], AnalysisPeriod)
-        epw_obj.typical_weeks = _dedict(data['typical_weeks'], AnalysisPeriod)
-        epw_obj.monthly_ground_temperature = _dedict(
-            data['monthly_ground_temps'], MonthlyCollection)
+    @classmethod
+    def from_zip(cls, zip_file, member=None, fields=None):
+        """Create EPW from an .epw file inside a .zip file without extracting it.
 
-        if 'daylight_savings_start' in data:
-            epw_obj.daylight_savings_start = data['daylight_savings_start']
-        if 'daylight_savings_end' in data:
-            epw_obj.daylight_savings_end = data['daylight_savings_end']
-        if 'comments_1' in data:
-            epw_obj.comments_1 = data['comments_1']
-        if 'comments_2' in data:
-            epw_obj.comments_2 = data['comments_2']
+        The .epw file is decompressed as it is parsed. Like any EPW, the header
+        and the hourly data are only parsed when they are first requested.
 
+        Args:
+            zip_file: Full path to a .zip file containing an .epw file.
+            member: Optional text for the name of the .epw file inside the .zip
+                file. If None, the first .epw file in the .zip file will be used.
+            fields: An optional list of integers for the numbers of the EPW fields
+                to be imported. See the fields argument of the EPW. (Default: None).
+        """
+        members = zip_file_members(zip_file, '.epw')
+        if member is None:
+            if len(members) == 0:
+                raise ValueError('No .epw file was found in {}.'.format(zip_file))
+            member = members[0]
+        elif member not in members:
+            raise ValueError('No .epw file named "{}" was found in {}.'.format(
+                member, zip_file))
+        epw_obj = cls(zip_file, fields)
+        epw_obj._zip_member = member
+        return epw_obj
+
+    @classmethod
+    def from_binary(cls, file_path, memory_map=False):
+        """Create EPW from a binary file written with the EPW.to_binary method.
+
+        Args:
+            file_path: Full path to a binary file written with EPW.to_binary.
+            memory_map: Boolean to note whether the binary file should be
+                memory-mapped instead of read. When True, each field is only
+                turned into a data collection when it is accessed and the
+                field_view method can be used to read the numbers of a
+                field without building a data collection. (Default: False).
+        """
+        epw_obj = cls(None)
+        binf, info = _open_binary(file_path, memory_map)
+        try:
+            if info['source'] is not None:
+                epw_obj._file_path = os.path.normpath(info['source']['file_path'])
+            epw_obj._is_header_loaded = True
+            epw_obj._header_from_dict(info['epw'])
+            epw_obj._num_of_fields = len(info['columns'])
+            epw_obj._data = [None] * epw_obj._num_of_fields
+            if memory_map:
+                epw_obj._memory_map = True
+                epw_obj._binary, epw_obj._binary_info = binf, info
+            else:
+                epw_obj._import_binary_fields(
+                    binf, info, xrange(epw_obj._num_of_fields))
+        finally:
+            if epw_obj._binary is None:
+                binf.close()
+        epw_obj._is_data_loaded = True
         return epw_obj
 
     @property
@@ -343,7 +414,9 @@ class EPW(object):
             'must be a dictionary. Got {}.'.format(type(meta_d))
         self._metadata = meta_d
         for coll in self._data:
-            coll.header._metadata = meta_d
+            if coll is not None:
+                coll.header._metadata = meta_d
+                coll.header._metadata_shared = False
 
     @property
     def annual_heating_design_day_996(self):
@@ -542,10 +615,19 @@ class EPW(object):
         # perform checks on the file before opening it.
         assert os.path.isfile(self._file_path), 'Cannot find an epw file at {}'.format(
             self._file_path)
-        assert self._file_path.lower().endswith('epw'), '{} is not an .epw file. \n' \
-            'It does not possess the .epw file extension.'.format(self._file_path)
+        epw_name = self._file_path if self._zip_member is None else self._zip_member
+        assert epw_name.lower().endswith('epw'), '{} is not an .epw file. \n' \
+            'It does not possess the .epw file extension.'.format(epw_name)
+
+        # use the binary file in the cache folder, (re)writing it if it's out of date
+        if self._cache_folder is not None:
+            if self._import_cache(import_header_only):
+                return
+            self._write_cache()
+            if self._import_cache(import_header_only):
+                return
 
-        with open(self._file_path, readmode) as epwin:
+        with self._open_epw() as epwin:
             line = epwin.readline()
             original_header_load = bool(self._is_header_loaded)
 
@@ -649,50 +731,189 @@ class EPW(object):
             line = epwin.readline()
             self._num_of_fields = min(len(line.strip().split(',')), 35)
 
-            # create an annual analysis period
-            analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
-
-            # create headers and an empty list for each field in epw file
-            headers = []
-            for field_number in xrange(self._num_of_fields):
-                field = EPWFields.field_by_number(field_number)
-                header = Header(data_type=field.name, unit=field.unit,
-                                analysis_period=analysis_period,
-                                metadata=dict(self._metadata))
-                headers.append(header)
-                self._data.append([])
-
-            # collect hourly data
-            while line:
-                data = line.strip().split(',')
-
-                for field_number in xrange(self._num_of_fields):
-                    value_type = EPWFields.field_by_number(field_number).value_type
-                    try:
-                        value = value_type(data[field_number])
-                    except ValueError as e:
-                        # failed to convert the value for the specific TypeError
-                        if value_type != int:
-                            raise ValueError(e)
-                        value = int(round(float(data[field_number])))
-
-                    self._data[field_number].append(value)
-
-                line = epwin.readline()
-
-            # if the first value is at 1 AM, move last item to start position
-            for field_number in xrange(self._num_of_fields):
-                point_in_time = headers[field_number].data_type.point_in_time
-                if point_in_time:
-                    # move the last hour to first position
-                    last_hour = self._data[field_number].pop()
-                    self._data[field_number].insert(0, last_hour)
-
-            # finally, build the data collection objects from the headers and data
-            for i in xrange(self._num_of_fields):
-                self._data[i] = HourlyContinuousCollection(headers[i], self._data[i])
+            # import the requested fields and leave placeholders for the others
+            self._data = [None] * self._num_of_fields
+            if self._field_numbers is None:
+                field_numbers = tuple(xrange(self._num_of_fields))
+            else:
+                field_numbers = tuple(f for f in self._field_numbers
+                                      if f < self._num_of_fields)
+            self._import_fields(epwin, line, field_numbers)
+            self._is_data_loaded = True
+
+    def _import_missing_fields(self, field_numbers=None):
+        """Import fields that were not requested when the hourly data was loaded.
 
+        Args:
+            field_numbers: A list of integers for the fields to be imported. If None,
+                all fields that have not yet been imported will be imported.
+        """
+        if field_numbers is None:
+            field_numbers = tuple(i for i, dat in enumerate(self._data) if dat is None)
+        if len(field_numbers) == 0:
+            return
+        if self._binary is not None:
+            self._import_binary_fields(self._binary, self._binary_info, field_numbers)
+        elif self._cache_folder is None or \
+                not self._import_cache(field_numbers=field_numbers):
+            with self._open_epw() as epwin:
+                for i in xrange(8):  # skip the header
+                    epwin.readline()
+                self._import_fields(epwin, epwin.readline(), field_numbers)
+        if self._is_ip:  # keep the new fields consistent with the others
+            for field_number in field_numbers:
+                self._data[field_number].convert_to_ip()
+
+    def _open_epw(self):
+        """Open the .epw file for reading, including .epw files inside a .zip file."""
+        if self._zip_member is None:
+            return open(self._file_path, readmode)
+        return open_zip_member(self._file_path, self._zip_member)
+
+    def _import_fields(self, epwin, line, field_numbers):
+        """Import data collections for certain fields from the hourly data of a file.
+
+        Args:
+            epwin: The open epw file, which has been read up to the first line of data.
+            line: Text for the first line of hourly data.
+            field_numbers: A list of integers for the fields to be imported.
+        """
+        # get the value type and an empty list for each field to be imported
+        columns = [[] for _ in field_numbers]
+        fields = tuple(zip(
+            field_numbers,
+            [EPWFields.field_by_number(f).value_type for f in field_numbers],
+            columns))
+
+        # collect hourly data, tokenizing each row only once
+        while line:
+            data = line.strip().split(',')
+            for field_number, value_type, column in fields:
+                try:
+                    value = value_type(data[field_number])
+                except ValueError as e:
+                    # failed to convert the value for the specific TypeError
+                    if value_type != int:
+                        raise ValueError(e)
+                    value = int(round(float(data[field_number])))
+                column.append(value)
+            line = epwin.readline()
+
+        # build the data collection objects from the headers and data
+        analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
+        for field_number, column in zip(field_numbers, columns):
+            field = EPWFields.field_by_number(field_number)
+            header = Header(data_type=field.name, unit=field.unit,
+                            analysis_period=analysis_period,
+                            metadata=dict(self._metadata))
+            if header.data_type.point_in_time:
+                # if the first value is at 1 AM, move last item to start position
+                column.insert(0, column.pop())
+            self._data[field_number] = HourlyContinuousCollection(header, column)
+
+    def _import_cache(self, import_header_only=False, field_numbers=None):
+        """Import data from the binary file of this EPW in the cache_folder.
+
+        Args:
+            import_header_only: Boolean to note whether only the header should
+                be imported.
+            field_numbers: An optional list of integers for the fields to be
+                imported. If None, the fields requested upon initialization
+                will be imported. When memory_map is True and no fields were
+                requested, none will be imported and the binary file will be
+                kept open to import each field upon request.
+
+        Returns:
+            True if an up-to-date binary file was found and imported. False if
+            the binary file is missing or is out of date with the .epw file.
+        """
+        binary_errors = (IOError, OSError, ValueError, KeyError, struct.error)
+        try:
+            binf, info = _open_binary(self._cache_file_path(), self._memory_map)
+        except binary_errors:
+            return False
+        try:
+            if not _is_binary_current(info, self._file_path):
+                return False
+            if not self._is_header_loaded:
+                self._is_header_loaded = True
+                self._header_from_dict(info['epw'])
+            if import_header_only:
+                return True
+            if not self._is_data_loaded:
+                self._num_of_fields = len(info['columns'])
+                self._data = [None] * self._num_of_fields
+            if field_numbers is None:
+                if self._field_numbers is not None:
+                    field_numbers = tuple(
+                        f for f in self._field_numbers if f < self._num_of_fields)
+                elif self._memory_map:
+                    field_numbers = ()
+                else:
+                    field_numbers = tuple(xrange(self._num_of_fields))
+            self._import_binary_fields(binf, info, field_numbers)
+            if self._memory_map:  # keep the file open to import fields later
+                self._binary, self._binary_info = binf, info
             self._is_data_loaded = True
+        except binary_errors:
+            return False
+        finally:
+            if binf is not self._binary:
+                binf.close()
+        return True
+
+    def _write_cache(self):
+        """Parse the .epw file and write its binary file into the cache_folder."""
+        if not os.path.isdir(self._cache_folder):
+            preparedir(self._cache_folder, remove_content=False)
+        EPW(self._file_path).to_binary(self._cache_file_path())
+
+    def _cache_file_path(self):
+        """Get the path to the binary file of this EPW in the cache_folder."""
+        file_path = os.path.abspath(self._file_path)
+        path_id = hashlib.md5(file_path.encode('utf-8')).hexdigest()[:10]
+        file_name = os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(
+            self._cache_folder, '{}_{}.lbepw'.format(file_name, path_id))
+
+    def _import_binary_fields(self, binf, info, field_numbers):
+        """Import data collections for certain fields from a binary file.
+
+        Args:
+            binf: The open binary file.
+            info: The dictionary of information at the start of the binary file.
+            field_numbers: A list of integers for the fields to be imported.
+        """
+        analysis_period = AnalysisPeriod(is_leap_year=self._is_leap_year)
+        swap = info['byteorder'] != sys.byteorder
+        for field_number in field_numbers:
+            typecode, offset, nbytes = info['columns'][field_number]
+            binf.seek(info['data_start'] + offset)
+            values = _unpack_values(binf.read(nbytes), typecode, swap)
+            head_dict = info['headers'][field_number]
+            header = Header(DataTypeBase.from_dict(head_dict['data_type']),
+                            head_dict['unit'], analysis_period, head_dict['metadata'])
+            self._data[field_number] = HourlyContinuousCollection(header, values)
+
+    def _load_all_data_check(self):
+        """Check if the data of all fields is loaded and, if not, load it."""
+        if not self.is_data_loaded:
+            self._import_data()
+        self._import_missing_fields()
+
+    @staticmethod
+    def _check_field_numbers(fields):
+        """Check the list of field numbers that are to be imported from the file."""
+        if fields is None:
+            return None
+        field_numbers = []
+        for field in fields:
+            field = int(field)
+            assert 0 <= field < 35, \
+                'EPW field number should be between 0 and 34. Got {}.'.format(field)
+            if field not in field_numbers:
+                field_numbers.append(field)
+        return tuple(sorted(field_numbers))
 
     @property
     def header(self):
@@ -758,50 +979,166 @@ class EPW(object):
         Args:
             file_path: A string representing the path to write the epw file to.
         """
-        # load data if it's  not loaded convert to SI if it is in IP
+        self._load_all_data_check()
+        self._check_data_length()
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            preparedir(folder)
+        with open(file_path, writemode) as epw_file:
+            self.write(epw_file)
+        return file_path
+
+    def write(self, epw_file, chunk_size=730):
+        """Write the EPW text into an open file (or any object with a write method).
+
+        The hourly data is written in chunks of rows, which are built directly
+        from the data collections of the EPW without changing them. If the EPW
+        has been converted to IP, the values of each chunk are converted to SI
+        as they are written so that the EPW itself remains in IP.
+
+        Args:
+            epw_file: An open file or other object with a write method to which
+                the EPW text will be written (eg. an io.StringIO).
+            chunk_size: An integer for the number of hourly rows to be built
+                and written at once. (Default: 730, which is a month of data).
+        """
+        self._load_all_data_check()
+        n_hours = self._check_data_length()
+        epw_file.write(''.join(self.header))
+
+        # get the values, units, rotation and value type of each field
+        fields = []
+        for field_number, data_c in enumerate(self._data[:self._num_of_fields]):
+            # if the first value is at 1AM, the first item is written last
+            shift = 1 if data_c.header.data_type.point_in_time else 0
+            is_int = EPWFields.field_by_number(field_number).value_type is int
+            fields.append((data_c._values, data_c.header.data_type,
+                           data_c.header.unit, shift, is_int))
+
+        # write the hourly data chunk by chunk
+        for start in xrange(0, n_hours, chunk_size):
+            end = min(start + chunk_size, n_hours)
+            columns = []
+            for values, data_type, unit, shift, is_int in fields:
+                column = values[start + shift:end + shift]
+                if len(column) < end - start:  # the rotated value wraps around
+                    column = list(column) + list(values[:end - start - len(column)])
+                columns.append(_file_values(column, data_type, unit, is_int))
+            epw_file.write(''.join(
+                ','.join(str(val) for val in row) + '\n' for row in zip(*columns)))
+
+    def _check_data_length(self):
+        """Check that all of the EPW data collections are for a full year.
+
+        Returns:
+            The number of hours in the year of the EPW.
+        """
+        n_hours = 8784 if self.is_leap_year else 8760
+        for data_c in self._data[:self._num_of_fields]:
+            if len(data_c._values) < n_hours:
+                raise ValueError('Data length is not for a full year and cannot be '
+                                 'saved as an EPW file.')
+        return n_hours
+
+    def field_view(self, field_number):
+        """Get a read-only view over the numbers of a field without building objects.
+
+        The numbers are always in the SI units of EPW files, even when the EPW
+        has been converted to IP with the convert_to_ip method.
+
+        For memory-mapped EPWs (see the memory_map argument of the EPW and of
+        EPW.from_binary), the view reads the numbers directly from the mapped
+        file without copying them and no data collection is built for the field.
+        For other EPWs, the values of the field's data collection are converted
+        and packed into a new copy each time that this method is called.
+
+        Args:
+            field_number: A value between 0 to 34 for the available epw fields.
+                Field 5 (Data Source and Uncertainty Flags) is text and cannot
+                be viewed as numbers.
+
+        Returns:
+            A read-only memoryview of numbers for the field (or a tuple of numbers
+            in Python 2, which has no memoryview casting).
+        """
         if not self.is_data_loaded:
             self._import_data()
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
-
-        # write the file
-        lines = self.header
-        try:
-            # if the first value is at 1AM, move first item to end position
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    first_hour = self._data[field]._values.pop(0)
-                    self._data[field]._values.append(first_hour)
-
-            annual_a_per = AnalysisPeriod(is_leap_year=self.is_leap_year)
-            for hour in xrange(0, len(annual_a_per.datetimes)):
-                line = []
-                for field in xrange(0, self._num_of_fields):
-                    line.append(str(self._data[field]._values[hour]))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            # cleaning up
-            length_error_msg = 'Data length is not for a full year and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
+        if not 0 <= field_number < self._num_of_fields:
+            raise ValueError('Field number should be between 0-%d' % self._num_of_fields)
+        if self._binary is not None:
+            info = self._binary_info
+            typecode, offset, nbytes = info['columns'][field_number]
+            start = info['data_start'] + offset
+            swap = info['byteorder'] != sys.byteorder
         else:
-            file_data = ''.join(lines)
-            write_to_file(file_path, file_data, True)
-        finally:
-            del(lines)
-            # move last item to start position for fields on the hour
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    last_hour = self._data[field]._values.pop()
-                    self._data[field]._values.insert(0, last_hour)
-
-        if originally_ip:
-            self.convert_to_ip()
+            field = EPWFields.field_by_number(field_number)
+            assert field.value_type is not str, 'Field {} is text and cannot be ' \
+                'viewed as numbers.'.format(field_number)
+            data_c = self._get_data_by_field(field_number)
+            values = _file_values(data_c._values, data_c.header.data_type,
+                                  data_c.header.unit, field.value_type is int)
+            if not hasattr(memoryview, 'cast'):  # python 2
+                return tuple(values)
+            typecode, data = _pack_values(values)
+            return memoryview(data).cast(typecode)
+        assert typecode != 's', 'Field {} is text and cannot be viewed as numbers.' \
+            .format(field_number)
+
+        if swap or not hasattr(memoryview, 'cast'):
+            return tuple(
+                _unpack_values(self._binary[start:start + nbytes], typecode, swap))
+        return memoryview(self._binary)[start:start + nbytes].cast(typecode)
+
+    def to_binary(self, file_path):
+        """Write the EPW to a compact binary file, which can be loaded very quickly.
+
+        The binary file contains all of the header data of the EPW along with
+        the values of each field packed as arrays of numbers. It is mostly used
+        to cache parsed .epw files (see the cache_folder argument of the EPW)
+        but it can also be loaded with the EPW.from_binary method.
 
+        Args:
+            file_path: Full path to the binary file to be written.
+        """
+        self._load_all_data_check()
+        # pack the values of each field, aligning all of them to 8 bytes
+        columns, blocks, offset = [], [], 0
+        for data_c in self._data:
+            typecode, block = _pack_values(data_c._values)
+            columns.append([typecode, offset, len(block)])
+            block += _binary_padding(len(block))
+            blocks.append(block)
+            offset += len(block)
+
+        # record the .epw file that the data came from
+        source = None
+        if self._file_path is not None and os.path.isfile(self._file_path):
+            stat = os.stat(self._file_path)
+            source = {'file_path': os.path.abspath(self._file_path),
+                      'mtime': stat.st_mtime, 'size': stat.st_size}
+        info = {
+            'source': source,
+            'byteorder': sys.byteorder,
+            'epw': self._header_to_dict(),
+            'headers': [data_c.header.to_dict() for data_c in self._data],
+            'columns': columns
+        }
+        info = json.dumps(info).encode('utf-8')
+        info_head = _BINARY_SIGNATURE + struct.pack('<Q', len(info)) + info
+
+        # write everything to a temporary file and then move it into place
+        temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+        with open(temp_path, 'wb') as outf:
+            outf.write(info_head)
+            outf.write(_binary_padding(len(info_head)))
+            for block in blocks:
+                outf.write(block)
+        try:
+            os.replace(temp_path, file_path)
+        except AttributeError:  # python 2
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            os.rename(temp_path, file_path)
         return file_path
 
     def convert_to_ip(self):
@@ -813,7 +1150,8 @@ class EPW(object):
             self._import_data()
         if not self.is_ip:
             for coll in self._data:
-                coll.convert_to_ip()
+                if coll is not None:
+                    coll.convert_to_ip()
         self._is_ip = True
 
     def convert_to_si(self):
@@ -826,7 +1164,8 @@ class EPW(object):
             self._import_data()
         if self.is_ip:
             for coll in self._data:
-                coll.convert_to_si()
+                if coll is not None:
+                    coll.convert_to_si()
         self._is_ip = False
 
     def _get_data_by_field(self, field_number):
@@ -849,6 +1188,9 @@ class EPW(object):
         if not 0 <= field_number < self._num_of_fields:
             raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
 
+        # import the field if it was not requested when the data was loaded
+        if self._data[field_number] is None:
+            self._import_missing_fields((field_number,))
         return self._data[field_number]
 
     def import_data_by_field(self, field_number):
@@ -1500,9 +1842,15 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
     def to_dict(self):
         """Convert the EPW to a dictionary."""
         # load data if it's not loaded
-        if not self.is_data_loaded:
-            self._import_data()
+        self._load_all_data_check()
 
+        base = self._header_to_dict()
+        base['data_collections'] = [dc.to_dict() for dc in self._data]
+        base['type'] = 'EPW'
+        return base
+
+    def _header_to_dict(self):
+        """Get a dictionary of all EPW properties except the data collections."""
         def dictify_dict(base_dict):
             new_dict = {}
             for key, val in base_dict.items():
@@ -1514,7 +1862,6 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         grnd_temps = dictify_dict(self.monthly_ground_temperature)
         return {
             'location': self.location.to_dict(),
-            'data_collections': [dc.to_dict() for dc in self._data],
             'metadata': self.metadata,
             'heating_dict': self.heating_design_condition_dictionary,
             'cooling_dict': self.cooling_design_condition_dictionary,
@@ -1528,10 +1875,54 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
             "daylight_savings_start": self.daylight_savings_start,
             "daylight_savings_end": self.daylight_savings_end,
             "comments_1": self.comments_1,
-            "comments_2": self.comments_2,
-            "type": 'EPW'
+            "comments_2": self.comments_2
         }
 
+    def _header_from_dict(self, data):
+        """Set all EPW properties except the data collections from a dictionary.
+
+        Note that _is_header_loaded should be set to True before using this method.
+        """
+        option_keys_dict = ('metadata', 'heating_dict', 'cooling_dict',
+                            'extremes_dict', 'extreme_hot_weeks', 'extreme_cold_weeks',
+                            'typical_weeks', 'monthly_ground_temps')
+        for key in option_keys_dict:
+            if key not in data:
+                data[key] = {}
+
+        # Set the required properties of the EPW object.
+        self._location = Location.from_dict(data['location'])
+        if 'is_leap_year' in data:
+            self._is_leap_year = data['is_leap_year']
+        if 'is_ip' in data:
+            self._is_ip = data['is_ip']
+
+        # Set all of the header properties if they exist in the dictionary.
+        self._metadata = data['metadata']
+        self.heating_design_condition_dictionary = data['heating_dict']
+        self.cooling_design_condition_dictionary = data['cooling_dict']
+        self.extreme_design_condition_dictionary = data['extremes_dict']
+
+        def _dedict(parent_dict, obj):
+            new_dict = {}
+            for key, val in parent_dict.items():
+                new_dict[key] = obj.from_dict(val)
+            return new_dict
+        self.extreme_hot_weeks = _dedict(data['extreme_hot_weeks'], AnalysisPeriod)
+        self.extreme_cold_weeks = _dedict(data['extreme_cold_weeks'], AnalysisPeriod)
+        self.typical_weeks = _dedict(data['typical_weeks'], AnalysisPeriod)
+        self.monthly_ground_temperature = _dedict(
+            data['monthly_ground_temps'], MonthlyCollection)
+
+        if 'daylight_savings_start' in data:
+            self.daylight_savings_start = data['daylight_savings_start']
+        if 'daylight_savings_end' in data:
+            self.daylight_savings_end = data['daylight_savings_end']
+        if 'comments_1' in data:
+            self.comments_1 = data['comments_1']
+        if 'comments_2' in data:
+            self.comments_2 = data['comments_2']
+
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
@@ -1541,6 +1932,295 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         return "EPW file Data for [%s]" % self.location.city
 
 
+def load_epws(epw_files, result='epw', fields=None, cache_folder=None,
+              processes=None, chunk_size=1, max_pending=None):
+    """Load many .epw files across a pool of processes, yielding them as they complete.
+
+    Files that fail to load do not stop the others. Instead, the exception
+    raised while loading the file is yielded in place of the result.
+
+    Args:
+        epw_files: The .epw files to be loaded. This can be a path to a folder
+            (in which case all .epw and .zip files in the folder are loaded),
+            a glob pattern (eg. "C:/weather/USA_*.epw") or a list of .epw file
+            paths. Any .zip file is expanded to all of the .epw files inside of
+            it, which are loaded without being extracted and whose paths are
+            yielded as the path to the .zip file joined with the name of the
+            .epw file inside it.
+        result: Text or a function for what is yielded for each .epw file.
+            Functions must be picklable (eg. defined at the top level of a
+            module) and they should accept an EPW object as the only argument.
+            Their return value is yielded. Choose from the following text options.
+
+            * epw - an EPW object with the hourly data loaded
+            * header - an EPW object with only the header loaded
+            * summary - a dictionary with the location and the annual minimum,
+                maximum and average of each numerical field.
+
+        fields: An optional list of integers for the numbers of the EPW fields
+            to be imported. See the fields argument of the EPW. (Default: None).
+        cache_folder: An optional path to a folder in which binary versions of
+            the parsed .epw files are cached. See the cache_folder argument
+            of the EPW. The .epw files inside .zip files are not cached.
+            (Default: None).
+        processes: An integer for the number of processes to use. If None, the
+            number of CPUs is used. If 1 or if multiprocessing is not available,
+            the files are loaded one after the other in this process. (Default: None).
+        chunk_size: An integer for the number of files sent to a process at once.
+            Larger chunks reduce the overhead of communicating with the processes
+            when loading many small results, such as headers or summaries. (Default: 1).
+        max_pending: An integer for the maximum number of chunks that are loading
+            or waiting to be yielded at any time. Lower numbers reduce the memory
+            used when results are consumed more slowly than they are loaded. If
+            None, it will be twice the number of processes. (Default: None).
+
+    Returns:
+        A generator of tuples with the path to each .epw file and its result,
+        in the order that the files finished loading.
+    """
+    # gather the .epw files and check the inputs
+    if isinstance(epw_files, basestring):
+        if os.path.isdir(epw_files):
+            epw_files = glob.glob(os.path.join(epw_files, '*.epw')) + \
+                glob.glob(os.path.join(epw_files, '*.zip'))
+        else:
+            epw_files = glob.glob(epw_files)
+        epw_files = sorted(epw_files)
+    epw_files = _expand_zip_files([os.path.normpath(f) for f in epw_files])
+    assert result in ('epw', 'header', 'summary') or callable(result), \
+        'EPW result "{}" is not acceptable.'.format(result)
+    assert chunk_size >= 1, 'chunk_size must be at least 1. Got {}.'.format(chunk_size)
+    chunks = [epw_files[i:i + chunk_size]
+              for i in xrange(0, len(epw_files), chunk_size)]
+    if multiprocessing is None or processes == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            for loaded in _load_epw_chunk(chunk, result, fields, cache_folder):
+                yield loaded
+        return
+
+    # load the chunks in a pool of processes, yielding the results as they come
+    processes = processes or multiprocessing.cpu_count()
+    max_pending = max_pending or 2 * processes
+    assert max_pending >= 1, 'max_pending must be at least 1. Got {}.'.format(
+        max_pending)
+    pool = multiprocessing.Pool(min(processes, len(chunks)))
+    try:
+        pending, chunks = [], iter(chunks)
+        while True:
+            for chunk in chunks:
+                pending.append((chunk, pool.apply_async(
+                    _load_epw_chunk, (chunk, result, fields, cache_folder))))
+                if len(pending) >= max_pending:
+                    break
+            if len(pending) == 0:
+                break
+            chunk, async_result = _next_ready(pending)
+            try:
+                chunk_loaded = async_result.get()
+            except Exception as e:  # eg. a result that could not be pickled
+                chunk_loaded = [(f, e) for f in chunk]
+            for loaded in chunk_loaded:
+                yield loaded
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _expand_zip_files(file_paths):
+    """Replace the .zip files of load_epws with (zip_file, member) tuples of .epw files.
+
+    A .zip file that cannot be read is kept as a (zip_file, None) tuple such that
+    the error is yielded when it is loaded.
+    """
+    expanded = []
+    for file_path in file_paths:
+        if not file_path.lower().endswith('.zip'):
+            expanded.append(file_path)
+            continue
+        try:
+            members = zip_file_members(file_path, '.epw')
+        except Exception:
+            members = [None]
+        expanded.extend((file_path, member) for member in members)
+    return expanded
+
+
+def _next_ready(pending):
+    """Remove and return the first (chunk, AsyncResult) of load_epws that is ready.
+
+    The results are polled instead of using callbacks since the callbacks of
+    Python 2 are not called for chunks that fail in the pool of processes.
+    """
+    while True:
+        for i, (chunk, async_result) in enumerate(pending):
+            if async_result.ready():
+                return pending.pop(i)
+        pending[0][1].wait(0.01)
+
+
+def _load_epw_chunk(file_paths, result, fields=None, cache_folder=None):
+    """Load a chunk of .epw files within a process of load_epws."""
+    loaded = []
+    for file_path in file_paths:
+        try:
+            if isinstance(file_path, tuple):  # an .epw file inside a .zip file
+                zip_file, member = file_path
+                if member is not None:
+                    file_path = os.path.join(zip_file, member)
+                else:
+                    file_path = zip_file
+                epw = EPW.from_zip(zip_file, member, fields)
+            else:
+                epw = EPW(file_path, fields, cache_folder)
+            if result == 'header':
+                epw._import_data(import_header_only=True)
+            else:
+                epw._import_data()
+                if result == 'summary':
+                    epw = _summarize_epw(epw)
+                elif result != 'epw':
+                    epw = result(epw)
+            loaded.append((file_path, epw))
+        except Exception as e:
+            loaded.append((file_path, e))
+    return loaded
+
+
+def _summarize_epw(epw):
+    """Get a dictionary summarizing the location and the loaded fields of an EPW."""
+    field_summaries = {}
+    for field_number, data in enumerate(epw._data):
+        if data is None or EPWFields.field_by_number(field_number).value_type is str:
+            continue
+        field_summaries[field_number] = {
+            'name': data.header.data_type.name,
+            'unit': data.header.unit,
+            'min': data.min,
+            'max': data.max,
+            'average': data.average
+        }
+    return {'location': epw.location.to_dict(), 'fields': field_summaries}
+
+
+_BINARY_SIGNATURE = b'LBEPWB01'
+
+
+def _binary_padding(length):
+    """Get the null bytes needed to align a block of a given length to 8 bytes."""
+    return b'\x00' * (-length % 8)
+
+
+def _file_values(values, data_type, unit, is_int):
+    """Get the values of an EPW field in the SI units and number types of EPW files.
+
+    Args:
+        values: The values of the field's data collection.
+        data_type: The data type of the field's data collection.
+        unit: The unit of the field's data collection.
+        is_int: Boolean to note whether the field is an integer field, whose
+            values may be stored as floats by the data collection backend.
+    """
+    values = data_type.to_si(values, unit)[0]
+    if is_int:
+        values = [val if type(val) is int else int(round(val)) for val in values]
+    return values
+
+
+def _pack_values(values):
+    """Pack a list of values into bytes.
+
+    Returns:
+        A tuple with the array typecode of the values and the packed bytes. The
+        typecode is 's' for text, which is packed as utf-8 separated by newlines.
+    """
+    if all(isinstance(v, int) for v in values):
+        try:
+            arr = array('i', values)
+        except OverflowError:
+            arr = array('d', values)
+    elif all(isinstance(v, (int, float)) for v in values):
+        arr = array('d', values)
+    else:
+        return 's', '\n'.join(str(v) for v in values).encode('utf-8')
+    try:
+        return arr.typecode, arr.tobytes()
+    except AttributeError:  # python 2
+        return arr.typecode, arr.tostring()
+
+
+def _unpack_values(data, typecode, swap=False):
+    """Unpack bytes written with _pack_values into a list of values."""
+    if typecode == 's':
+        return data.decode('utf-8').split('\n')
+    arr = array(typecode)
+    try:
+        arr.frombytes(data)
+    except AttributeError:  # python 2
+        arr.fromstring(data)
+    if swap:
+        arr.byteswap()
+    return arr.tolist()
+
+
+def _open_binary(file_path, memory_map=False):
+    """Open a binary EPW file and read the dictionary of information at its start.
+
+    Returns:
+        A tuple with the open file (or the memory-mapped file if memory_map is True)
+        and the dictionary of information. The caller is responsible for closing
+        the file.
+    """
+    binf = open(file_path, 'rb')
+    if memory_map:
+        try:
+            mapped = mmap.mmap(binf.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            binf.close()
+        binf = mapped
+    try:
+        return binf, _read_binary_info(binf)
+    except Exception:
+        binf.close()
+        raise
+
+
+def _read_binary_info(binf):
+    """Read the dictionary of information at the start of an open binary EPW file."""
+    if binf.read(len(_BINARY_SIGNATURE)) != _BINARY_SIGNATURE:
+        raise ValueError('File is not a binary EPW written by ladybug.')
+    info_len = struct.unpack('<Q', binf.read(8))[0]
+    object_hook = _str_object_hook if sys.version_info < (3, 0) else None
+    info = json.loads(binf.read(info_len).decode('utf-8'), object_hook=object_hook)
+    info_head_len = len(_BINARY_SIGNATURE) + 8 + info_len
+    info['data_start'] = info_head_len + (-info_head_len % 8)
+    grnd_temps = info['epw']['monthly_ground_temps']
+    info['epw']['monthly_ground_temps'] = \
+        {float(depth): val for depth, val in grnd_temps.items()}
+    return info
+
+
+def _str_object_hook(obj):
+    """Convert the unicode text of a dictionary decoded from JSON to str (Python 2).
+    """
+    def to_str(val):
+        if isinstance(val, type(u'')):
+            return val.encode('utf-8')
+        if isinstance(val, list):
+            return [to_str(v) for v in val]
+        return val
+    return {to_str(key): to_str(val) for key, val in obj.items()}
+
+
+def _is_binary_current(info, file_path):
+    """Check whether the info of a binary EPW matches the current state of a file."""
+    source = info['source']
+    if source is None or source['file_path'] != os.path.abspath(file_path):
+        return False
+    stat = os.stat(file_path)
+    return source['mtime'] == stat.st_mtime and source['size'] == stat.st_size
+
+
 class EPWFields(object):
     """EPW weather file fields.
 
@@ -2,7 +2,9 @@
 """Utility functions for working with files and directories."""
 from __future__ import division
 
+import io
 import os
+import codecs
 import shutil
 import zipfile
 import sys
@@ -316,6 +318,52 @@ def unzip_file(source_file, dest_dir=None, mkdir=False):
             zf.extract(member, dest_dir)
 
 
+def zip_file_members(zip_file, extension=None):
+    """Get a list of the names of the files inside a compressed file.
+
+    Args:
+        zip_file: Full path to a valid compressed file (e.g. c:/ladybug/testPts.zip)
+        extension: Optional text for a file extension (e.g. .epw) to only get the
+            names of the files with this extension. The extension is not case
+            sensitive. If None, the names of all files are returned. (Default: None).
+    """
+    with zipfile.ZipFile(zip_file) as zf:
+        names = [name for name in zf.namelist() if not name.endswith('/')]
+    if extension is not None:
+        names = [name for name in names if name.lower().endswith(extension.lower())]
+    return names
+
+
+def open_zip_member(zip_file, member, encoding=None, errors=None):
+    """Open a file inside a compressed file to read its text without extracting it.
+
+    The text is decompressed as it is read such that the file is never fully
+    written to disk or held in memory. Note that, in Python 2, the whole file
+    is decompressed into memory at once.
+
+    Args:
+        zip_file: Full path to a valid compressed file (e.g. c:/ladybug/testPts.zip)
+        member: Text for the name of the file inside the compressed file.
+        encoding: Optional text for the encoding of the file. If None, the
+            default encoding of the platform will be used like the Python
+            open function. (Default: None).
+        errors: Optional text for how encoding errors are handled (e.g. ignore).
+            If None, errors will raise exceptions. (Default: None).
+
+    Returns:
+        A file-like object for reading the text of the file, which should be
+        closed once it has been read.
+    """
+    with zipfile.ZipFile(zip_file) as zf:
+        if sys.version_info < (3, 0):
+            stream = io.BytesIO(zf.read(member))
+            if encoding is None:
+                return stream
+            return codecs.getreader(encoding)(stream, errors or 'strict')
+        # the member stream remains open after the zip file is closed
+        return io.TextIOWrapper(zf.open(member), encoding=encoding, errors=errors)
+
+
 def csv_to_matrix(csv_file_path):
     """Load a CSV file into a Python matrix of strings.
 
@@ -28,7 +28,8 @@ class Header(object):
         * metadata
     """
 
-    __slots__ = ('_data_type', '_unit', '_analysis_period', '_metadata')
+    __slots__ = ('_data_type', '_unit', '_analysis_period', '_metadata',
+                 '_metadata_shared')
 
     def __init__(self, data_type, unit, analysis_period, metadata=None):
         """Initiate Ladybug header for lists.
@@ -93,6 +94,9 @@ class Header(object):
     @property
     def metadata(self):
         """Get or set a dictionary of metadata associated with the Header."""
+        if self._metadata_shared:  # copy the dictionary shared by duplicate()
+            self._metadata = deepcopy(self._metadata)
+            self._metadata_shared = False
         return self._metadata
 
     @metadata.setter
@@ -101,12 +105,26 @@ class Header(object):
             assert isinstance(value, dict), \
                 'Expected dictionary for Header metadata. Got {}.'.format(type(value))
         self._metadata = value or {}
+        self._metadata_shared = False
 
     def duplicate(self):
-        """Return a copy of the header."""
-        a_per = self.analysis_period.duplicate() if self.analysis_period else None
-        return self.__class__(self.data_type, self.unit,
-                              a_per, deepcopy(self.metadata))
+        """Return a copy of the header.
+
+        The copy shares the analysis period, which cannot be changed. It also
+        shares the metadata dictionary until the metadata of either header is
+        requested, at which point that header gets its own copy of the dictionary.
+        """
+        new_header = self.__class__.__new__(self.__class__)
+        new_header._data_type = self._data_type
+        new_header._unit = self._unit
+        new_header._analysis_period = self._analysis_period
+        new_header._metadata = self._metadata
+        new_header._metadata_shared = False
+        if self._metadata:
+            new_header._metadata_shared = self._metadata_shared = True
+        else:
+            new_header._metadata = {}
+        return new_header
 
     def to_tuple(self):
         """Return Ladybug header as a list."""
@@ -137,7 +155,7 @@ class Header(object):
         return self.__repr__()
 
     def __key(self):
-        return (self.data_type, self.unit, self.analysis_period, self.metadata)
+        return (self.data_type, self.unit, self.analysis_period, self._metadata)
 
     def __eq__(self, other):
         return isinstance(other, Header) and self.__key() == other.__key()
@@ -148,9 +166,9 @@ class Header(object):
     def __repr__(self):
         """Return Ladybug header as a string."""
         a_per = self.analysis_period if self.analysis_period else ''
-        if self.metadata != {}:
+        if self._metadata != {}:
             meta_str = '\n'.join(['{}: {}'.format(key, val)
-                                  for key, val in self.metadata.items()])
+                                  for key, val in self._metadata.items()])
             return "{} ({})\n{}\n{}".format(
                 self.data_type, self.unit, a_per, meta_str)
         else:
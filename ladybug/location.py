@@ -3,6 +3,8 @@
 from __future__ import division
 
 import re
+import math
+import heapq
 
 
 class Location(object):
@@ -251,3 +253,196 @@ class Location(object):
         return "%s, lat:%.2f, lon:%.2f, tz:%.1f, elev:%.2f" % (
             self.city, self.latitude, self.longitude,
             self.time_zone, self.elevation)
+
+
+class LocationIndex(object):
+    """A spatial index of Locations for fast queries of the nearest locations.
+
+    The locations are indexed with a k-d tree of points on a unit sphere such
+    that the nearest locations to any point can be found by visiting only a few
+    of the indexed locations instead of computing the distance to each of them.
+
+    Args:
+        locations: A list of Ladybug Location objects to be indexed.
+        items: An optional list of objects that are aligned with the locations
+            and are returned by the queries of the index instead of the
+            locations (eg. paths to the .epw files of the locations). If None,
+            the queries will return the Location objects. (Default: None).
+
+    Properties:
+        * locations
+        * items
+    """
+    EARTH_RADIUS = 6371.0088  # mean radius of the earth in kilometers
+
+    __slots__ = ('_locations', '_items', '_points', '_axes', '_order')
+
+    def __init__(self, locations, items=None):
+        """Initialize LocationIndex."""
+        self._locations = tuple(locations)
+        for loc in self._locations:
+            assert isinstance(loc, Location), 'Expected Location for LocationIndex. ' \
+                'Got {}.'.format(type(loc))
+        self._items = self._locations if items is None else tuple(items)
+        assert len(self._items) == len(self._locations), 'The number of items ' \
+            '({}) does not match the number of locations ({}).'.format(
+                len(self._items), len(self._locations))
+
+        # build the k-d tree by sorting the points such that each median is a node
+        points = [self._unit_vector(loc.latitude, loc.longitude)
+                  for loc in self._locations]
+        self._order = list(range(len(points)))
+        self._axes = [0] * len(points)
+        self._build_tree(points, 0, len(points))
+        self._points = [points[i] for i in self._order]
+
+    @classmethod
+    def from_catalog(cls, catalog, column='epw_file', where=None, parameters=()):
+        """Create a LocationIndex from the stations of a StationCatalog.
+
+        Args:
+            catalog: A StationCatalog from the ladybug.catalog module.
+            column: Text for the column of the catalog with the items to be returned
+                by the queries of the index (eg. "epw_file", "ddy_file" or
+                "dataset"). Stations that have no value for this column are
+                not indexed. (Default: "epw_file").
+            where: Optional text for an SQL WHERE clause to select the stations
+                that are indexed. See the query method of StationCatalog.
+            parameters: A tuple of values to be substituted for each "?" in
+                the where clause. (Default: ()).
+        """
+        stations = [st for st in catalog.query(where, parameters)
+                    if st[column] is not None]
+        return cls([st['location'] for st in stations],
+                   [st[column] for st in stations])
+
+    @property
+    def locations(self):
+        """Get a tuple of the Location objects in the index."""
+        return self._locations
+
+    @property
+    def items(self):
+        """Get a tuple of the items returned by the queries of the index."""
+        return self._items
+
+    def nearest(self, latitude, longitude, count=1):
+        """Get the items of the locations nearest to a point.
+
+        Args:
+            latitude: A number for the latitude of the point.
+            longitude: A number for the longitude of the point.
+            count: An integer for the number of nearest items to return. (Default: 1).
+
+        Returns:
+            A list of tuples sorted from the nearest to the farthest location. Each
+            tuple has the item of the location and the great-circle distance
+            to the location in kilometers.
+        """
+        assert count >= 1, 'count must be at least 1. Got {}.'.format(count)
+        target = self._unit_vector(latitude, longitude)
+        found = []  # heap of the nearest points with negative squared distances
+        self._search_nearest(target, count, 0, len(self._points), found)
+        return [(self._items[self._order[i]], self._distance(-neg_d2))
+                for neg_d2, i in sorted(found, reverse=True)]
+
+    def within_radius(self, latitude, longitude, radius):
+        """Get the items of all locations within a certain distance of a point.
+
+        Args:
+            latitude: A number for the latitude of the point.
+            longitude: A number for the longitude of the point.
+            radius: A number for the great-circle distance in kilometers within
+                which the locations must be.
+
+        Returns:
+            A list of tuples sorted from the nearest to the farthest location. Each
+            tuple has the item of the location and the great-circle distance
+            to the location in kilometers.
+        """
+        target = self._unit_vector(latitude, longitude)
+        angle = min(radius / self.EARTH_RADIUS, math.pi)
+        max_d2 = (2 * math.sin(angle / 2)) ** 2  # squared chord length
+        found = []
+        self._search_radius(target, max_d2, 0, len(self._points), found)
+        return [(self._items[self._order[i]], self._distance(d2))
+                for d2, i in sorted(found)]
+
+    def _build_tree(self, points, start, end):
+        """Arrange the point order between start and end into a k-d tree."""
+        if end - start <= 1:
+            return
+        # split on the axis along which the points are the most spread out
+        order = self._order
+        spreads = []
+        for axis in range(3):
+            coords = [points[i][axis] for i in order[start:end]]
+            spreads.append(max(coords) - min(coords))
+        axis = spreads.index(max(spreads))
+        order[start:end] = sorted(order[start:end], key=lambda i: points[i][axis])
+        mid = (start + end) // 2
+        self._axes[mid] = axis
+        self._build_tree(points, start, mid)
+        self._build_tree(points, mid + 1, end)
+
+    def _search_nearest(self, target, count, start, end, found):
+        """Add the points nearest to the target in a branch of the tree to a heap."""
+        if start >= end:
+            return
+        mid = (start + end) // 2
+        point = self._points[mid]
+        d2 = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + \
+            (point[2] - target[2]) ** 2
+        if len(found) < count:
+            heapq.heappush(found, (-d2, mid))
+        elif d2 < -found[0][0]:
+            heapq.heapreplace(found, (-d2, mid))
+        # search the side of the split with the target first
+        diff = target[self._axes[mid]] - point[self._axes[mid]]
+        if diff < 0:
+            self._search_nearest(target, count, start, mid, found)
+            if len(found) < count or diff * diff < -found[0][0]:
+                self._search_nearest(target, count, mid + 1, end, found)
+        else:
+            self._search_nearest(target, count, mid + 1, end, found)
+            if len(found) < count or diff * diff < -found[0][0]:
+                self._search_nearest(target, count, start, mid, found)
+
+    def _search_radius(self, target, max_d2, start, end, found):
+        """Add the points within a squared distance in a branch of the tree to a list."""
+        if start >= end:
+            return
+        mid = (start + end) // 2
+        point = self._points[mid]
+        d2 = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + \
+            (point[2] - target[2]) ** 2
+        if d2 <= max_d2:
+            found.append((d2, mid))
+        diff = target[self._axes[mid]] - point[self._axes[mid]]
+        if diff < 0 or diff * diff <= max_d2:
+            self._search_radius(target, max_d2, start, mid, found)
+        if diff >= 0 or diff * diff <= max_d2:
+            self._search_radius(target, max_d2, mid + 1, end, found)
+
+    @staticmethod
+    def _unit_vector(latitude, longitude):
+        """Get a point on a unit sphere from a latitude and longitude in degrees."""
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon),
+                math.sin(lat))
+
+    def _distance(self, d2):
+        """Get the great-circle distance in kilometers from a squared chord length."""
+        return 2 * self.EARTH_RADIUS * math.asin(min(math.sqrt(d2) / 2, 1))
+
+    def __len__(self):
+        """Get the number of locations in the index."""
+        return len(self._locations)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Location index representation."""
+        return 'Location Index: [{} locations]'.format(len(self._locations))
@@ -905,10 +905,8 @@ class MonthlyChart(object):
                 a total collection and a zero collection will be output.
         """
         if not cumulative:
-            low = hourly_collection.percentile_monthly_per_hour(lower)
-            mid = hourly_collection.average_monthly_per_hour()
-            up = hourly_collection.percentile_monthly_per_hour(upper)
-            return [low, mid, up]
+            stats = ('p{}'.format(lower), 'average', 'p{}'.format(upper))
+            return hourly_collection.aggregate('monthlyperhour', stats)
         else:
             total = hourly_collection.total_monthly_per_hour()
             zero = total.duplicate()
@@ -759,10 +759,7 @@ class SQLiteResult(object):
         Args:
             n_lists: An integer for the number of lists to partiton the data into.
         """
-        all_values = []
-        for i in range(0, len(data), n_lists):
-            all_values.append([val[0] for val in data[i:i + n_lists]])
-        return zip(*all_values)
+        return [[val[0] for val in data[i::n_lists]] for i in range(n_lists)]
 
     @staticmethod
     def _partition_and_convert_timeseries(data, n_lists):
@@ -771,10 +768,8 @@ class SQLiteResult(object):
         Args:
             n_lists: An integer for the number of lists to partiton the data into.
         """
-        all_values = []
-        for i in range(0, len(data), n_lists):
-            all_values.append([val[0] / 3600000. for val in data[i:i + n_lists]])
-        return zip(*all_values)
+        return [[val[0] / 3600000. for val in data[i::n_lists]]
+                for i in range(n_lists)]
 
     @staticmethod
     def _partition_timeseries_chunks(data, chunks):
@@ -787,11 +782,9 @@ class SQLiteResult(object):
         zero_cum_chunks = [0] + SQLiteResult._accumulate(chunks)
         all_values = []
         for j, chunk in enumerate(chunks):
-            start = zero_cum_chunks[j] * n_lists
-            day_vals = []
-            for i in range(0, chunk * n_lists, n_lists):
-                day_vals.append([val[0] for val in data[start + i:start + i + n_lists]])
-            all_values.extend(zip(*day_vals))
+            chunk_data = data[zero_cum_chunks[j] * n_lists:
+                              zero_cum_chunks[j + 1] * n_lists]
+            all_values.extend(SQLiteResult._partition_timeseries(chunk_data, n_lists))
         return all_values
 
     @staticmethod
@@ -805,12 +798,10 @@ class SQLiteResult(object):
         zero_cum_chunks = [0] + SQLiteResult._accumulate(chunks)
         all_values = []
         for j, chunk in enumerate(chunks):
-            start = zero_cum_chunks[j] * n_lists
-            day_vals = []
-            for i in range(0, chunk * n_lists, n_lists):
-                day_vals.append([val[0] / 3600000. for val in
-                                 data[start + i:start + i + n_lists]])
-            all_values.extend(zip(*day_vals))
+            chunk_data = data[zero_cum_chunks[j] * n_lists:
+                              zero_cum_chunks[j + 1] * n_lists]
+            all_values.extend(
+                SQLiteResult._partition_and_convert_timeseries(chunk_data, n_lists))
         return all_values
 
     @staticmethod
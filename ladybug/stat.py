@@ -15,6 +15,7 @@ from .designday import HumidityCondition
 from .designday import WindCondition
 from .dt import Date
 from .location import Location
+from .futil import zip_file_members, open_zip_member
 
 try:
     from itertools import izip as zip  # python 2
@@ -129,6 +130,28 @@ class STAT(object):
         if file_path is not None:
             self._import_data()
 
+    @classmethod
+    def from_zip(cls, zip_file, member=None):
+        """Create STAT from a .stat file inside a .zip file without extracting it.
+
+        Args:
+            zip_file: Full path to a .zip file containing a .stat file.
+            member: Optional text for the name of the .stat file inside the .zip
+                file. If None, the first .stat file in the .zip file will be used.
+        """
+        members = zip_file_members(zip_file, '.stat')
+        if member is None:
+            if len(members) == 0:
+                raise ValueError('No .stat file was found in {}.'.format(zip_file))
+            member = members[0]
+        elif member not in members:
+            raise ValueError('No .stat file named "{}" was found in {}.'.format(
+                member, zip_file))
+        stat_obj = cls(None)
+        stat_obj._file_path = os.path.normpath(zip_file)
+        stat_obj._import_data(open_zip_member(zip_file, member, 'utf-8', 'ignore'))
+        return stat_obj
+
     @classmethod
     def from_dict(cls, data):
         """ Create Stat from a dictionary.
@@ -229,8 +252,12 @@ class STAT(object):
         """Get the path to the stat file."""
         return self._file_path
 
-    def _import_data(self):
+    def _import_data(self, statwin=None):
         """Import data from a stat file.
+
+        Args:
+            statwin: An optional open file object from which the stat data will
+                be read. If None, the file at the file_path will be opened.
         """
         # set default state to ironpython for very old ironpython (2.7.0)
         iron_python = True
@@ -244,7 +271,9 @@ class STAT(object):
             if 'IronPython' in str(e):
                 iron_python = True
 
-        if iron_python:
+        if statwin is not None:
+            pass  # the file has already been opened
+        elif iron_python:
             statwin = codecs.open(self.file_path, 'r')
         else:
             statwin = codecs.open(self.file_path, 'r', encoding='utf-8', errors='ignore')
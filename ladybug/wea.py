@@ -512,13 +512,15 @@ class Wea(object):
         date_times = []
         altitudes = []
         doys = []
-        dry_bulb_t3_hrs = []
-        for count, t_date in enumerate(cloud_cover.datetimes):
+        for t_date in cloud_cover.datetimes:
             date_times.append(t_date)
             sun = sp.calculate_sun_from_date_time(t_date)
             altitudes.append(sun.altitude)
             doys.append(sun.datetime.doy)
-            dry_bulb_t3_hrs.append(dry_bulb_temperature[count - (3 * a_per.timestep)])
+        # temperatures three hours earlier, wrapping around the start of the period
+        dry_bulb_values = list(dry_bulb_temperature.values)
+        lag = 3 * a_per.timestep
+        dry_bulb_t3_hrs = dry_bulb_values[-lag:] + dry_bulb_values[:-lag]
 
         # calculate zhang-huang irradiance
         dir_ir, diff_ir = zhang_huang_solar_split(
@@ -801,13 +801,12 @@ class WindRose(object):
         # Calculate zero rose properties
         zero_count = (len(analysis_values) - len(_analysis_values))
 
-        # Regular hist data
+        # Regular hist data, binning the indices of the analysis values by direction
         data = histogram_circular(
-            zip(_direction_values, _analysis_values), bin_array, bin_range,
-            key=lambda v: v[0])
+            _direction_values, bin_array, bin_range, output='indices')
 
-        # Filter out the direction values and make immutable
-        data = tuple(tuple(val[1] for val in bin) for bin in data)
+        # Get the analysis values of each bin and make immutable
+        data = tuple(tuple(_analysis_values[i] for i in bin) for bin in data)
 
         return data, zero_count
 
@@ -3,6 +3,7 @@ from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import DateTime
 
 from datetime import timedelta
+import pickle
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -191,3 +192,33 @@ def test_equality():
     assert ap_one is not ap_two
     assert hash(ap_one) == hash(ap_one_duplicate)
     assert hash(ap_one) != hash(ap_two)
+
+
+def test_pickle_and_unpickle():
+    """Test that pickling an analysis period leaves out its cached datetimes."""
+    ap = AnalysisPeriod(2, 1, 0, 3, 31, 23, timestep=4, is_leap_year=True)
+    serialized = pickle.dumps(ap)
+    ap.datetimes
+    assert len(pickle.dumps(ap)) == len(serialized)
+    new_ap = pickle.loads(serialized)
+    assert new_ap == ap
+    assert new_ap.is_leap_year
+    assert new_ap.datetimes == ap.datetimes
+
+
+def test_shared_timestamps():
+    """Test that equal analysis periods share their cached timestamps."""
+    ap_one = AnalysisPeriod(1, 1, 0, 12, 31, 23, timestep=6)
+    ap_two = AnalysisPeriod(1, 1, 0, 12, 31, 23, timestep=6)
+    assert ap_one.moys is ap_two.moys
+    assert ap_one.datetimes is ap_two.datetimes
+    assert len(ap_one.moys) == 8760 * 6
+    assert ap_one.moys[-1] == 525590
+    assert ap_one.hoys[7] == 70 / 60.0
+    assert ap_one.hoys_int[7] == 1
+    assert AnalysisPeriod(timestep=6, is_leap_year=True).moys is not ap_one.moys
+
+    # check the period length without computing the timestamps
+    assert len(AnalysisPeriod(1, 1, 0, 1, 2, 23, timestep=2)) == 96
+    assert len(AnalysisPeriod(12, 31, 0, 1, 1, 23)) == 48
+    assert len(AnalysisPeriod(1, 1, 1, 1, 2, 23)) == 46
@@ -0,0 +1,26 @@
+# coding=utf-8
+from ladybug.bundle import iter_bundle
+from ladybug.epw import EPW
+from ladybug.stat import STAT
+from ladybug.ddy import DDY
+
+import pytest
+
+
+def test_iter_bundle():
+    """Test the iteration over the weather datasets of a zip bundle."""
+    datasets = list(iter_bundle('./tests/fixtures/zip/test.zip'))
+    assert len(datasets) == 1
+    dataset = datasets[0]
+    assert dataset['name'] == 'AUS_NSW.Sydney.947670_IWEC'
+    assert isinstance(dataset['epw'], EPW)
+    assert isinstance(dataset['stat'], STAT)
+    assert isinstance(dataset['ddy'], DDY)
+    assert dataset['epw'].location.city == 'SYDNEY'
+
+    dataset = next(iter_bundle('./tests/fixtures/zip/test.zip', ('ddy',)))
+    assert 'epw' not in dataset
+    assert isinstance(dataset['ddy'], DDY)
+
+    with pytest.raises(AssertionError):
+        next(iter_bundle('./tests/fixtures/zip/test.zip', ('wea',)))
@@ -0,0 +1,89 @@
+# coding=utf-8
+from ladybug.catalog import StationCatalog
+from ladybug.location import Location, LocationIndex
+
+import os
+import shutil
+
+
+def _weather_folder():
+    """Get a folder with weather datasets copied from the fixtures."""
+    folder = './tests/fixtures/catalog'
+    if os.path.isdir(folder):
+        shutil.rmtree(folder)
+    os.makedirs(os.path.join(folder, 'japan'))
+    for ext in ('epw', 'stat', 'ddy'):
+        shutil.copy('./tests/fixtures/{0}/chicago.{0}'.format(ext), folder)
+    shutil.copy('./tests/fixtures/stat/santamonica.stat', folder)
+    shutil.copy('./tests/fixtures/epw/tokyo.epw', os.path.join(folder, 'japan'))
+    shutil.copy('./tests/fixtures/stat/tokyo.stat', os.path.join(folder, 'japan'))
+    return folder
+
+
+def test_catalog_refresh():
+    """Test the refreshing of a StationCatalog from a folder of weather files."""
+    folder = _weather_folder()
+    catalog = StationCatalog(os.path.join(folder, 'catalog.db'))
+    str(catalog)  # test the string representation
+    assert len(catalog) == 0
+
+    updated = catalog.refresh(folder)
+    assert len(updated) == 6
+    assert len(catalog) == 3
+    assert catalog.refresh(folder) == []  # nothing has changed
+    assert catalog.refresh(u'{}'.format(folder)) == []
+
+    chicago = catalog.search(station_id='725300')[0]
+    assert os.path.isfile(chicago['epw_file'])
+    assert os.path.isfile(chicago['stat_file'])
+    assert os.path.isfile(chicago['ddy_file'])
+    assert chicago['climate_zone'] == '5A'
+    assert chicago['heating_996'] == -20.0
+    assert chicago['cooling_004'] == 33.3
+    assert chicago['design_conditions']['heating']['DB996'] == -20.0
+    assert 'Extreme Hot Week' in chicago['weeks']
+    assert isinstance(chicago['location'], Location)
+    assert chicago['location'].city == 'Chicago Ohare Intl Ap'
+
+    # check that removed files are removed from the catalog
+    os.remove(os.path.join(folder, 'santamonica.stat'))
+    assert catalog.refresh(folder, recursive=False) == \
+        [os.path.abspath(os.path.join(folder, 'santamonica.stat'))]
+    assert len(catalog) == 2
+    os.remove(os.path.join(folder, 'japan', 'tokyo.stat'))
+    catalog.refresh(folder, recursive=False)
+    assert catalog.search(country='JPN')[0]['climate_zone'] == '4A'
+    catalog.refresh(folder)
+    assert catalog.search(country='JPN')[0]['climate_zone'] is None
+
+    # check that the catalog persists in the SQLite file
+    catalog = StationCatalog(os.path.join(folder, 'catalog.db'))
+    assert len(catalog) == 2
+    shutil.rmtree(folder)
+
+
+def test_catalog_search():
+    """Test the searching of a StationCatalog."""
+    folder = _weather_folder()
+    catalog = StationCatalog(os.path.join(folder, 'catalog.db'))
+    catalog.refresh(folder)
+
+    stations = catalog.search(climate_zone='5A', heating_996_below=-10)
+    assert [st['city'] for st in stations] == ['Chicago Ohare Intl Ap']
+    assert len(catalog.search(climate_zone='4')) == 1
+    assert len(catalog.search(climate_zone='3C')) == 1
+    assert len(catalog.search(heating_996_below=-30)) == 0
+    assert len(catalog.search(cooling_004_above=30)) == 1
+
+    stations = catalog.query('latitude > ?', (35,), order_by='latitude DESC')
+    assert [st['country'] for st in stations] == ['USA', 'JPN']
+    assert len(catalog.query()) == 3
+
+    index = LocationIndex.from_catalog(catalog)
+    assert len(index) == 2  # santamonica has no .epw file
+    epw_file, distance = index.nearest(35.5, 139.5)[0]
+    assert epw_file.endswith('tokyo.epw')
+    assert distance < 50
+    index = LocationIndex.from_catalog(catalog, 'dataset', 'country = ?', ('USA',))
+    assert len(index) == 2
+    shutil.rmtree(folder)
@@ -12,7 +12,8 @@ from ladybug.datatype.generic import GenericType
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.fraction import RelativeHumidity, HumidityRatio
 from ladybug.datatype.energy import Energy
-from ladybug.datatype.energyintensity import EnergyIntensity
+from ladybug.datatype.energyintensity import EnergyIntensity, \
+    GlobalHorizontalRadiation
 from ladybug.datatype.power import Power
 from ladybug.datatype.speed import Speed
 from ladybug.datatype.distance import Distance
@@ -21,6 +22,7 @@ from ladybug.epw import EPW
 from ladybug.psychrometrics import humid_ratio_from_db_rh
 
 import pytest
+import math
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -252,6 +254,68 @@ def test_operators_hourly_continuous():
     assert neg[0] == -v1
 
 
+def test_lazy_expression():
+    """Test lazy expressions of collections against the eager operators."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    header = Header(Temperature(), 'C', a_per)
+    dc1 = HourlyContinuousCollection(header, list(range(1, 25)))
+    dc2 = HourlyContinuousCollection(header, [2] * 24)
+    dc3 = HourlyContinuousCollection(header, list(range(24, 0, -1)))
+
+    expr = (dc1.lazy() * 0.6 + dc2.lazy() * 0.4 - dc3) / dc2
+    assert str(expr).endswith('((((v0 * k0) + (v1 * k1)) - v2) / v1)')
+    assert len(expr) == 24
+    result = expr.evaluate()
+    assert isinstance(result, HourlyContinuousCollection)
+    assert result.header == header
+    assert result.values == ((dc1 * 0.6 + dc2 * 0.4 - dc3) / dc2).values
+    assert expr.evaluate() is result
+    assert expr.values == result.values
+
+    assert (10 - dc1.lazy()).values == tuple(10 - v for v in dc1)
+    assert (1 / dc2.lazy()).values == (0.5,) * 24
+    assert (dc3 + -dc1.lazy()).values == (dc3 - dc1).values
+    assert (2 * dc1.lazy() * dc1).values == tuple(2 * v * v for v in dc1)
+
+    dc1.backend = dc2.backend = 'array'
+    result = (dc1.lazy() + dc2).evaluate()
+    assert result.backend == 'array'
+    assert result.values == (dc1 + dc2).values
+    with pytest.raises(ZeroDivisionError):
+        (dc1.lazy() / (dc2 - 2)).evaluate()
+    with pytest.raises(AssertionError):
+        dc1.lazy() + dc1.filter_by_moys([DateTime(6, 21, 12).moy])
+    with pytest.raises(TypeError):
+        dc1.lazy() + 'text'
+
+    dt1, dt2 = DateTime(6, 21, 12), DateTime(6, 21, 13)
+    dc4 = HourlyDiscontinuousCollection(header, [20, 25], [dt1, dt2])
+    result = (dc4.lazy() - dc4.lazy() * 0.5).evaluate()
+    assert isinstance(result, HourlyDiscontinuousCollection)
+    assert result.values == (10, 12.5)
+    assert result.datetimes == (dt1, dt2)
+
+
+def test_lazy_expression_numpy():
+    """Test lazy expressions of collections that use the numpy backend."""
+    pytest.importorskip('numpy')
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    header = Header(Temperature(), 'C', a_per)
+    dc1 = HourlyContinuousCollection(header, list(range(1, 25)))
+    dc2 = HourlyContinuousCollection(header, [2] * 24)
+    dc1.backend = 'numpy'
+    dc1_values = dc1.values
+
+    expected = ((dc1 * 0.6 - dc2) / dc2 - 1).values
+    result = ((dc1.lazy() * 0.6 - dc2) / dc2 - 1).evaluate()
+    assert result.backend == 'numpy'
+    assert result.values == expected
+    assert (-(3 - dc2.lazy())).values == (-1.0,) * 24
+    assert dc1.values == dc1_values  # intermediate results do not overwrite inputs
+    with pytest.raises(ZeroDivisionError):
+        (dc1.lazy() / (dc2.lazy() - 2)).evaluate()
+
+
 def test_setting_values():
     """Test the methods for setting values on the data collection"""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -663,6 +727,79 @@ def test_lowest_values():
     assert test_lowest_values_index == list(xrange(0, 4380))
 
 
+def test_extreme_values_batched():
+    """Test the highest and lowest values for several counts and collections."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    test_data = [i % 100 for i in xrange(8760)]
+    dc1 = HourlyContinuousCollection(header, test_data)
+    dc2 = -dc1
+
+    top_3, top_88 = dc1.highest_values([3, 88])
+    assert top_3 == ([99, 99, 99], [99, 199, 299])
+    assert top_88 == dc1.highest_values(88)
+    assert len(top_88[0]) == 88 and top_88[0][-1] == 98
+    low_3, low_4000 = dc1.lowest_values((3, 4000))
+    assert low_3 == ([0, 0, 0], [0, 100, 200])
+    assert low_4000 == dc1.lowest_values(4000)
+
+    highest = BaseCollection.highest_values_collections([dc1, dc2], 2)
+    assert highest == [([99, 99], [99, 199]), ([0, 0], [0, 100])]
+    lowest = BaseCollection.lowest_values_collections([dc1, dc2], [1])
+    assert lowest == [[([0], [0])], [([-99], [99])]]
+    with pytest.raises(AssertionError):
+        dc1.highest_values([3, 0])
+
+
+def test_ensemble():
+    """Test the ensemble statistics across several aligned collections."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    header = Header(Temperature(), 'C', a_per)
+    colls = [HourlyContinuousCollection(header, [i * j for j in range(24)])
+             for i in range(5)]
+
+    avg, low, high, med, p25 = BaseCollection.ensemble(
+        colls, ['average', 'min', 'max', 'median', 'p25'])
+    assert isinstance(avg, HourlyContinuousCollection)
+    assert avg.is_collection_aligned(colls[0])
+    assert avg.values == tuple(2 * j for j in range(24))
+    assert low.values == (0,) * 24
+    assert high.values == tuple(4 * j for j in range(24))
+    assert med.values == avg.values
+    assert p25.values == tuple(j for j in range(24))
+    assert p25.header.metadata['operation'] == '25 percentile'
+    assert 'operation' not in colls[0].header.metadata
+    total, = BaseCollection.ensemble(colls[1:3], ['total'])
+    assert total.values == tuple(3 * j for j in range(24))
+    float_colls = [HourlyContinuousCollection(
+        header, [math.sin(i * 7 + j) * 100 for j in range(24)]) for i in range(5)]
+    total, p50 = BaseCollection.ensemble(float_colls, ['total', 'p50'])
+    assert total.values == tuple(sum(c[j] for c in float_colls) for j in range(24))
+
+    with pytest.raises(ValueError):
+        BaseCollection.ensemble(colls, ['average', 'mean'])
+    other_header = Header(Temperature(), 'C', AnalysisPeriod(6, 22, 0, 6, 22, 23))
+    with pytest.raises(ValueError):
+        BaseCollection.ensemble(colls + [HourlyContinuousCollection(
+            other_header, list(range(24)))])
+
+
+def test_ensemble_numpy():
+    """Test the ensemble statistics of collections that use the numpy backend."""
+    pytest.importorskip('numpy')
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    header = Header(Temperature(), 'C', a_per)
+    colls = [HourlyContinuousCollection(header, [i * j for j in range(24)])
+             for i in range(5)]
+    stats = ['average', 'min', 'max', 'total', 'p10', 'median', 'p97.5']
+    expected = BaseCollection.ensemble(colls, stats)
+    colls[0].backend = 'numpy'
+    results = BaseCollection.ensemble(colls, stats)
+    for result, exp_coll in zip(results, expected):
+        assert result.backend == 'numpy'
+        assert result.values == pytest.approx(exp_coll.values)
+        assert result.header.metadata == exp_coll.header.metadata
+
+
 def test_percentile():
     """Test the percentile method."""
     header1 = Header(Temperature(), 'C', AnalysisPeriod())
@@ -681,6 +818,22 @@ def test_percentile():
         dc.percentile(110)
 
 
+def test_percentiles():
+    """Test the percentiles method."""
+    header1 = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [(i * 7919) % 8760 for i in xrange(8760)]  # shuffled 0-8759
+    dc = HourlyContinuousCollection(header1, values)
+
+    assert dc.percentiles([0, 25, 50, 75, 100]) == [0, 2189.75, 4379.5, 6569.25, 8759]
+    # tail percentiles are selected without sorting all of the values
+    pcts = [0.1, 0.4, 99.6, 100]
+    assert dc.percentiles(pcts) == [dc._percentile(values, p) for p in pcts]
+    assert dc.percentile(0.4) == pytest.approx(35.036)
+
+    with pytest.raises(AssertionError):
+        dc.percentiles([50, 110])
+
+
 def test_filter_by_conditional_statement():
     """Test filter by conditional statement."""
     a_per = AnalysisPeriod(end_month=1, end_day=2)
@@ -827,6 +980,29 @@ def test_filter_by_analysis_period_continuous_reversed():
     assert isinstance(filt_dc, HourlyContinuousCollection)
 
 
+def test_filter_by_analysis_period_continuous_views():
+    """Test that period filters of numpy collections share the values as views."""
+    numpy = pytest.importorskip('numpy')
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    dc = HourlyContinuousCollection(header, numpy.arange(8760.))
+    filt_dc = dc.filter_by_analysis_period(AnalysisPeriod(st_month=3, end_month=3))
+    assert numpy.shares_memory(filt_dc._values, dc._values)
+    assert filt_dc[0] == DateTime(3, 1, 0).hoy
+    filt_dc[0] = -1
+    assert dc[int(DateTime(3, 1, 0).hoy)] == DateTime(3, 1, 0).hoy
+    dc[int(DateTime(3, 1, 1).hoy)] = -2
+    assert filt_dc[1] == DateTime(3, 1, 1).hoy
+
+    immutable = dc.to_immutable()
+    filt_dc = immutable.filter_by_analysis_period(AnalysisPeriod(st_month=6))
+    assert numpy.shares_memory(filt_dc._values, immutable._values)
+    filt_dc[0] = -1
+    assert immutable[-len(filt_dc)] == DateTime(6, 1, 0).hoy
+
+    filt_dc = dc.filter_by_analysis_period(AnalysisPeriod(st_month=12, end_month=1))
+    assert filt_dc.values == tuple(dc[-744:] + dc[:744])
+
+
 def test_filter_by_analysis_period_continuous_hour_subset():
     """Test filtering hour subset analysis period on hourly continuous collection."""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -1057,6 +1233,50 @@ def test_percentile_monthly_per_hour():
         assert new_dc[i] == val
 
 
+def test_aggregate():
+    """Test the aggregate method with several statistics."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [i % 37 for i in xrange(8760)]
+    dc = HourlyContinuousCollection(header, values)
+    avg, p10, p90, low, high, med, tot = dc.aggregate(
+        'monthlyperhour', ['average', 'p10', 'p90', 'min', 'max', 'median', 'total'])
+    assert isinstance(avg, MonthlyPerHourCollection)
+    assert avg == dc.average_monthly_per_hour()
+    assert p10 == dc.percentile_monthly_per_hour(10)
+    assert p90 == dc.percentile_monthly_per_hour(90)
+    assert med == dc.percentile_monthly_per_hour(50)
+    assert tot == dc.total_monthly_per_hour()
+    assert p10.header.metadata['operation'] == '10 percentile'
+    assert low.header.metadata['operation'] == 'minimum'
+    assert all(lo <= p <= hi for lo, p, hi in zip(low, p10, high))
+
+    avg, p2 = dc.aggregate('daily', ['average', 'p2.5'])
+    assert isinstance(avg, DailyCollection)
+    assert avg == dc.average_daily()
+    assert p2 == dc.percentile_daily(2.5)
+    low, high = dc.aggregate('monthly', ['min', 'max'])
+    assert isinstance(low, MonthlyCollection)
+    assert low.values == (0,) * 12 and high.values == (36,) * 12
+
+    filt_dc = dc.filter_by_conditional_statement('a > 30')
+    avg, = filt_dc.aggregate('monthly')
+    assert avg == filt_dc.average_monthly()
+
+    # sums of floats match the other methods when percentiles are requested
+    dc = HourlyContinuousCollection(header, [(i % 97) * 0.1 for i in xrange(8760)])
+    avg, tot, p90 = dc.aggregate('monthly', ['average', 'total', 'p90'])
+    assert avg == dc.average_monthly()
+    assert tot == dc.total_monthly()
+    assert p90 == dc.percentile_monthly(90)
+
+    with pytest.raises(ValueError):
+        dc.aggregate('monthly', ['mean'])
+    with pytest.raises(ValueError):
+        dc.aggregate('weekly', ['average'])
+    with pytest.raises(AssertionError):
+        dc.aggregate('monthly', ['p110'])
+
+
 def test_group_by_day_discontinuous():
     """Test the group by day method for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -1287,6 +1507,42 @@ def test_duplicate_continuous():
     assert dc1.values == dc2.values
 
 
+def test_duplicate_copy_on_write():
+    """Test that duplicated collections share values and headers until changed."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1),
+                    {'city': 'Chicago', 'zones': ['a']})
+    dc1 = HourlyContinuousCollection(header, list(xrange(24)))
+    dc2 = dc1.duplicate()
+    assert dc2._values is dc1._values
+    assert dc2.header.analysis_period is dc1.header.analysis_period
+    dc2[0] = 100
+    assert dc1[0] == 0 and dc2[0] == 100
+    dc1[1] = 200
+    assert dc1[1] == 200 and dc2[1] == 1
+
+    dc2.header.metadata['zones'].append('b')
+    dc2.header.metadata['city'] = 'Boston'
+    assert dc1.header.metadata == {'city': 'Chicago', 'zones': ['a']}
+    dc3 = dc1.duplicate()
+    dc1.header.metadata['city'] = 'Denver'
+    assert dc3.header.metadata['city'] == 'Chicago'
+    dc3.convert_to_unit('F')
+    assert dc1.header.unit == 'C' and dc1[0] == 0
+
+    immutable = dc1.to_immutable()
+    assert immutable.values == dc1.values
+    assert immutable.duplicate()._values is immutable._values
+    mutable = immutable.to_mutable()
+    mutable[0] = -1
+    assert immutable[0] == 0 and mutable[0] == -1
+
+    dc1.backend = 'array'
+    immutable = dc1.to_immutable()
+    assert immutable._values is dc1._values
+    dc1[0] = 50
+    assert immutable[0] == 0 and dc1[0] == 50
+
+
 def test_dict_methods():
     """Test the to/from dict methods for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1468,6 +1724,13 @@ def test_histogram():
     hist = histogram([0, 0, 0.9, 1, 1.5, 1.99, 2, 3], (0, 1, 2, 3))
     assert hist == [[0, 0, 0.9], [1, 1.5, 1.99], [2]], hist
 
+    # Test counts and indices outputs with non-uniform bins
+    vals = [2, 0.9, 0, 1.99, 3, 1, 0, 1.5]
+    assert histogram(vals, (0, 1, 3), output='counts') == [3, 4]
+    assert histogram(vals, (0, 1, 3), output='indices') == [[2, 6, 1], [5, 7, 3, 0]]
+    with pytest.raises(AssertionError):
+        histogram(vals, (0, 1, 3), output='text')
+
 
 def test_histogram_circular():
     """Test the windrose histogram_circular data."""
@@ -1497,6 +1760,11 @@ def test_histogram_circular():
         for _chkh, _h in zip(chkh, h):
             assert _chkh == pytest.approx(_h, abs=1e-10)
 
+    assert histogram_circular(vals, bin_arr, hist_range=(0, 360), output='counts') \
+        == [3, 5, 3]
+    assert histogram_circular(vals, bin_arr, hist_range=(0, 360), output='indices') \
+        == [[0, 1, 2], [5, 6, 7, 3, 4], [8, 9, 10]]
+
 
 def test_normalize_by_area():
     """Test the normalize_by_area method."""
@@ -1512,3 +1780,279 @@ def test_normalize_by_area():
     assert isinstance(dc2.header.data_type, EnergyIntensity)
     assert dc2.header.unit == 'kWh/m2'
     assert dc2.header.metadata['type'] == 'Energy Intensity'
+
+
+def test_default_backend():
+    """Test the default backend used to store the values of data collections."""
+    assert BaseCollection.get_default_backend() == 'list'
+    with pytest.raises(AssertionError):
+        BaseCollection.set_default_backend('cupy')
+
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    dc = HourlyContinuousCollection(header, list(xrange(8760)))
+    assert dc.backend == 'list'
+    assert isinstance(dc._values, list)
+    with pytest.raises(AssertionError):
+        dc.backend = 'cupy'
+    dc.backend = 'numpy'  # falls back to a list if numpy is not installed
+    assert dc.values == tuple(xrange(8760))
+    assert dc.to_immutable().backend == dc.backend
+
+
+def test_numpy_backend():
+    """Test data collections that store their values in NumPy arrays."""
+    numpy = pytest.importorskip('numpy')
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [float(i % 24) for i in xrange(8760)]
+    dc_list = HourlyContinuousCollection(header, values)
+    dc = HourlyContinuousCollection(header, numpy.array(values))
+    assert dc.backend == 'numpy'
+    assert dc._values.dtype == numpy.float64
+    assert dc.values == dc_list.values
+    assert isinstance(dc.values[0], float) and isinstance(dc[0], float)
+    assert dc[0:3] == [0., 1., 2.]
+
+    assert dc.bounds == dc_list.bounds
+    assert dc.average == pytest.approx(dc_list.average, rel=1e-12)
+    assert dc.total == pytest.approx(dc_list.total, rel=1e-12)
+    assert dc.percentile(25) == pytest.approx(dc_list.percentile(25), rel=1e-12)
+    assert dc.median == pytest.approx(dc_list.median, rel=1e-12)
+
+    for new_dc in (dc + 1, dc - dc_list, dc * 2, dc / dc_list.get_aligned_collection(2),
+                   -dc, dc.to_unit('F'), dc.to_ip(), dc.duplicate(), dc.to_immutable()):
+        assert new_dc.backend == 'numpy'
+    assert (dc + dc_list).values == (dc_list + dc_list).values
+    assert dc.to_unit('F').values == pytest.approx(dc_list.to_unit('F').values)
+    assert dc.average_daily().values == pytest.approx(dc_list.average_daily().values)
+    assert dc.filter_by_analysis_period(AnalysisPeriod(12, 1, 0, 1, 31, 23)).values \
+        == dc_list.filter_by_analysis_period(AnalysisPeriod(12, 1, 0, 1, 31, 23)).values
+    with pytest.raises(ZeroDivisionError):
+        dc / 0
+    assert dc.to_dict() == dc_list.to_dict()
+    view = dc.values_view
+    dc[1] = 10
+    assert view[1] == 10  # the view does not copy the values
+
+    dc.backend = 'list'
+    assert isinstance(dc._values, list)
+    immutable_dc = dc_list.to_immutable()
+    immutable_dc.backend = 'numpy'
+    with pytest.raises(ValueError):
+        immutable_dc._values[0] = 1
+
+    BaseCollection.set_default_backend('numpy')
+    try:
+        assert HourlyContinuousCollection(header, values).backend == 'numpy'
+    finally:
+        BaseCollection.set_default_backend('list')
+
+
+def test_array_backend():
+    """Test data collections that store their values in an array.array."""
+    from array import array
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [float(i % 24) for i in xrange(8760)]
+    dc_list = HourlyContinuousCollection(header, values)
+    dc = HourlyContinuousCollection(header, values)
+    dc.backend = 'array'
+    assert dc.backend == 'array'
+    assert isinstance(dc._values, array) and dc._values.typecode == 'd'
+    assert dc.values == dc_list.values
+    assert dc[0:3] == [0., 1., 2.]
+    assert dc.average == dc_list.average
+    assert dc.percentile(25) == dc_list.percentile(25)
+
+    for new_dc in (dc + 1, dc - dc_list, dc * 2, -dc, dc.to_unit('F'), dc.to_ip(),
+                   dc.duplicate(), dc.to_immutable(),
+                   HourlyContinuousCollection(header, array('d', values))):
+        assert new_dc.backend == 'array'
+    assert dc.to_unit('F').values == dc_list.to_unit('F').values
+    assert dc.filter_by_analysis_period(AnalysisPeriod(12, 1, 0, 1, 31, 23)).values \
+        == dc_list.filter_by_analysis_period(AnalysisPeriod(12, 1, 0, 1, 31, 23)).values
+    assert dc.to_dict() == dc_list.to_dict()
+    assert dc.group_by_month()[1] == dc_list.group_by_month()[1]
+    assert dc.to_immutable().values == dc_list.values
+    dc[0] = 5
+    assert dc[0] == 5
+
+    # non-numeric values are always stored in a list
+    text_dc = HourlyContinuousCollection(
+        Header(GenericType('Text', 'text'), 'text', AnalysisPeriod()), ['a'] * 8760)
+    text_dc.backend = 'array'
+    assert text_dc.backend == 'list'
+
+
+def test_values_view():
+    """Test the values_view property of data collections."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [float(i % 24) for i in xrange(8760)]
+    dc = HourlyContinuousCollection(header, values)
+    view = dc.values_view
+    assert len(view) == 8760
+    assert tuple(view) == dc.values
+    if sys.version_info >= (3, 8):
+        assert view.readonly
+        with pytest.raises(TypeError):
+            view[0] = 10
+
+    dc.backend = 'array'
+    view = dc.values_view
+    dc[1] = 10
+    if hasattr(memoryview, 'cast'):  # python 2 views are tuples of the values
+        assert view[1] == 10  # the view does not copy the values
+
+
+def test_filter_by_compiled_statement():
+    """Test that statements are evaluated like Python expressions of the values."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dc1 = HourlyContinuousCollection(header, [v - 12 for v in xrange(24)])
+    dc2 = HourlyContinuousCollection(header, list(xrange(24)))
+
+    assert dc1.filter_by_conditional_statement('a ** 2 > 100').values == \
+        (-12, -11, 11)
+    assert dc1.filter_by_conditional_statement('-3 < a <= 1 or a == 10').values == \
+        (-2, -1, 0, 1, 10)
+    assert dc1.filter_by_conditional_statement('not a % 5').values == (-10, -5, 0, 5, 10)
+    pattern = HourlyContinuousCollection.pattern_from_collections_and_statement(
+        [dc1, dc2], 'A < 0 AND b % 2 == 0')
+    assert pattern == [True, False] * 6 + [False] * 12
+    with pytest.raises(ValueError):
+        dc1.filter_by_conditional_statement('abs(a) > 2')
+
+
+def test_filter_by_statement_numpy():
+    """Test that statements are evaluated over arrays for the numpy backend."""
+    numpy = pytest.importorskip('numpy')
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    dc1 = HourlyContinuousCollection(header, [(v % 50) - 10 for v in xrange(8760)])
+    dc2 = HourlyContinuousCollection(header, [v % 100 for v in xrange(8760)])
+    statements = ('a > 25 and b < 60', '-3 < a <= 1 or not b % 7', 'a ** 2 > b',
+                  'a == 0 or a in (1, 2)', 'b / (a + 11) > 3', '1 > 0')
+    for statement in statements:
+        pattern = HourlyContinuousCollection.pattern_from_collections_and_statement(
+            [dc1, dc2], statement)
+        dc1.backend, dc2.backend = 'numpy', 'numpy'
+        np_pattern = HourlyContinuousCollection.pattern_from_collections_and_statement(
+            [dc1, dc2], statement)
+        dc1.backend, dc2.backend = 'list', 'list'
+        assert np_pattern == [bool(v) for v in pattern]
+
+    dc1.backend = 'numpy'
+    assert isinstance(dc1._evaluate_statement([dc1], 'a > 25'), numpy.ndarray)
+    with pytest.raises(ZeroDivisionError):
+        dc1.filter_by_conditional_statement('1 / (a + 10) > 3')
+    filt_dc = dc1.filter_by_conditional_statement('a > 25')
+    assert filt_dc.backend == 'numpy'
+    assert len(filt_dc) == len(filt_dc.datetimes) == 2450
+    assert filt_dc.values == dc1.to_mutable().duplicate().filter_by_pattern(
+        [v > 25 for v in dc1.values]).values
+
+
+def test_filter_by_moys_discontinuous():
+    """Test filter_by_moys on a discontinuous collection with its moy index."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    dc = HourlyContinuousCollection(header, list(xrange(8760)))
+    dc = dc.filter_by_conditional_statement('a % 2 == 0')  # every other hour
+    filt_dc = dc.filter_by_moys((600, 300, 120, 60, 120))
+    assert filt_dc.values == (2, 10)  # order of the collection without duplicates
+    assert filt_dc.datetimes == (DateTime(1, 1, 2), DateTime(1, 1, 10))
+    assert dc._moy_index is not None
+    assert dc.filter_by_hoys([2.0, 3, 4]).values == (2, 4)
+    assert len(dc.filter_by_analysis_period(AnalysisPeriod(1, 1, 0, 1, 2, 23))) == 24
+
+    # check that the index is reset when the datetimes change
+    dc.convert_to_culled_timestep(1)
+    assert dc._moy_index is None
+    assert dc.filter_by_moys([120]).values == (2,)
+
+    # check that the slow method is used for collections with duplicate datetimes
+    dup_dc = HourlyDiscontinuousCollection(
+        header, [1, 2, 3], [DateTime(1, 1, 1), DateTime(1, 1, 2), DateTime(1, 1, 1)])
+    assert dup_dc.filter_by_moys([60]).values == (1, 3)
+
+
+def test_discontinuous_moys():
+    """Test that derived discontinuous collections use moys instead of datetimes."""
+    a_per = AnalysisPeriod(is_leap_year=True)
+    header = Header(Temperature(), 'C', a_per)
+    dc = HourlyContinuousCollection(header, list(xrange(8784)))
+    filt_dc = dc.filter_by_conditional_statement('a % 24 == 12')  # noon of each day
+    assert filt_dc._datetimes is None
+    assert filt_dc._get_leap_year()
+    half_dc = filt_dc.filter_by_analysis_period(
+        AnalysisPeriod(1, 1, 0, 6, 30, 23, is_leap_year=True))
+    assert half_dc._datetimes is None
+    assert half_dc.group_by_day()[60] == [1428]  # February 29th
+    assert len(filt_dc.group_by_month()[2]) == 29
+    assert filt_dc.group_by_month_per_hour()[(3, 12, 0)][0] == 1452
+
+    # check that the datetimes are only built when requested
+    dup_dc = filt_dc.duplicate()
+    assert dup_dc._datetimes is None
+    assert dup_dc.is_collection_aligned(filt_dc)
+    assert not dup_dc.is_collection_aligned(filt_dc.filter_by_pattern([True, False]))
+    assert filt_dc.datetimes[59] == DateTime(2, 29, 12, leap_year=True)
+    assert filt_dc.datetimes[60] == DateTime(3, 1, 12, leap_year=True)
+    assert filt_dc.is_collection_aligned(dup_dc)
+
+    # check the serialization of the moys
+    dc_dict = dup_dc.to_dict()
+    assert dc_dict['datetimes'][59] == (2, 29, 12, 0, 1)
+    new_dc = HourlyDiscontinuousCollection.from_dict(dc_dict)
+    assert new_dc._get_moys() == dup_dc._get_moys()
+    assert new_dc.datetimes == filt_dc.datetimes
+    dc_dict['datetimes'][0] = (2, 30, 12, 0)
+    with pytest.raises(ValueError):
+        HourlyDiscontinuousCollection.from_dict(dc_dict)
+
+    # check that collections built from datetimes get the same moys
+    dt_dc = HourlyDiscontinuousCollection(
+        header, [1, 2], [DateTime(1, 1, 12), DateTime(3, 1, 12, leap_year=True)])
+    assert list(dt_dc._get_moys()) == [720, 87120]
+    assert dt_dc.cull_to_timestep(1).values == (1, 2)
+
+
+def test_rolling_statistics():
+    """Test the rolling window methods of continuous collections."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(timestep=2))
+    values = [float(i % 48) for i in xrange(8760 * 2)]  # daily ramp from 0 to 47
+    dc = HourlyContinuousCollection(header, values)
+
+    # windows of 2 hours include 4 values and wrap around the year
+    assert dc.rolling_sum(2)[:5] == [45 + 46 + 47, 46 + 47 + 1, 47 + 1 + 2, 6, 10]
+    assert dc.rolling_mean(2)[4] == 2.5
+    assert dc.rolling_min(2)[:5] == [0, 0, 0, 0, 1]
+    assert dc.rolling_max(2)[:5] == [47, 47, 47, 3, 4]
+    assert isinstance(dc.rolling_mean(2), HourlyContinuousCollection)
+    assert dc.rolling_mean(0.5) == dc
+
+    # partial windows at the start of collections that are not annual
+    header = Header(Temperature(), 'C', AnalysisPeriod(1, 1, 0, 1, 1, 23))
+    dc = HourlyContinuousCollection(header, list(xrange(24)))
+    assert dc.rolling_mean(3)[:4] == [0, 0.5, 1, 2]
+    assert dc.rolling_sum(48).values[-1] == sum(xrange(24))
+    assert dc.rolling_max(3)[:2] == [0, 1]
+
+    ema = dc.exponential_moving_average(0.5)
+    assert ema[:3] == [0, 0.5, 1.25]
+    assert dc.exponential_moving_average(1) == dc
+    with pytest.raises(AssertionError):
+        dc.exponential_moving_average(0)
+    with pytest.raises(AssertionError):
+        dc.rolling_mean(0)
+
+
+def test_rolling_sum_no_drift():
+    """Test that rolling sums of float values do not drift from the window sums."""
+    header = Header(GlobalHorizontalRadiation(), 'Wh/m2', AnalysisPeriod())
+    values = [0.0 if i % 24 < 6 or i % 24 > 18 else (i % 997) * 1.1 + 0.1
+              for i in xrange(8760)]
+    dc = HourlyContinuousCollection(header, values)
+    for window in (1, 3, 7):
+        sums = dc.rolling_sum(window).values
+        wrapped = values[-window + 1:] + values if window > 1 else values
+        for i, total in enumerate(sums):
+            assert total == math.fsum(wrapped[i:i + window])
+        assert min(sums) == 0
+    assert dc.rolling_sum(3).is_in_data_type_range()
+    assert dc.rolling_mean(3).is_in_data_type_range()
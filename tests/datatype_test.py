@@ -576,3 +576,34 @@ def test_specific_energy():
     assert tc_type.to_unit([1], 'kWh/kg', 'Wh/kg')[0] == pytest.approx(0.001, rel=1e-3)
     assert tc_type.to_unit([1], 'kWh/kg', 'J/kg')[0] == pytest.approx(2.7777777777777776e-07, rel=1e-9)
     assert tc_type.to_unit([1], 'kWh/kg', 'kJ/kg')[0] == pytest.approx(0.0002777777777777778, rel=1e-7)
+
+
+def test_unit_conversion_cache():
+    """Test that unit conversions are recorded as cached arithmetic steps."""
+    temp_type = temperature.DryBulbTemperature()
+    steps, functs = temp_type._unit_conversion('C', 'F', 'K')
+    assert steps == (('-', 273.15), ('*', 9.), ('/', 5.), ('+', 32.))
+    assert functs is None
+    assert temp_type._unit_conversion('C', 'F', 'K') is \
+        temperature.DryBulbTemperature()._unit_conversion('C', 'F', 'K')
+    vals = [-40, 0, 100, 21.3]
+    converted = temp_type.to_unit(vals, 'F', 'K')
+    assert converted == [temp_type._C_to_F(temp_type._K_to_C(v)) for v in vals]
+    assert temp_type.to_unit(vals, 'C', 'C') is vals
+    assert temp_type.is_in_range([-459], 'F')
+    assert not temp_type.is_in_range([-460], 'F', raise_exception=False)
+    with pytest.raises(ValueError):
+        temp_type.to_unit(vals, 'C', 'ft')
+
+    # round trips give the same values as the conversion methods
+    pres_type = pressure.AtmosphericStationPressure()
+    vals = [99500, 99600, 101325]
+    ip_vals = pres_type.to_unit(vals, 'inHg', 'Pa')
+    assert ip_vals == [pres_type._Pa_to_inHg(v) for v in vals]
+    assert pres_type.to_unit(ip_vals, 'Pa', 'inHg') == \
+        [pres_type._inHg_to_Pa(pres_type._Pa_to_inHg(v)) for v in vals]
+
+    term = base._ConversionTerm(())
+    assert (10 - term * 2).steps == (('*', 2), ('r-', 10))
+    with pytest.raises(TypeError):
+        term * term
@@ -186,3 +186,11 @@ def test_design_day_hourly_data():
 
     # sky cover values
     hi_data_collect = des_day.hourly_horizontal_infrared
+
+
+def test_ddy_from_zip():
+    """Test the import of a DDY from inside a zip file."""
+    ddy = DDY.from_zip('./tests/fixtures/zip/test.zip')
+    assert ddy.location.city == 'SYDNEY_AUS Design_Conditions'
+    assert len(ddy.design_days) > 0
+    assert ddy.file_path == os.path.normpath('./tests/fixtures/zip/test.zip')
@@ -1,6 +1,8 @@
 # coding=utf-8
-from ladybug.dt import DateTime, Date, Time
+from ladybug.dt import DateTime, Date, Time, moys_to_month_day_hour, \
+    moys_to_doys, hoys_to_doys, doys_to_months
 import pickle
+import pytest
 
 
 def test_date_time_init():
@@ -73,6 +75,29 @@ def test_date_time_from_moy():
     assert dt1 == DateTime(6, 21, 12)
     dt2 = DateTime.from_moy(246960, leap_year=True)
     assert dt2 == DateTime(6, 20, 12, leap_year=True)
+    assert DateTime.from_moy(-30) == DateTime(1, 1, 23, 30)
+    with pytest.raises(ValueError):
+        DateTime.from_moy(525600)
+    assert DateTime.from_moy(527039, leap_year=True) == \
+        DateTime(12, 31, 23, 59, leap_year=True)
+
+
+def test_calendar_arrays():
+    """Test the functions that convert arrays of moys, hoys and doys."""
+    moys = [0, 84960, 86399, 525599]
+    months, days, hours = moys_to_month_day_hour(moys)
+    assert months == [1, 3, 3, 12]
+    assert days == [1, 1, 1, 31]
+    assert hours == [0, 0, 23, 23]
+    months, days, hours = moys_to_month_day_hour(moys[:-1], leap_year=True)
+    assert months == [1, 2, 2]
+    assert days == [1, 29, 29]
+    assert moys_to_doys(moys) == [1, 60, 60, 365]
+    assert hoys_to_doys([0, 23.5, 24, 8759]) == [1, 1, 2, 365]
+    assert doys_to_months([1, 59, 60, 365]) == [1, 2, 3, 12]
+    assert doys_to_months([60, 366], leap_year=True) == [2, 12]
+    assert DateTime(3, 1, 0, leap_year=True).doy == 61
+    assert Date(12, 31).doy == 365
 
 
 def test_date_time_add_sub():
@@ -1,11 +1,19 @@
 # coding=utf-8
-from ladybug.epw import EPW
+from ladybug.epw import EPW, load_epws
+from ladybug._datacollectionbase import BaseCollection
 from ladybug.datacollection import HourlyContinuousCollection, MonthlyCollection
 from ladybug.designday import DesignDay
 from ladybug.analysisperiod import AnalysisPeriod
 
 import os
+import sys
+import shutil
+import zipfile
 import pytest
+try:
+    from StringIO import StringIO  # python 2
+except ImportError:
+    from io import StringIO  # python 3
 
 
 def test_import_epw():
@@ -112,6 +120,26 @@ def test_import_data():
     assert isinstance(epw.sky_temperature, HourlyContinuousCollection)
 
 
+def test_import_selected_fields():
+    """Test the import of only certain fields from the EPW."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    epw_all = EPW(relative_path)
+    epw = EPW(relative_path, fields=[8, 6])
+    assert epw.dry_bulb_temperature == epw_all.dry_bulb_temperature
+    assert epw.relative_humidity == epw_all.relative_humidity
+    assert epw._data[7] is None
+
+    # fields that were not requested are imported upon request
+    assert epw.to_dict() == epw_all.to_dict()
+    epw = EPW(relative_path, fields=[6])
+    epw.convert_to_ip()
+    assert epw.dew_point_temperature.header.unit == 'F'
+    assert epw.dew_point_temperature == epw_all.dew_point_temperature.to_ip()
+
+    with pytest.raises(AssertionError):
+        EPW(relative_path, fields=[35])
+
+
 def test_convert_to_ip():
     """Test the method that converts the data to IP units."""
     relative_path = './tests/fixtures/epw/chicago.epw'
@@ -336,6 +364,201 @@ def test_save_converted_epw():
     os.remove(modified_path)
 
 
+def test_to_from_binary():
+    """Test writing the EPW to a binary file and loading it back."""
+    relative_path = './tests/fixtures/epw/tokyo.epw'
+    epw = EPW(relative_path)
+    bin_path = './tests/fixtures/epw/tokyo.lbepw'
+    epw.to_binary(bin_path)
+    assert os.path.isfile(bin_path)
+
+    new_epw = EPW.from_binary(bin_path)
+    assert new_epw.file_path == os.path.abspath(relative_path)
+    assert new_epw.is_data_loaded
+    assert new_epw.to_dict() == epw.to_dict()
+    assert new_epw.monthly_ground_temperature.keys() == \
+        epw.monthly_ground_temperature.keys()
+
+    epw.convert_to_ip()
+    epw.to_binary(bin_path)
+    new_epw = EPW.from_binary(bin_path)
+    assert new_epw.is_ip
+    assert new_epw.dry_bulb_temperature.header.unit == 'F'
+    assert new_epw.to_dict() == epw.to_dict()
+    os.remove(bin_path)
+
+
+def test_cache_folder():
+    """Test loading an EPW through a cache folder of binary files."""
+    relative_path = './tests/fixtures/epw/tokyo.epw'
+    cache_folder = './tests/fixtures/epw/cache'
+    epw_text = EPW(relative_path)
+    epw = EPW(relative_path, cache_folder=cache_folder)
+    assert epw.location.city == epw_text.location.city
+    assert not epw.is_data_loaded
+    assert len(os.listdir(cache_folder)) == 1
+    assert epw.to_dict() == epw_text.to_dict()
+
+    # load the EPW again from the cache
+    epw = EPW(relative_path, fields=[6], cache_folder=cache_folder)
+    assert epw.dry_bulb_temperature == epw_text.dry_bulb_temperature
+    assert epw._data[8] is None
+    assert epw.relative_humidity == epw_text.relative_humidity
+
+    # check that an out-of-date cache is rewritten
+    cache_file = os.path.join(cache_folder, os.listdir(cache_folder)[0])
+    with open(cache_file, 'r+b') as binf:
+        binf.write(b'XXXX')
+    epw = EPW(relative_path, cache_folder=cache_folder)
+    assert epw.to_dict() == epw_text.to_dict()
+    assert EPW.from_binary(cache_file).to_dict() == epw_text.to_dict()
+
+    os.remove(cache_file)
+    os.rmdir(cache_folder)
+
+
+def test_memory_map():
+    """Test loading a memory-mapped EPW from a cache folder or binary file."""
+    relative_path = './tests/fixtures/epw/tokyo.epw'
+    cache_folder = './tests/fixtures/epw/cache_mmap'
+    epw_text = EPW(relative_path)
+    with pytest.raises(AssertionError):
+        EPW(relative_path, memory_map=True)
+
+    EPW(relative_path, cache_folder=cache_folder).location  # write the cache
+    epw = EPW(relative_path, cache_folder=cache_folder, memory_map=True)
+    view = epw.field_view(6)
+    if sys.version_info >= (3, 8):
+        assert view.readonly
+    assert len(view) == 8760
+    assert tuple(view) == epw_text.dry_bulb_temperature.values
+    assert epw._data[6] is None
+    assert epw.dry_bulb_temperature == epw_text.dry_bulb_temperature
+    assert epw._data[8] is None
+    assert tuple(epw.field_view(8)) == epw_text.relative_humidity.values
+    assert tuple(epw_text.field_view(8)) == epw_text.relative_humidity.values
+    with pytest.raises(AssertionError):
+        epw.field_view(5)
+    with pytest.raises(AssertionError):
+        epw_text.field_view(5)
+
+    # views are in the SI units of the file after converting to IP
+    db_values = epw_text.dry_bulb_temperature.values
+    epw.convert_to_ip()
+    epw_text.convert_to_ip()
+    assert tuple(epw.field_view(6)) == db_values
+    assert tuple(epw_text.field_view(6)) == pytest.approx(db_values)
+    assert tuple(epw_text.field_view(9)) == tuple(epw.field_view(9))
+    assert tuple(epw_text.field_view(0)) == tuple(epw.field_view(0))
+    epw_text = EPW(relative_path)
+
+    cache_file = os.path.join(cache_folder, os.listdir(cache_folder)[0])
+    epw = EPW.from_binary(cache_file, memory_map=True)
+    assert all(dat is None for dat in epw._data)
+    assert epw.to_dict() == epw_text.to_dict()
+
+    del epw, view
+    os.remove(cache_file)
+    os.rmdir(cache_folder)
+
+
+def test_load_epws():
+    """Test loading several EPW files at once."""
+    folder = './tests/fixtures/epw'
+    epws = dict(load_epws(folder, processes=2))
+    assert len(epws) == 2
+    chicago = epws[os.path.normpath('./tests/fixtures/epw/chicago.epw')]
+    assert chicago.is_data_loaded
+    assert chicago.to_dict() == EPW('./tests/fixtures/epw/chicago.epw').to_dict()
+
+    headers = list(load_epws('./tests/fixtures/epw/*.epw', 'header', processes=1))
+    assert len(headers) == 2
+    assert all(not epw.is_data_loaded for _, epw in headers)
+    assert len(list(load_epws(u'./tests/fixtures/epw', 'header', processes=1))) == 2
+
+    files = ['./tests/fixtures/epw/tokyo.epw', './tests/fixtures/epw/missing.epw']
+    summaries = dict(load_epws(files, 'summary', fields=[6], chunk_size=2))
+    tokyo = summaries[os.path.normpath(files[0])]
+    assert tokyo['location']['city'] == 'Tokyo'
+    assert list(tokyo['fields'].keys()) == [6]
+    assert tokyo['fields'][6]['max'] == pytest.approx(35.2, rel=1e-3)
+    assert isinstance(summaries[os.path.normpath(files[1])], AssertionError)
+
+    # .epw files inside .zip files are loaded without extracting them
+    zip_folder = os.path.normpath('./tests/fixtures/epw/zip_epws')
+    os.makedirs(zip_folder)
+    try:
+        zip_path = os.path.join(zip_folder, 'weather.zip')
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.write('./tests/fixtures/epw/tokyo.epw', 'japan/tokyo.epw')
+            zf.write('./tests/fixtures/epw/chicago.epw', 'chicago.epw')
+            zf.writestr('readme.txt', 'weather files')
+        broken_path = os.path.join(zip_folder, 'broken.zip')
+        with open(broken_path, 'w') as f:
+            f.write('not a zip file')
+        loaded = dict(load_epws(zip_folder, 'header', processes=2))
+        tokyo_path = os.path.join(zip_path, 'japan/tokyo.epw')
+        assert sorted(loaded.keys()) == sorted(
+            [broken_path, tokyo_path, os.path.join(zip_path, 'chicago.epw')])
+        assert loaded[tokyo_path].location.city == 'Tokyo'
+        assert isinstance(loaded[broken_path], Exception)
+    finally:
+        shutil.rmtree(zip_folder)
+
+    # results that cannot be sent back from the processes are yielded as errors
+    loaded = list(load_epws(folder, _unpicklable_result, processes=2))
+    assert len(loaded) == 2
+    assert all(isinstance(res, Exception) for _, res in loaded)
+
+
+def _unpicklable_result(epw):
+    """Get a result for load_epws that cannot be pickled."""
+    return lambda: epw
+
+
+def test_write_epw():
+    """Test writing the EPW to a file object without changing its data."""
+    relative_path = './tests/fixtures/epw/tokyo.epw'
+    epw = EPW(relative_path)
+    epw.convert_to_ip()
+    epw_dict = epw.to_dict()
+
+    epw_str = StringIO()
+    epw.write(epw_str, chunk_size=1000)
+    assert epw.to_dict() == epw_dict
+    lines = epw_str.getvalue().splitlines()
+    assert len(lines) == 8 + 8760
+    assert float(lines[8].split(',')[6]) == pytest.approx(3.8, rel=1e-5)
+    assert float(lines[-1].split(',')[6]) == pytest.approx(
+        EPW(relative_path).dry_bulb_temperature[0], rel=1e-5)
+
+    epw._data[6]._values = epw._data[6]._values[:-1]
+    with pytest.raises(ValueError):
+        epw.save('./tests/fixtures/epw/tokyo_short.epw')
+    assert not os.path.isfile('./tests/fixtures/epw/tokyo_short.epw')
+
+
+def test_write_epw_backends():
+    """Test that the EPW text is the same for all data collection backends."""
+    relative_path = './tests/fixtures/epw/chicago.epw'
+    list_str = StringIO()
+    EPW(relative_path).write(list_str)
+    rows = list_str.getvalue().splitlines()[8:]
+    assert rows[0].startswith('1986,1,1,1,0,')
+    assert ',73,99500,' in rows[0]
+
+    default_backend = BaseCollection.get_default_backend()
+    try:
+        for backend in ('array', 'numpy'):
+            BaseCollection.set_default_backend(backend)
+            epw_str = StringIO()
+            EPW(relative_path).write(epw_str)
+            assert epw_str.getvalue().splitlines()[8] == rows[0]
+            assert epw_str.getvalue() == list_str.getvalue()
+    finally:
+        BaseCollection.set_default_backend(default_backend)
+
+
 def test_save_ddy():
     """Test save wea_rel."""
     path = './tests/fixtures/epw/chicago.epw'
@@ -372,3 +595,19 @@ def test_save_wea():
         assert float(line[17].split(' ')[-1]) == epw.diffuse_horizontal_radiation[11]
 
     os.remove(wea_path)
+
+
+def test_epw_from_zip():
+    """Test the import of an EPW from inside a zip file."""
+    zip_path = './tests/fixtures/zip/test.zip'
+    epw = EPW.from_zip(zip_path)
+    assert epw.location.city == 'SYDNEY'
+    assert len(epw.dry_bulb_temperature) == 8760
+    assert epw.file_path == os.path.normpath(zip_path)
+
+    epw = EPW.from_zip(zip_path, 'AUS_NSW.Sydney.947670_IWEC.epw', fields=[6])
+    assert len(epw.dry_bulb_temperature) == 8760
+    assert len(epw.relative_humidity) == 8760  # missing field read from the zip
+
+    with pytest.raises(ValueError):
+        EPW.from_zip(zip_path, 'missing.epw')
@@ -35,3 +35,18 @@ def test_csv_to_matrix():
 
     with pytest.raises(Exception):
         epw_mtx = futil.csv_to_num_matrix(path)
+
+
+def test_zip_file_members():
+    """Test the reading of the files inside a zip file without extracting them."""
+    wf_path = "./tests/fixtures/zip/test.zip"
+    assert len(futil.zip_file_members(wf_path)) == 4
+    assert futil.zip_file_members(wf_path, '.EPW') == \
+        ['AUS_NSW.Sydney.947670_IWEC.epw']
+
+    zip_file = futil.open_zip_member(wf_path, 'AUS_NSW.Sydney.947670_IWEC.epw')
+    try:
+        assert zip_file.readline().startswith('LOCATION,SYDNEY')
+        assert len(zip_file.readlines()) == 8767
+    finally:
+        zip_file.close()
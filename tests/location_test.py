@@ -1,5 +1,7 @@
 # coding=utf-8
-from ladybug.location import Location
+from ladybug.location import Location, LocationIndex
+
+import pytest
 
 
 def test_init():
@@ -141,3 +143,36 @@ def test_duplicate():
     assert loc.longitude == loc_dup.longitude == longitude
     assert loc.time_zone == loc_dup.time_zone == time_zone
     assert loc.elevation == loc_dup.elevation == elevation
+
+
+def test_location_index():
+    """Test the LocationIndex nearest and within_radius queries."""
+    locations = [
+        Location('Chicago', latitude=41.98, longitude=-87.92),
+        Location('New York', latitude=40.78, longitude=-73.97),
+        Location('Los Angeles', latitude=33.94, longitude=-118.41),
+        Location('Tokyo', latitude=35.69, longitude=139.77),
+        Location('Suva', latitude=-18.14, longitude=178.44),
+        Location('Apia', latitude=-13.83, longitude=-171.76)
+    ]
+    index = LocationIndex(locations)
+    str(index)  # test the string representation
+    assert len(index) == 6
+
+    nearest = index.nearest(41.5, -81.7, 2)  # Cleveland
+    assert [loc.city for loc, _ in nearest] == ['Chicago', 'New York']
+    assert nearest[0][1] == pytest.approx(518, abs=5)
+
+    # check that distances are computed across the antimeridian
+    nearest = index.nearest(-16, 179.9)
+    assert nearest[0][0].city == 'Suva'
+    assert [loc.city for loc, _ in index.within_radius(-16, 179.9, 1300)] == \
+        ['Suva', 'Apia']
+    assert len(index.within_radius(0, 0, 100)) == 0
+    assert len(index.within_radius(0, 0, 30000)) == 6
+
+    files = ['{}.epw'.format(loc.city) for loc in locations]
+    index = LocationIndex(locations, files)
+    assert index.nearest(35, 139)[0][0] == 'Tokyo.epw'
+    with pytest.raises(AssertionError):
+        LocationIndex(locations, files[:2])
@@ -151,3 +151,12 @@ def test_dict_methods():
     stat_dict = stat_obj.to_dict()
     rebuilt_stat = STAT.from_dict(stat_dict)
     assert stat_dict == rebuilt_stat.to_dict()
+
+
+def test_stat_from_zip():
+    """Test the import of a STAT from inside a zip file."""
+    stat = STAT.from_zip('./tests/fixtures/zip/test.zip')
+    assert stat.location.city == 'SYDNEY'
+    assert stat.ashrae_climate_zone == '3A'
+    assert len(stat.monthly_tau_beam) == 12
+    assert len(stat.annual_heating_design_day_996.hourly_dry_bulb) == 24